@@ -0,0 +1,85 @@
+"""Модуль интерфейса широкой фазы обнаружения столкновений"""
+
+import pygame
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    List,
+    Any,
+    Iterator,
+    Tuple,
+)
+
+from collider.collideable import Collideable
+
+
+class AbstractBroadphase(ABC):
+    """
+    Абстрактный класс (интерфейс) широкой фазы столкновений.
+
+    Широкая фаза раскладывает объекты по секциям пространства и отдает
+    секции, в которых объекты, вероятно, столкнуться. Каждая такая секция
+    предоставляет метод get_data() со списком своих объектов.
+    """
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def add(self, added_object: Collideable) -> None:
+        pass
+
+    @abstractmethod
+    def update(self, updated_object: Collideable) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, removed_object: Collideable) -> None:
+        pass
+
+    @abstractmethod
+    def get_objects(self) -> List[Collideable]:
+        pass
+
+    @abstractmethod
+    def get_collision_nodes(self) -> List[Any]:
+        pass
+
+    @abstractmethod
+    def query(self, rect: pygame.Rect) -> List[Collideable]:
+        pass
+
+    @abstractmethod
+    def draw(self, screen: pygame.Surface,
+             offset: Tuple[int, int] = (0, 0)) -> None:
+        pass
+
+    def iter_candidate_pairs(self) \
+            -> Iterator[Tuple[Collideable, Collideable]]:
+        """
+        Перебор пар объектов, которые, вероятно, столкнуться.
+
+        Объект на границе нескольких секций попадает в каждую из них, поэтому
+        одна и та же пара может встретиться в разных секциях. Каждая
+        неупорядоченная пара отдается только один раз за проход.
+
+        :return: Генератор пар объектов.
+        """
+
+        seen_pairs = set()
+        for node in self.get_collision_nodes():
+            node_objects = node.get_data()
+            for i in range(len(node_objects) - 1):
+                obj_1 = node_objects[i]
+                id_1 = id(obj_1)
+                for k in range(i + 1, len(node_objects)):
+                    obj_2 = node_objects[k]
+                    id_2 = id(obj_2)
+                    pair_key = (id_1, id_2) if id_1 < id_2 else (id_2, id_1)
+                    if pair_key in seen_pairs:
+                        continue
+                    seen_pairs.add(pair_key)
+                    yield obj_1, obj_2
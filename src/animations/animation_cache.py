@@ -0,0 +1,142 @@
+"""Модуль кеша кадров анимаций"""
+
+import pygame
+from collections import OrderedDict
+from typing import (
+    List,
+    Sequence,
+    Tuple,
+)
+
+import settings
+from utils.singleton import Singleton
+
+
+class AnimationCache(metaclass=Singleton):
+    """
+    Кеш кадров анимаций.
+
+    Хранит кадры анимации, масштабированные до нужного размера. Все кадры
+    одного размера масштабируются один раз и общие для всех экземпляров
+    анимации. Когда кеш заполнен, из него удаляются кадры размера, который
+    дольше всех не запрашивался.
+
+    Кадры можно собрать в одну ленту: тогда кадры - это подповерхности ленты,
+    и все кадры одного размера лежат в одном изображении.
+
+    Кадры из кеша общие, поэтому изменять их нельзя.
+    """
+
+    def __init__(
+            self,
+            max_size: int = settings.ANIMATION_CACHE_SIZE,
+            use_strip: bool = settings.ANIMATION_CACHE_STRIP,
+    ) -> None:
+        """
+        Инициализатор класса.
+
+        :param max_size: Максимальное количество размеров анимаций в кеше.
+        :param use_strip: Собирать кадры одного размера в одну ленту.
+        """
+
+        assert max_size > 0
+
+        self.__max_size = max_size
+        self.__use_strip = use_strip
+        # Ключи словаря - id первого исходного кадра и размер, значения -
+        # исходные кадры и масштабированные кадры. Ссылка на исходные кадры
+        # не дает освободить их и тем самым переиспользовать id в ключе.
+        self.__entries: 'OrderedDict[Tuple[int, int], ' \
+                        'Tuple[Sequence[pygame.Surface], ' \
+                        'List[pygame.Surface]]]' = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_frames(self, frames: Sequence[pygame.Surface],
+                   size: float) -> List[pygame.Surface]:
+        """
+        Получение кадров анимации нужного размера.
+
+        Черный цвет кадров становится прозрачным.
+
+        :param frames: Исходные кадры анимации.
+        :param size: Ширина и высота кадра в px.
+        :return: Список масштабированных кадров.
+        """
+
+        size = int(size)
+        key = (id(frames[0]), size)
+
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+        self.__misses += 1
+        if self.__use_strip:
+            scaled_frames = self._build_strip(frames, size)
+        else:
+            scaled_frames = []
+            for frame in frames:
+                scaled_frame = pygame.transform.scale(frame, (size, size))
+                scaled_frame.set_colorkey(settings.Collors.BLACK.value)
+                scaled_frames.append(scaled_frame)
+
+        self.__entries[key] = (frames, scaled_frames)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+        return scaled_frames
+
+    def clear(self) -> None:
+        """Отчистка кеша"""
+
+        self.__entries.clear()
+
+    def get_hits(self) -> int:
+        """
+        Геттер количества запросов, найденных в кеше.
+
+        :return: Целое число, количество попаданий.
+        """
+
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Геттер количества запросов, для которых кадры масштабировались.
+
+        :return: Целое число, количество промахов.
+        """
+
+        return self.__misses
+
+    @staticmethod
+    def _build_strip(frames: Sequence[pygame.Surface],
+                     size: int) -> List[pygame.Surface]:
+        """
+        Сборка кадров в одну ленту.
+
+        :param frames: Исходные кадры анимации.
+        :param size: Ширина и высота кадра в px.
+        :return: Список кадров - подповерхностей ленты.
+        """
+
+        strip = pygame.Surface((size * len(frames), size))
+        # Без окна лента остается в исходном формате.
+        if pygame.display.get_surface() is not None:
+            strip = strip.convert()
+        strip.fill(settings.Collors.BLACK.value)
+        for i, frame in enumerate(frames):
+            strip.blit(
+                pygame.transform.scale(frame, (size, size)),
+                (i * size, 0),
+            )
+        # Подповерхности наследуют прозрачный цвет ленты.
+        strip.set_colorkey(settings.Collors.BLACK.value)
+
+        return [
+            strip.subsurface((i * size, 0, size, size))
+            for i in range(len(frames))
+        ]
@@ -5,18 +5,27 @@ from typing import (
     Tuple,
 )
 
-from settings import explosion_anim
+import settings
+from game_clock import GameClock
+from assets import Assets
+from utils.object_pool import Poolable
+from animations.animation_cache import AnimationCache
 
 
-class Explosion(pygame.sprite.Sprite):
+class Explosion(Poolable, pygame.sprite.Sprite):
     """
     Класс анимации взрыва.
 
     На каждой итерации игрового цикла вызывается метод update экземпляра
     класса анимации взрыва. Благодаря параметру frame_rate меняет изображения
     спрайта взрыва на нужной нам скорости.
+
+    Взрывы переиспользуются через пул, поэтому новые взрывы нужно
+    получать через Explosion.acquire.
     """
 
+    _pool_size = settings.EXPLOSIONS_POOL_SIZE
+
     def __init__(self, center: Tuple[float, float], size: float,
                  frame_rate: int = 55) -> None:
         """
@@ -28,12 +37,36 @@ class Explosion(pygame.sprite.Sprite):
         """
 
         pygame.sprite.Sprite.__init__(self)
+        self.reset(center, size, frame_rate)
+
+    def reset(  # pylint: disable=arguments-differ
+            self,
+            center: Tuple[float, float],
+            size: float,
+            frame_rate: int = 55,
+    ) -> None:
+        """
+        Сброс состояния взрыва.
+
+        Вызывается пулом при повторном использовании взрыва.
+
+        :param center: Координаты центра взрыва.
+        :param size: Размеры взрыва (радиус).
+        :param frame_rate: Кадры в секунду для воспроизведения анимации.
+        """
+
         self.size = size
-        self.image = pygame.transform.scale(explosion_anim[0], (size, size))
+        # Кадры анимации каждого размера масштабируются один раз и общие
+        # для всех взрывов этого размера.
+        self.__frames = AnimationCache().get_frames(
+            Assets().explosion_anim,
+            size,
+        )
+        self.image = self.__frames[0]
         self.rect = self.image.get_rect()
         self.rect.center = center
         self.frame = 0
-        self.last_update = pygame.time.get_ticks()
+        self.last_update = GameClock().get_time()
         self.frame_rate = frame_rate
 
     def update(self) -> None:
@@ -41,15 +74,14 @@ class Explosion(pygame.sprite.Sprite):
 
         # Обновляем спрайт текущего объекта взрыва на нужной скорости
         # вопспроизведения анимации.
-        now = pygame.time.get_ticks()
+        now = GameClock().get_time()
         if now - self.last_update > self.frame_rate:
             self.last_update = now
             self.frame += 1
-            if self.frame == len(explosion_anim):
+            if self.frame == len(Assets().explosion_anim):
                 self.kill()
             else:
                 center = self.rect.center
-                self.image = pygame.transform.scale(explosion_anim[self.frame],
-                                                    (self.size, self.size))
+                self.image = self.__frames[self.frame]
                 self.rect = self.image.get_rect()
                 self.rect.center = center
@@ -0,0 +1,438 @@
+"""Модуль реестра игровых ресурсов"""
+
+import threading
+import pygame
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import settings
+from utils.singleton import Singleton
+from utils.pixel_cache import PixelCache
+from utils.surface_cache import SurfaceCache
+from utils.texture_atlas import TextureAtlas
+
+
+class Assets(metaclass=Singleton):
+    """
+    Реестр игровых ресурсов: изображений, звуков и шрифтов.
+
+    Реализует паттерн Singleton. Каждый ресурс загружается при первом
+    обращении к нему, поэтому импорт модулей игры не загружает ресурсы и не
+    требует окна. Ресурсы можно заранее загрузить в фоновом потоке.
+
+    Изображения переводятся в формат экрана, только если окно уже создано.
+
+    Если собран кеш пикселей, изображения и их масштабированные варианты
+    берутся из него без декодирования файлов.
+    """
+
+    # Имена ресурсов-изображений, которые попадают в кеш пикселей.
+    __image_names = (
+        'background',
+        'asteroid_skins',
+        'player_skin',
+        'bullet_skin',
+        'attack_speed_powerup_skin',
+        'speed_powerup_skin',
+        'health_powerup_skin',
+        'explosion_anim',
+    )
+
+    def __init__(self) -> None:
+        """Инициализатор класса"""
+
+        # Ключи словаря - имена ресурсов, значения - функции их загрузки.
+        self.__loaders: Dict[str, Callable[[], Any]] = {
+            'atlas': self._load_atlas,
+            'pixel_cache': self._load_pixel_cache,
+            'background': self._load_background,
+            'asteroid_skins': self._load_asteroid_skins,
+            'player_skin': lambda: self._load_skin(
+                'PNG/playerShip1_orange.png',
+            ),
+            'bullet_skin': lambda: self._load_skin(
+                'PNG/Lasers/laserBlue01.png',
+            ),
+            'attack_speed_powerup_skin': lambda: self._load_skin(
+                'PNG/Power-ups/things_gold.png',
+            ),
+            'speed_powerup_skin': lambda: self._load_skin(
+                'PNG/Power-ups/powerupBlue_bolt.png',
+            ),
+            'health_powerup_skin': lambda: self._load_skin(
+                'PNG/Power-ups/pill_green.png',
+            ),
+            'explosion_anim': self._load_explosion_anim,
+            'shoot_sound': lambda: self._load_sound('sfx_laser1.ogg', 0.2),
+            'expl_sounds': lambda: [
+                self._load_sound(f'expls/type2/explosion{i + 1}.ogg', 0.1)
+                for i in range(2, 4)
+            ],
+            'chunky_expl': lambda: self._load_sound(
+                'expls/chunky_expl.mp3', 0.5,
+            ),
+            'main_font': lambda: self._load_font('Comic Sans MS', 30),
+            'health_font': lambda: self._load_font('Comic Sans MS', 12),
+        }
+        self.__loaded: Dict[str, Any] = {}
+        # Изображения, загруженные при сборке кеша пикселей, и файлы, из
+        # которых они загружены. None - кеш не собирается.
+        self.__recorded: Optional[Dict[str, Tuple[pygame.Surface,
+                                                  List[Path]]]] = None
+        # Блокировка нужна, чтобы ресурс не загрузился дважды, когда к нему
+        # одновременно обращаются игра и фоновая загрузка.
+        self.__lock = threading.RLock()
+
+    def get(self, name: str) -> Any:
+        """
+        Получение ресурса по имени.
+
+        :param name: Имя ресурса.
+        :return: Ресурс. Загружается при первом обращении.
+        """
+
+        resource = self.__loaded.get(name)
+        if resource is not None:
+            return resource
+
+        with self.__lock:
+            if name not in self.__loaded:
+                self.__loaded[name] = self.__loaders[name]()
+            return self.__loaded[name]
+
+    def prefetch(self, names: Optional[Iterable[str]] = None) \
+            -> threading.Thread:
+        """
+        Загрузка ресурсов в фоновом потоке.
+
+        :param names: Имена ресурсов. None - все ресурсы.
+        :return: Объект запущенного потока.
+        """
+
+        names = list(self.__loaders if names is None else names)
+        thread = threading.Thread(
+            target=lambda: [self.get(name) for name in names],
+            daemon=True,
+        )
+        thread.start()
+
+        return thread
+
+    def build_pixel_cache(self) -> None:
+        """
+        Сборка кеша пикселей.
+
+        Все изображения загружаются из исходных файлов и вместе с
+        масштабированными вариантами из PIXEL_CACHE_VARIANTS записываются в
+        файл кеша. Окно должно быть создано, чтобы изображения хранились в
+        формате экрана.
+        """
+
+        self.__recorded = {}
+        try:
+            for name in self.__image_names:
+                self.__loaders[name]()
+            recorded = self.__recorded
+        finally:
+            self.__recorded = None
+
+        images = []
+        sources = []
+        for path, (surface, surface_sources) in recorded.items():
+            images.append((path, None, surface))
+            sources += surface_sources
+            for size in settings.PIXEL_CACHE_VARIANTS.get(path, []):
+                images.append((path, size, SurfaceCache.scale(surface, size)))
+
+        PixelCache.build(
+            settings.pixel_cache_path,
+            settings.base_dir,
+            self._get_pixel_cache_config(),
+            sources,
+            images,
+        )
+
+    @property
+    def background(self) -> pygame.Surface:
+        return self.get('background')
+
+    @property
+    def asteroid_skins(self) -> Dict[str, List[pygame.Surface]]:
+        return self.get('asteroid_skins')
+
+    @property
+    def player_skin(self) -> pygame.Surface:
+        return self.get('player_skin')
+
+    @property
+    def bullet_skin(self) -> pygame.Surface:
+        return self.get('bullet_skin')
+
+    @property
+    def attack_speed_powerup_skin(self) -> pygame.Surface:
+        return self.get('attack_speed_powerup_skin')
+
+    @property
+    def speed_powerup_skin(self) -> pygame.Surface:
+        return self.get('speed_powerup_skin')
+
+    @property
+    def health_powerup_skin(self) -> pygame.Surface:
+        return self.get('health_powerup_skin')
+
+    @property
+    def explosion_anim(self) -> List[pygame.Surface]:
+        return self.get('explosion_anim')
+
+    @property
+    def shoot_sound(self) -> pygame.mixer.Sound:
+        return self.get('shoot_sound')
+
+    @property
+    def expl_sounds(self) -> List[pygame.mixer.Sound]:
+        return self.get('expl_sounds')
+
+    @property
+    def chunky_expl(self) -> pygame.mixer.Sound:
+        return self.get('chunky_expl')
+
+    @property
+    def main_font(self) -> pygame.font.Font:
+        return self.get('main_font')
+
+    @property
+    def health_font(self) -> pygame.font.Font:
+        return self.get('health_font')
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Перевод изображения в формат экрана, если окно уже создано.
+
+        :param surface: Изображение.
+        :return: Изображение в формате экрана или исходное изображение.
+        """
+
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert()
+
+    def _load_atlas(self) -> TextureAtlas:
+        """
+        Загрузка текстурного атласа.
+
+        Скины объектов берутся из атласа, если он включен и в нем есть
+        нужный скин, иначе из отдельных файлов.
+
+        :return: Объект атласа.
+        """
+
+        return TextureAtlas(
+            settings.sprites_dir / 'Spritesheet/sheet.xml'
+            if settings.USE_TEXTURE_ATLAS else None,
+        )
+
+    @staticmethod
+    def _get_pixel_cache_config() -> str:
+        """
+        Получение строки настроек, от которых зависит кеш пикселей.
+
+        :return: Строка настроек.
+        """
+
+        return repr((
+            settings.USE_TEXTURE_ATLAS,
+            sorted(settings.PIXEL_CACHE_VARIANTS.items()),
+        ))
+
+    def _load_pixel_cache(self) -> Optional[PixelCache]:
+        """
+        Открытие кеша пикселей.
+
+        :return:
+            Объект кеша или None, если кеш выключен, не собран или устарел.
+        """
+
+        if not settings.USE_PIXEL_CACHE:
+            return None
+
+        return PixelCache.open(
+            settings.pixel_cache_path,
+            settings.base_dir,
+            self._get_pixel_cache_config(),
+        )
+
+    def _load_cached(self, path: str) -> Optional[pygame.Surface]:
+        """
+        Загрузка изображения из кеша пикселей.
+
+        Масштабированные варианты изображения добавляются в общий кеш
+        масштабированных изображений.
+
+        :param path: Путь до файла изображения относительно папки спрайтов.
+        :return: Изображение или None, если его нет в кеше.
+        """
+
+        if self.__recorded is not None:
+            return None
+        pixel_cache = self.get('pixel_cache')
+        if pixel_cache is None:
+            return None
+
+        surface = pixel_cache.get(path)
+        if surface is not None:
+            surface_cache = SurfaceCache()
+            for size, variant in pixel_cache.get_variants(path):
+                surface_cache.put(surface, size, variant)
+
+        return surface
+
+    def _record(self, path: str, surface: pygame.Surface,
+                sources: List[Path]) -> None:
+        """
+        Запоминание изображения, загруженного при сборке кеша пикселей.
+
+        :param path: Путь до файла изображения относительно папки спрайтов.
+        :param surface: Изображение.
+        :param sources: Файлы, из которых загружено изображение.
+        """
+
+        if self.__recorded is not None:
+            self.__recorded[path] = (surface, sources)
+
+    def _load_skin(self, path: str) -> pygame.Surface:
+        """
+        Загрузка скина объекта.
+
+        :param path: Путь до файла скина относительно папки спрайтов.
+        :return: Изображение скина.
+        """
+
+        surface = self._load_cached(path)
+        if surface is None:
+            atlas = self.get('atlas')
+            surface = atlas.load(settings.sprites_dir / path)
+            self._record(
+                path, surface, atlas.get_sources(settings.sprites_dir / path),
+            )
+
+        return surface
+
+    def _load_file(self, path: str) -> pygame.Surface:
+        """
+        Загрузка изображения из отдельного файла.
+
+        :param path: Путь до файла изображения относительно папки спрайтов.
+        :return: Изображение.
+        """
+
+        surface = self._load_cached(path)
+        if surface is None:
+            surface = self._convert(pygame.image.load(
+                settings.sprites_dir / path,
+            ))
+            self._record(path, surface, [settings.sprites_dir / path])
+
+        return surface
+
+    def _load_background(self) -> pygame.Surface:
+        """
+        Загрузка плитки заднего фона.
+
+        :return: Изображение плитки.
+        """
+
+        return self._load_file('Backgrounds/black.png')
+
+    def _load_asteroid_skins(self) -> Dict[str, List[pygame.Surface]]:
+        """
+        Загрузка скинов астероидов.
+
+        :return: Словарь, ключи которого - размеры, значения - скины.
+        """
+
+        return {
+            'tiny': [
+                self._load_skin('PNG/Meteors/meteorBrown_tiny1.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_tiny2.png'),
+            ],
+            'small': [
+                self._load_skin('PNG/Meteors/meteorBrown_small1.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_small2.png'),
+            ],
+            'medium': [
+                self._load_skin('PNG/Meteors/meteorBrown_med1.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_med2.png'),
+            ],
+            'large': [
+                self._load_skin('PNG/Meteors/meteorBrown_big1.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_big2.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_big3.png'),
+                self._load_skin('PNG/Meteors/meteorBrown_big4.png'),
+            ],
+        }
+
+    def _load_explosion_anim(self) -> List[pygame.Surface]:
+        """
+        Загрузка кадров анимации взрыва.
+
+        :return: Список кадров.
+        """
+
+        explosion_anim = []
+        for i in range(9):
+            img = self._load_file(
+                f'Explosions_kenney/regularExplosion0{i}.png',
+            )
+            img.set_colorkey(settings.Collors.BLACK.value)
+            explosion_anim.append(img)
+
+        return explosion_anim
+
+    @staticmethod
+    def _load_sound(path: str, volume: float) -> pygame.mixer.Sound:
+        """
+        Загрузка звука.
+
+        :param path: Путь до файла звука относительно папки звуков.
+        :param volume: Громкость звука.
+        :return: Объект звука.
+        """
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+        sound = pygame.mixer.Sound(settings.audio_dir / path)
+        sound.set_volume(volume)
+
+        return sound
+
+    @staticmethod
+    def _load_font(name: str, size: int) -> pygame.font.Font:
+        """
+        Загрузка системного шрифта.
+
+        :param name: Имя шрифта.
+        :param size: Размер шрифта.
+        :return: Объект шрифта.
+        """
+
+        if not pygame.font.get_init():
+            pygame.font.init()
+
+        return pygame.font.SysFont(name, size)
+
+
+if __name__ == '__main__':
+    # Сборка кеша пикселей. Окно создается скрытым только для того, чтобы
+    # изображения были в формате экрана.
+    pygame.display.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    Assets().build_pixel_cache()
@@ -1,20 +1,34 @@
 """Модуль с классами для работы с астероидами"""
 
-import random
 import pygame
 import math
 from typing import (
     List,
     Optional,
     Tuple,
+    TYPE_CHECKING,
 )
 
 import settings
+from assets import Assets
+from global_game_objects import GlobalGameObjects
 from collider.collideable import Collideable
+from utils.object_pool import Poolable
+from utils.surface_cache import SurfaceCache
 
+if TYPE_CHECKING:
+    from asteroids.asteroid_field import AsteroidField
 
-class Asteroid(Collideable, pygame.sprite.Sprite):
-    """Класс астероидов"""
+
+class Asteroid(Collideable, Poolable, pygame.sprite.Sprite):
+    """
+    Класс астероидов.
+
+    Астероиды переиспользуются через пул, поэтому новые астероиды нужно
+    получать через Asteroid.acquire.
+    """
+
+    _pool_size = settings.ASTEROIDS_POOL_SIZE
 
     # Значение в px, при котором астероид не должен делиться.
     __min_radius = 30
@@ -44,19 +58,59 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
 
         pygame.sprite.Sprite.__init__(self)
 
-        # Задаем радиус и представление объекта.
-        self.radius = size
-        self.image = pygame.transform.scale(skin, (size * 2, size * 2))
-        # Игнорируем черный цвет и не отрисовываем его.
-        self.image.set_colorkey(settings.Collors.BLACK.value)
+        # Хранилище кинематики астероидов и индекс астероида в нем. Пока
+        # астероид находится в хранилище, его положение, угол, скорость и
+        # здоровье хранятся там, а не в самом объекте.
+        self.__field: Optional['AsteroidField'] = None
+        self.__field_index = -1
+
+        self.__skin: Optional[pygame.Surface] = None
+        self.reset(skin, size, speed, pos_x, pos_y, angle)
+
+    def reset(  # pylint: disable=arguments-differ
+            self,
+            skin: pygame.Surface,
+            size: int,
+            speed: float,
+            pos_x: Optional[int] = None,
+            pos_y: Optional[int] = None,
+            angle: Optional[float] = None,
+    ) -> None:
+        """
+        Сброс состояния астероида.
+
+        Вызывается пулом при повторном использовании астероида.
+
+        :param skin: Скин астероида.
+        :param size: Радиус астероида.
+        :param speed: Скорость астероида.
+        :param pos_x: Позиция по оси х астероида.
+        :param pos_y: Позиция по оси у астероида.
+        :param angle: Угол полета астероида.
+        """
+
+        # Задаем радиус и представление объекта. Изображение и маска берутся
+        # из общего кеша, только если поменялся скин или размер.
+        if skin is not self.__skin or size != self.radius:
+            self.__skin = skin
+            self.radius = size
+            # Маска астероида не меняется, т.к. астероид не вращается.
+            surface_cache = SurfaceCache()
+            self.image = surface_cache.get_surface(skin, (size * 2, size * 2))
+            self.mask = surface_cache.get_mask(skin, (size * 2, size * 2))
 
         # Задаем позицию, угол и скорость астероида.
-        self.__pos_x = random.randint(self.radius, settings.WIDTH - self.radius) \
-            if pos_x is None else pos_x
-        self.__pos_y = random.randint(self.radius, settings.HEIGHT - self.radius) \
-            if pos_y is None else pos_y
+        rng = GlobalGameObjects().random.get('asteroids')
+        self.__pos_x = rng.randint(
+            self.radius,
+            settings.WORLD_WIDTH - self.radius,
+        ) if pos_x is None else pos_x
+        self.__pos_y = rng.randint(
+            self.radius,
+            settings.WORLD_HEIGHT - self.radius,
+        ) if pos_y is None else pos_y
         self.__speed = speed
-        self.angle = random.random() * random.choice([-1, 1]) \
+        self.__angle = rng.random() * rng.choice([-1, 1]) \
             if angle is None else angle
         self.rect = self.image.get_rect(center=(self.__pos_x, self.__pos_y))
 
@@ -91,57 +145,17 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
 
         # Учет столкновения объекта со стенками.
         if self.__pos_x + self.radius < 0 \
-                or self.__pos_x - self.radius > settings.WIDTH \
+                or self.__pos_x - self.radius > settings.WORLD_WIDTH \
                 or self.__pos_y + self.radius < 0 \
-                or self.__pos_y - self.radius > settings.HEIGHT:
+                or self.__pos_y - self.radius > settings.WORLD_HEIGHT:
             self.kill()
 
         # Меняем положение объектов в пространстве.
-        self.__pos_x += math.sin(self.angle) * self.__speed
-        self.__pos_y -= math.cos(self.angle) * self.__speed
+        step = self.__speed * settings.SPEED_SCALE
+        self.__pos_x += math.sin(self.__angle) * step
+        self.__pos_y -= math.cos(self.__angle) * step
         self.rect.center = round(self.__pos_x), round(self.__pos_y)
 
-    def draw_health_bar(self, screen: pygame.Surface) -> None:
-        """
-        Отрисовка полоски здоровья астероида.
-
-        :param screen: Экран, на который нужно рисовать.
-        """
-
-        if self.health < 0:
-            self.health = 0
-        BAR_LENGTH = 45
-        BAR_HEIGHT = 10
-
-        # Отрисовка полоски здоровья.
-        remaining_health_percent = self.health * 100 / self.__source_health
-        fill = remaining_health_percent * BAR_LENGTH / 100
-        outline_rect = pygame.Rect(
-            self.__pos_x - BAR_LENGTH // 2,
-            self.__pos_y + self.radius + 5,
-            BAR_LENGTH, BAR_HEIGHT
-        )
-        fill_rect = pygame.Rect(
-            self.__pos_x - BAR_LENGTH // 2,
-            self.__pos_y + self.radius + 5,
-            fill, BAR_HEIGHT
-        )
-
-        # Отрисовка здоровья астероида цифрами.
-        health_text = settings.health_font.render(
-            f'{self.health}xp',
-            True,
-            settings.Collors.WHITE.value,
-        )
-        settings.screen.blit(
-            health_text,
-            (self.__pos_x - BAR_LENGTH // 2 + BAR_LENGTH + 1,
-             self.__pos_y + self.radius + 5),
-        )
-
-        pygame.draw.rect(screen, settings.Collors.RED.value, fill_rect)
-        pygame.draw.rect(screen, settings.Collors.WHITE.value, outline_rect, 2)
-
     def split_asteroid(self) -> List['Asteroid']:
         """
         Метод разбиения астероида на два меньших.
@@ -149,8 +163,9 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :return: Список объектов с меньшими астероидами.
         """
 
+        rng = GlobalGameObjects().random.get('asteroids')
         # Выбираем случайное кол-во астероидов.
-        count_new_asteroids = random.randint(*self.__min_max_new_asteroids)
+        count_new_asteroids = rng.randint(*self.__min_max_new_asteroids)
         # Высчитываем новый вес и размеры астероидов.
         new_weight = self.get_weight() // (count_new_asteroids + 2)
         new_radius = math.ceil((3 * new_weight / math.pi) ** (1 / 3))
@@ -159,16 +174,17 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         new_small_asteroids: List[Asteroid] = []
         for _ in range(count_new_asteroids):
             # Немного замедлим новые астероиды после взрыва большего.
-            new_speed = self.__speed * 0.9
+            new_speed = self.speed * 0.9
             # Выбираем случайный скин.
-            skin_level = random.choice(list(settings.asteroid_skins.keys()))
-            random_skin = random.choice(settings.asteroid_skins[skin_level])
-            new_small_asteroids.append(Asteroid(
+            asteroid_skins = Assets().asteroid_skins
+            skin_level = rng.choice(list(asteroid_skins.keys()))
+            random_skin = rng.choice(asteroid_skins[skin_level])
+            new_small_asteroids.append(Asteroid.acquire(
                 skin=random_skin,
                 size=new_radius,
                 speed=new_speed,
-                pos_x=self.__pos_x,
-                pos_y=self.__pos_y,
+                pos_x=self.pos_x,
+                pos_y=self.pos_y,
             ))
 
         return new_small_asteroids
@@ -181,6 +197,8 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :return: Целое число, координата по оси Х.
         """
 
+        if self.__field is not None:
+            return float(self.__field.pos_x[self.__field_index])
         return self.__pos_x
 
     @pos_x.setter
@@ -191,7 +209,10 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :param new_pos_x: Новое значение по оси Х.
         """
 
-        self.__pos_x = new_pos_x
+        if self.__field is not None:
+            self.__field.pos_x[self.__field_index] = new_pos_x
+        else:
+            self.__pos_x = new_pos_x
 
     @property
     def pos_y(self) -> int:
@@ -201,6 +222,8 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :return: Целое число, координата по оси Y.
         """
 
+        if self.__field is not None:
+            return float(self.__field.pos_y[self.__field_index])
         return self.__pos_y
 
     @pos_y.setter
@@ -211,7 +234,10 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :param new_pos_y: Новое значение координаты по оси Y.
         """
 
-        self.__pos_y = new_pos_y
+        if self.__field is not None:
+            self.__field.pos_y[self.__field_index] = new_pos_y
+        else:
+            self.__pos_y = new_pos_y
 
     @property
     def speed(self) -> float:
@@ -221,6 +247,8 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :return: Вещественное число, скорость астероида.
         """
 
+        if self.__field is not None:
+            return float(self.__field.speed[self.__field_index])
         return self.__speed
 
     @speed.setter
@@ -231,7 +259,77 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :param new_speed: Новая скорость астероида.
         """
 
-        self.__speed = new_speed
+        if self.__field is not None:
+            self.__field.speed[self.__field_index] = new_speed
+        else:
+            self.__speed = new_speed
+
+    @property
+    def angle(self) -> float:
+        """
+        Геттер угла полета астероида.
+
+        :return: Вещественное число, угол в радианах.
+        """
+
+        if self.__field is not None:
+            return float(self.__field.angle[self.__field_index])
+        return self.__angle
+
+    @angle.setter
+    def angle(self, new_angle: float) -> None:
+        """
+        Сеттер угла полета астероида.
+
+        :param new_angle: Новый угол в радианах.
+        """
+
+        if self.__field is not None:
+            self.__field.angle[self.__field_index] = new_angle
+        else:
+            self.__angle = new_angle
+
+    def attach_field(self, field: 'AsteroidField', index: int) -> None:
+        """
+        Перенос кинематики астероида в хранилище.
+
+        Вызывается самим хранилищем при добавлении астероида и при смене
+        его индекса.
+
+        :param field: Хранилище кинематики астероидов.
+        :param index: Индекс астероида в хранилище.
+        """
+
+        self.__field = field
+        self.__field_index = index
+
+    def get_field_index(self) -> int:
+        """
+        Геттер индекса астероида в хранилище кинематики.
+
+        :return: Целое число, индекс либо -1, если астероид не в хранилище.
+        """
+
+        return self.__field_index
+
+    def detach_field(self) -> None:
+        """
+        Возврат кинематики астероида из хранилища в сам объект.
+
+        Вызывается самим хранилищем при удалении астероида.
+        """
+
+        if self.__field is None:
+            return
+
+        field, index = self.__field, self.__field_index
+        self.__pos_x = float(field.pos_x[index])
+        self.__pos_y = float(field.pos_y[index])
+        self.__angle = float(field.angle[index])
+        self.__speed = float(field.speed[index])
+        self.__health = int(field.health[index])
+        self.__field = None
+        self.__field_index = -1
 
     @property
     def health(self) -> int:
@@ -241,6 +339,8 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :return: Целое число, здоровье астероида.
         """
 
+        if self.__field is not None:
+            return int(self.__field.health[self.__field_index])
         return self.__health
 
     @health.setter
@@ -251,7 +351,10 @@ class Asteroid(Collideable, pygame.sprite.Sprite):
         :param new_health: Новое здоровье астероида.
         """
 
-        self.__health = new_health
+        if self.__field is not None:
+            self.__field.health[self.__field_index] = new_health
+        else:
+            self.__health = new_health
 
     def get_source_health(self) -> int:
         """
@@ -310,6 +413,15 @@ class AsteroidType:
         self.__min_max_speed = min_max_speed
         self.__skins = skins
 
+    def get_max_radius(self) -> int:
+        """
+        Геттер максимального радиуса астероидов этого типа.
+
+        :return: Целое число, максимальный радиус астероида.
+        """
+
+        return self.__min_max_radius[1]
+
     def create_asteroid(self) -> Asteroid:
         """
         Метод создания нового астероида на основе этого типа.
@@ -317,12 +429,13 @@ class AsteroidType:
         :return: Новый астероид.
         """
 
-        radius = random.randint(*self.__min_max_radius)
-        speed = random.randint(*self.__min_max_speed) / 100
-        skin = random.choice(self.__skins)
-        angle = math.pi + random.uniform(0, math.pi / 4) \
-                * random.choice([-1, 1])
-        new_asteroid = Asteroid(
+        rng = GlobalGameObjects().random.get('asteroids')
+        radius = rng.randint(*self.__min_max_radius)
+        speed = rng.randint(*self.__min_max_speed) / 100
+        skin = rng.choice(self.__skins)
+        angle = math.pi + rng.uniform(0, math.pi / 4) \
+                * rng.choice([-1, 1])
+        new_asteroid = Asteroid.acquire(
             skin=skin, size=radius,
             speed=speed, pos_y=-radius + 1,
             angle=angle,
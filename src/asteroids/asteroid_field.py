@@ -0,0 +1,381 @@
+"""Модуль хранилища кинематики астероидов на массивах NumPy"""
+
+import pygame
+import numpy as np
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+import settings
+from asteroids.asteroid import Asteroid
+
+
+class AsteroidField:
+    """
+    Хранилище кинематики астероидов.
+
+    Хранит положения, углы, скорости, радиусы и здоровье всех астероидов
+    в отдельных массивах NumPy (структура массивов). Благодаря этому все
+    астероиды сдвигаются за один векторный шаг, а вылетевшие за границы поля
+    отбираются сразу пачкой, без вызова метода update у каждого спрайта.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        Инициализатор класса.
+
+        :param capacity:
+            Начальная вместимость массивов. При переполнении массивы
+            увеличиваются вдвое.
+        """
+
+        assert capacity > 0
+
+        self.__count = 0
+        self.__sprites: List[Asteroid] = []
+        self.pos_x = np.zeros(capacity)
+        self.pos_y = np.zeros(capacity)
+        self.angle = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.radius = np.zeros(capacity)
+        self.health = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        """
+        Дандер-метод для получения количества астероидов.
+
+        :return: Целое число, количество астероидов в хранилище.
+        """
+
+        return self.__count
+
+    def get_sprites(self) -> List[Asteroid]:
+        """
+        Геттер для получения астероидов в порядке их индексов.
+
+        :return: Список астероидов.
+        """
+
+        return list(self.__sprites)
+
+    def add(self, asteroid: Asteroid) -> None:
+        """
+        Добавление астероида в хранилище.
+
+        :param asteroid: Объект астероида.
+        """
+
+        if self.__count == len(self.pos_x):
+            self._grow()
+
+        index = self.__count
+        self.pos_x[index] = asteroid.pos_x
+        self.pos_y[index] = asteroid.pos_y
+        self.angle[index] = asteroid.angle
+        self.speed[index] = asteroid.speed
+        self.radius[index] = asteroid.radius
+        self.health[index] = asteroid.health
+        self.__sprites.append(asteroid)
+        self.__count += 1
+
+        asteroid.attach_field(self, index)
+
+    def remove(self, asteroid: Asteroid) -> None:
+        """
+        Удаление астероида из хранилища.
+
+        На место удаляемого астероида переносится последний, поэтому
+        массивы остаются плотными.
+
+        :param asteroid: Объект астероида.
+        """
+
+        index = asteroid.get_field_index()
+        if index < 0 or index >= self.__count \
+                or self.__sprites[index] is not asteroid:
+            return
+
+        # Возвращаем кинематику в объект астероида, т.к. после удаления он
+        # еще может понадобиться, например, для деления на меньшие.
+        asteroid.detach_field()
+
+        last = self.__count - 1
+        if index != last:
+            for array in self._get_arrays():
+                array[index] = array[last]
+            moved_asteroid = self.__sprites[last]
+            self.__sprites[index] = moved_asteroid
+            moved_asteroid.attach_field(self, index)
+        self.__sprites.pop()
+        self.__count -= 1
+
+    def update(self) -> None:
+        """
+        Векторный шаг всех астероидов.
+
+        Повторяет логику Asteroid.update: сначала отбираются астероиды,
+        вылетевшие за границы поля, затем все астероиды сдвигаются.
+        """
+
+        count = self.__count
+        if count == 0:
+            return
+
+        pos_x = self.pos_x[:count]
+        pos_y = self.pos_y[:count]
+        radius = self.radius[:count]
+        angle = self.angle[:count]
+        speed = self.speed[:count]
+
+        # Учет столкновения объектов со стенками.
+        out_of_bounds = np.flatnonzero(
+            (pos_x + radius < 0)
+            | (pos_x - radius > settings.WORLD_WIDTH)
+            | (pos_y + radius < 0)
+            | (pos_y - radius > settings.WORLD_HEIGHT)
+        )
+        killed = [self.__sprites[index] for index in out_of_bounds]
+
+        # Меняем положение объектов в пространстве.
+        step = speed * settings.SPEED_SCALE
+        pos_x += np.sin(angle) * step
+        pos_y -= np.cos(angle) * step
+
+        # Уничтожение спрайта удаляет его из группы, а группа удаляет
+        # астероид из хранилища.
+        for asteroid in killed:
+            asteroid.kill()
+
+    def resolve_collisions(self,
+                           pairs: List[Tuple[Asteroid, Asteroid]]) -> None:
+        """
+        Решение столкновений пар астероидов одним пакетом.
+
+        Пары с астероидами, которых уже нет в хранилище (например, их
+        уничтожили снаряды на этой же итерации), пропускаются.
+
+        :param pairs: Список пар астероидов, которые, вероятно, столкнулись.
+        """
+
+        indexes_1 = []
+        indexes_2 = []
+        for asteroid_1, asteroid_2 in pairs:
+            index_1 = asteroid_1.get_field_index()
+            index_2 = asteroid_2.get_field_index()
+            if index_1 < 0 or index_2 < 0:
+                continue
+            indexes_1.append(index_1)
+            indexes_2.append(index_2)
+
+        if indexes_1:
+            self.resolve_collisions_by_indexes(
+                np.array(indexes_1), np.array(indexes_2),
+            )
+
+    def resolve_collisions_by_indexes(self, indexes_1: np.ndarray,
+                                      indexes_2: np.ndarray) -> None:
+        """
+        Упругие столкновения астероидов по массивам индексов.
+
+        Физика повторяет AsteroidCollideResolve.resolve. Пары разбиваются на
+        волны так, чтобы в одной волне каждый астероид встречался не больше
+        одного раза, а пары одного астероида шли в исходном порядке. Волны
+        решаются по очереди, каждая - целиком векторно, поэтому результат
+        совпадает с поочередным решением пар с точностью до округления.
+
+        :param indexes_1: Индексы первых астероидов пар.
+        :param indexes_2: Индексы вторых астероидов пар.
+        """
+
+        # Проверять коллизию шара с самим с собой не имеет смысла.
+        not_same = indexes_1 != indexes_2
+        indexes_1 = indexes_1[not_same]
+        indexes_2 = indexes_2[not_same]
+
+        # Номер волны пары на единицу больше последней волны ее астероидов.
+        last_waves: Dict[int, int] = {}
+        waves = np.empty(len(indexes_1), dtype=int)
+        for i, (index_1, index_2) in enumerate(
+                zip(indexes_1.tolist(), indexes_2.tolist())):
+            wave = max(last_waves.get(index_1, -1),
+                       last_waves.get(index_2, -1)) + 1
+            last_waves[index_1] = last_waves[index_2] = wave
+            waves[i] = wave
+
+        for wave in range(int(waves.max(initial=-1)) + 1):
+            in_wave = waves == wave
+            self._resolve_wave(indexes_1[in_wave], indexes_2[in_wave])
+
+    def _resolve_wave(self, indexes_1: np.ndarray,
+                      indexes_2: np.ndarray) -> None:
+        """
+        Векторное решение столкновений пар без общих астероидов.
+
+        :param indexes_1: Индексы первых астероидов пар.
+        :param indexes_2: Индексы вторых астероидов пар.
+        """
+
+        pos_x_1, pos_y_1 = self.pos_x[indexes_1], self.pos_y[indexes_1]
+        pos_x_2, pos_y_2 = self.pos_x[indexes_2], self.pos_y[indexes_2]
+        speed_1, speed_2 = self.speed[indexes_1], self.speed[indexes_2]
+        angle_1, angle_2 = self.angle[indexes_1], self.angle[indexes_2]
+        radius_1, radius_2 = self.radius[indexes_1], self.radius[indexes_2]
+
+        dx = pos_x_1 - pos_x_2
+        dy = pos_y_1 - pos_y_2
+        # Дистанция между центрами объектов.
+        distance = np.hypot(dx, dy)
+
+        # Положения шаров при следующем шаге. Смещение за шаг считается
+        # так же, как при движении астероидов.
+        step_1 = speed_1 * settings.SPEED_SCALE
+        step_2 = speed_2 * settings.SPEED_SCALE
+        new_distance = np.hypot(
+            (pos_x_1 + step_1 * np.sin(angle_1))
+            - (pos_x_2 + step_2 * np.sin(angle_2)),
+            (pos_y_1 - step_1 * np.cos(angle_1))
+            - (pos_y_2 - step_2 * np.cos(angle_2)),
+        )
+
+        # Оставляем только сближающиеся пары.
+        hit = radius_1 + radius_2 > new_distance
+        if not hit.any():
+            return
+        indexes_1, indexes_2 = indexes_1[hit], indexes_2[hit]
+        speed_1, speed_2 = speed_1[hit], speed_2[hit]
+        radius_1, radius_2 = radius_1[hit], radius_2[hit]
+        distance = distance[hit]
+
+        # Угол столкновения объектов.
+        angle = np.arctan2(dy[hit], dx[hit]) + 0.5 * np.pi
+        # Массы объектов равны объемам шаров.
+        weight_1 = np.pi * radius_1 ** 3 / 3
+        weight_2 = np.pi * radius_2 ** 3 / 3
+        total_mass = weight_1 + weight_2
+
+        # Вычисляем новые скорости с учетом масс объектов.
+        self.speed[indexes_1] = \
+            (speed_1 * (weight_1 - weight_2)
+             + 2 * weight_2 * speed_2) / total_mass
+        self.speed[indexes_2] = \
+            (speed_2 * (weight_2 - weight_1)
+             + 2 * weight_1 * speed_1) / total_mass
+
+        # Меняем углы движений объектов.
+        self.angle[indexes_1] += angle
+        self.angle[indexes_2] += angle + np.pi
+
+        # Чтобы объекты не слипались, высчитываем перекрытие их
+        # друг другом и отодвигаем еще на 2px.
+        overlap = 0.5 * (radius_1 + radius_2 - distance + 2)
+        shift_x = np.sin(angle) * overlap
+        shift_y = np.cos(angle) * overlap
+        self.pos_x[indexes_1] += shift_x
+        self.pos_y[indexes_1] -= shift_y
+        self.pos_x[indexes_2] -= shift_x
+        self.pos_y[indexes_2] += shift_y
+
+    def sync_rects(self, area: Optional[pygame.Rect] = None) -> None:
+        """
+        Перенос положений из массивов в прямоугольники спрайтов.
+
+        :param area:
+            Область, для астероидов в которой нужно обновить прямоугольники.
+            Если не указана, обновляются все астероиды.
+        """
+
+        count = self.__count
+        if count == 0:
+            return
+
+        centers_x = np.rint(self.pos_x[:count])
+        centers_y = np.rint(self.pos_y[:count])
+        if area is None:
+            indexes = range(count)
+        else:
+            radius = self.radius[:count]
+            indexes = np.flatnonzero(
+                (centers_x + radius >= area.left)
+                & (centers_x - radius <= area.right)
+                & (centers_y + radius >= area.top)
+                & (centers_y - radius <= area.bottom)
+            ).tolist()
+
+        centers_x = centers_x.astype(int).tolist()
+        centers_y = centers_y.astype(int).tolist()
+        sprites = self.__sprites
+        for index in indexes:
+            sprites[index].rect.center = centers_x[index], centers_y[index]
+
+    def _get_arrays(self) -> List[np.ndarray]:
+        """
+        Геттер для получения всех массивов хранилища.
+
+        :return: Список массивов.
+        """
+
+        return [self.pos_x, self.pos_y, self.angle,
+                self.speed, self.radius, self.health]
+
+    def _grow(self) -> None:
+        """Увеличение вместимости массивов вдвое"""
+
+        capacity = max(1, len(self.pos_x)) * 2
+        for name in ('pos_x', 'pos_y', 'angle', 'speed', 'radius', 'health'):
+            old_array = getattr(self, name)
+            new_array = np.zeros(capacity)
+            new_array[:len(old_array)] = old_array
+            setattr(self, name, new_array)
+
+
+class AsteroidFieldGroup(pygame.sprite.Group):
+    """
+    Группа спрайтов астероидов, связанная с хранилищем кинематики.
+
+    Спрайты, добавленные в группу, добавляются в хранилище, а удаленные
+    из группы (в том числе через kill) - удаляются из него. Метод update
+    группы делает один векторный шаг вместо вызова update у каждого спрайта.
+    """
+
+    def __init__(self, field: AsteroidField, *sprites) -> None:
+        """
+        Инициализатор класса.
+
+        :param field: Хранилище кинематики астероидов.
+        :param sprites: Спрайты для добавления в группу.
+        """
+
+        self.__field = field
+        super(AsteroidFieldGroup, self).__init__(*sprites)
+
+    def get_field(self) -> AsteroidField:
+        """
+        Геттер хранилища кинематики астероидов.
+
+        :return: Объект хранилища.
+        """
+
+        return self.__field
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super(AsteroidFieldGroup, self).add_internal(sprite, layer)
+        self.__field.add(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        super(AsteroidFieldGroup, self).remove_internal(sprite)
+        self.__field.remove(sprite)
+
+    def update(self, *args, **kwargs) -> None:
+        """
+        Векторный шаг всех астероидов и обновление их прямоугольников.
+
+        Прямоугольники обновляются у всех астероидов, т.к. по ним работает
+        широкая фаза столкновений. Если нужны только видимые астероиды,
+        можно вызвать sync_rects у хранилища с нужной областью.
+        """
+
+        self.__field.update()
+        self.__field.sync_rects()
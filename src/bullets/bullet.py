@@ -2,13 +2,27 @@
 
 import pygame
 import math
+from typing import (
+    Tuple,
+    Optional,
+)
 
 import settings
 from collider.collideable import Collideable
+from utils.object_pool import Poolable
+from utils.surface_cache import SurfaceCache
+from utils.rotation_cache import RotationCache
 
 
-class Bullet(Collideable, pygame.sprite.Sprite):
-    """Класс снаряда игркоа"""
+class Bullet(Collideable, Poolable, pygame.sprite.Sprite):
+    """
+    Класс снаряда игркоа.
+
+    Снаряды переиспользуются через пул, поэтому новые снаряды нужно
+    получать через Bullet.acquire.
+    """
+
+    _pool_size = settings.BULLETS_POOL_SIZE
 
     def __init__(
             self,
@@ -24,6 +38,7 @@ class Bullet(Collideable, pygame.sprite.Sprite):
         :param skin: Изображение спрайта.
         :param pos_x: Позиция по оси Х.
         :param pos_y: Позиция по оси Y.
+        :param angle: Угол полета снаряда в радианах.
         :param damage: Урон снаряда.
         """
 
@@ -31,11 +46,38 @@ class Bullet(Collideable, pygame.sprite.Sprite):
 
         self.__width = 15
         self.__height = 70
-        self.image_orig = pygame.transform.scale(
-            skin, (self.__width, self.__height),
-        )
-        self.image_orig.set_colorkey(settings.Collors.BLACK.value)
-        self.image = self.image_orig.copy()
+        self.__speed = 18
+        self.__skin: Optional[pygame.Surface] = None
+
+        self.reset(skin, pos_x, pos_y, angle, damage)
+
+    def reset(  # pylint: disable=arguments-differ
+            self,
+            skin: pygame.Surface,
+            pos_x: int,
+            pos_y: int,
+            angle: float,
+            damage: int,
+    ) -> None:
+        """
+        Сброс состояния снаряда.
+
+        Вызывается пулом при повторном использовании снаряда.
+
+        :param skin: Изображение спрайта.
+        :param pos_x: Позиция по оси Х.
+        :param pos_y: Позиция по оси Y.
+        :param angle: Угол полета снаряда в радианах.
+        :param damage: Урон снаряда.
+        """
+
+        # Масштабируем скин, только если он поменялся.
+        if skin is not self.__skin:
+            self.__skin = skin
+            self.image_orig = SurfaceCache().get_surface(
+                skin, (self.__width, self.__height),
+            )
+        self.image = self.image_orig
 
         self.rect = self.image.get_rect()
         self.rect.centery = pos_y
@@ -43,12 +85,17 @@ class Bullet(Collideable, pygame.sprite.Sprite):
 
         self.__damage = damage
         self.angle = angle
-        self.__speed = 18
         self.rot = 0
 
         # Поворачиваем снаряд в нужную сторону.
         self.rotate(math.degrees(angle))
 
+        # Положение и прямоугольник снаряда до последнего шага. По ним
+        # строится путь снаряда за шаг, чтобы быстрый снаряд не пролетал
+        # маленькие астероиды насквозь.
+        self.__prev_center = self.rect.center
+        self.__swept_rect = self.rect.copy()
+
     def update(self):
         """
         Обновление состояния снаряда.
@@ -58,13 +105,19 @@ class Bullet(Collideable, pygame.sprite.Sprite):
 
         # При выходе за границы игрового поля уничтожить спрайт.
         # Он удаляется из всех групп.
-        if self.rect.right < 0 or self.rect.left > settings.WIDTH \
-                or self.rect.bottom < 0 or self.rect.top > settings.HEIGHT:
+        if self.rect.right < 0 or self.rect.left > settings.WORLD_WIDTH \
+                or self.rect.bottom < 0 \
+                or self.rect.top > settings.WORLD_HEIGHT:
             self.kill()
 
-        # Меняем положение объектов в пространстве.
-        self.rect.centerx -= math.sin(self.angle) * self.__speed
-        self.rect.centery -= math.cos(self.angle) * self.__speed
+        # Меняем положение объектов в пространстве, запоминая положение
+        # до шага.
+        self.__prev_center = self.rect.center
+        prev_rect = self.rect.copy()
+        step = self.__speed * settings.SPEED_SCALE
+        self.rect.centerx -= math.sin(self.angle) * step
+        self.rect.centery -= math.cos(self.angle) * step
+        self.__swept_rect = self.rect.union(prev_rect)
 
     def rotate(self, new_rot: float) -> None:
         """
@@ -74,12 +127,48 @@ class Bullet(Collideable, pygame.sprite.Sprite):
         """
 
         self.rot = new_rot
-        # Получаем новый повернутый спрайт.
-        new_image = pygame.transform.rotate(self.image_orig, self.rot)
+        # Получаем повернутый спрайт из кеша поворотов.
+        rotation_cache = RotationCache()
+        rot_index = rotation_cache.get_step_index(self.rot)
         old_center = self.rect.center
-        self.image = new_image
-        self.image.set_colorkey(settings.Collors.BLACK.value)
+        self.image = rotation_cache.get_surface(self.image_orig, rot_index)
         self.rect = self.image.get_rect(center=old_center)
+        # Маска нужна для точной проверки столкновений и строится один раз
+        # на каждый шаг поворота снаряда.
+        self.mask = rotation_cache.get_mask(self.image_orig, rot_index)
+
+    def get_bounding_rect(self) -> pygame.Rect:
+        """
+        Геттер прямоугольника, по которому снаряд ищется в широкой фазе.
+
+        Покрывает весь путь снаряда за последний шаг.
+
+        :return: Объект прямоугольника.
+        """
+
+        return self.__swept_rect
+
+    def get_swept_segment(self) \
+            -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """
+        Геттер отрезка, который снаряд заметает за последний шаг.
+
+        Отрезок идет от хвоста снаряда в прошлом положении до носа снаряда
+        в текущем положении.
+
+        :return: Кортеж из начала и конца отрезка.
+        """
+
+        half_height = self.__height / 2
+        direction_x = -math.sin(self.angle)
+        direction_y = -math.cos(self.angle)
+
+        start = (self.__prev_center[0] - direction_x * half_height,
+                 self.__prev_center[1] - direction_y * half_height)
+        end = (self.rect.centerx + direction_x * half_height,
+               self.rect.centery + direction_y * half_height)
+
+        return start, end
 
     def get_damage(self) -> int:
         """
@@ -0,0 +1,142 @@
+"""Модуль камеры, через которую игровой мир выводится на экран"""
+
+import pygame
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class Camera:
+    """
+    Камера игрового мира.
+
+    Игровой мир может быть больше экрана. Камера задает видимую на экране
+    область мира и переводит координаты мира в координаты экрана и обратно.
+    """
+
+    def __init__(
+            self,
+            view_width: int,
+            view_height: int,
+            world_width: int,
+            world_height: int,
+    ) -> None:
+        """
+        Инициализатор класса.
+
+        :param view_width: Ширина видимой области (экрана) в px.
+        :param view_height: Высота видимой области (экрана) в px.
+        :param world_width: Ширина игрового мира в px.
+        :param world_height: Высота игрового мира в px.
+        """
+
+        self.__world_width = world_width
+        self.__world_height = world_height
+        # Видимая область в координатах мира.
+        self.__rect = pygame.Rect(0, 0, view_width, view_height)
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Геттер видимой области.
+
+        :return: Прямоугольник видимой области в координатах мира.
+        """
+
+        return self.__rect
+
+    def get_offset(self) -> Tuple[int, int]:
+        """
+        Геттер смещения камеры.
+
+        :return: Координаты левого верхнего угла видимой области в мире.
+        """
+
+        return self.__rect.topleft
+
+    def follow(self, center: Tuple[float, float]) -> None:
+        """
+        Перемещение камеры так, чтобы точка была в центре экрана.
+
+        Камера не выходит за границы мира. Если мир меньше экрана, камера
+        стоит в его левом верхнем углу.
+
+        :param center: Точка в координатах мира.
+        """
+
+        rect = self.__rect
+        rect.center = round(center[0]), round(center[1])
+        rect.left = max(0, min(rect.left, self.__world_width - rect.width))
+        rect.top = max(0, min(rect.top, self.__world_height - rect.height))
+
+    def is_visible(self, rect: pygame.Rect) -> bool:
+        """
+        Проверка видимости прямоугольника.
+
+        :param rect: Прямоугольник в координатах мира.
+        :return: True, если прямоугольник попадает на экран, иначе False.
+        """
+
+        return self.__rect.colliderect(rect)
+
+    def to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Перевод прямоугольника из координат мира в координаты экрана.
+
+        :param rect: Прямоугольник в координатах мира.
+        :return: Новый прямоугольник в координатах экрана.
+        """
+
+        return rect.move(-self.__rect.left, -self.__rect.top)
+
+    def to_world(self, point: Tuple[float, float]) -> Tuple[float, float]:
+        """
+        Перевод точки из координат экрана в координаты мира.
+
+        :param point: Точка в координатах экрана.
+        :return: Точка в координатах мира.
+        """
+
+        return point[0] + self.__rect.left, point[1] + self.__rect.top
+
+    def draw(
+            self,
+            screen: pygame.Surface,
+            sprites: Iterable[pygame.sprite.Sprite],
+            offset: Optional[Tuple[int, int]] = None,
+            shifts: Optional[Dict[pygame.sprite.Sprite,
+                                  Tuple[int, int]]] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Отрисовка спрайтов со смещением камеры.
+
+        :param screen: Экран, на который нужно рисовать.
+        :param sprites: Спрайты, чьи прямоугольники заданы в координатах мира.
+        :param offset: Смещение камеры. None - текущее смещение камеры.
+        :param shifts:
+            Сдвиги, с которыми нужно нарисовать отдельные спрайты
+            относительно их прямоугольников.
+        :return: Список нарисованных областей в координатах экрана.
+        """
+
+        if offset is None:
+            offset = self.get_offset()
+        offset_x, offset_y = -offset[0], -offset[1]
+        if not shifts:
+            return screen.blits([
+                (sprite.image, sprite.rect.move(offset_x, offset_y))
+                for sprite in sprites
+            ])
+
+        blit_sequence = []
+        for sprite in sprites:
+            shift_x, shift_y = shifts.get(sprite, (0, 0))
+            blit_sequence.append((
+                sprite.image,
+                sprite.rect.move(offset_x + shift_x, offset_y + shift_y),
+            ))
+
+        return screen.blits(blit_sequence)
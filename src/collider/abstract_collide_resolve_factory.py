@@ -4,9 +4,17 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from typing import (
+    Callable,
+    Optional,
+    Tuple,
+)
 
 from .collideable import Collideable
-from .resolves import AbstractCollideResolve
+
+
+# Функция решения коллизии двух объектов.
+ResolveFunction = Callable[[Collideable, Collideable], None]
 
 
 class AbstractCollideResolveFactory(ABC):
@@ -14,6 +22,6 @@ class AbstractCollideResolveFactory(ABC):
 
     @classmethod
     @abstractmethod
-    def create_resolve(cls, obj_1: Collideable , obj_2: Collideable) \
-            -> AbstractCollideResolve:
+    def get_resolve(cls, obj_1: Collideable, obj_2: Collideable) \
+            -> Tuple[Optional[ResolveFunction], bool]:
         pass
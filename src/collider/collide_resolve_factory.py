@@ -1,10 +1,17 @@
 """Модуль фабрики решений столкновений"""
 
-from typing import Optional
+from typing import (
+    Optional,
+    Dict,
+    Tuple,
+)
 
 from . import resolves
 from .collideable import Collideable
-from .abstract_collide_resolve_factory import AbstractCollideResolveFactory
+from .abstract_collide_resolve_factory import (
+    AbstractCollideResolveFactory,
+    ResolveFunction,
+)
 
 
 class CollideResolveFactory(AbstractCollideResolveFactory):
@@ -20,22 +27,55 @@ class CollideResolveFactory(AbstractCollideResolveFactory):
         resolves.PowerupPlayerCollideResolve,
     ]
 
+    # Таблица диспетчеризации решений.
+    # Ключи - пары классов объектов, значения - функция решения и признак
+    # того, что объекты нужно передать в решение в обратном порядке. Для пар
+    # без решения хранится (None, False). Таблица заполняется лениво, при
+    # первой встрече очередной пары классов.
+    __dispatch_table: Dict[
+        Tuple[type, type],
+        Tuple[Optional[ResolveFunction], bool],
+    ] = {}
+
     @classmethod
-    def create_resolve(cls, obj_1: Collideable, obj_2: Collideable) \
-            -> Optional[resolves.AbstractCollideResolve]:
+    def get_resolve(cls, obj_1: Collideable, obj_2: Collideable) \
+            -> Tuple[Optional[ResolveFunction], bool]:
         """
-        Создание объекта решения коллизии двух объектов.
+        Получение функции решения коллизии двух объектов.
 
         Решение определяется, когда классы двух объектов
         совпадают с классами объектов в очередном решении.
 
         :param obj_1: Объект 1.
         :param obj_2: Объект 2.
-        :return: Объект решения коллизии двух объектов Либо None.
+        :return:
+            Кортеж из функции решения коллизии (либо None) и признака того,
+            что объекты нужно передать в функцию в обратном порядке.
         """
 
         object_types = (type(obj_1), type(obj_2))
 
+        # Ищем решение в таблице диспетчеризации. Если пара классов
+        # встретилась впервые, находим решение и запоминаем его.
+        dispatch = cls.__dispatch_table.get(object_types)
+        if dispatch is None:
+            dispatch = cls._find_resolve(object_types)
+            cls.__dispatch_table[object_types] = dispatch
+
+        return dispatch
+
+    @classmethod
+    def _find_resolve(cls, object_types: Tuple[type, type]) \
+            -> Tuple[Optional[ResolveFunction], bool]:
+        """
+        Поиск решения для пары классов объектов.
+
+        :param object_types: Кортеж с классами объектов.
+        :return:
+            Кортеж из функции решения (либо None) и признака того, что
+            объекты нужно поменять местами.
+        """
+
         # TODO:
         #  Подумать над тем, чтобы сделать список решений вместо return.
         #  Это может пригодиться, когда может сработать более одного
@@ -44,15 +84,15 @@ class CollideResolveFactory(AbstractCollideResolveFactory):
         # объектов, с которыми работает очередное решение.
         for resolve in cls.__allowed_resolves:
             resolve_types = resolve.get_object_types()
+            # Если типы совпали сразу.
+            if cls._check_types(resolve_types, object_types):
+                return resolve.resolve, False
             # Если типы не равны, возможно, их нужно поменять местами.
-            if not cls._check_types(resolve_types, object_types):
-                object_types_tmp = object_types[1], object_types[0]
-                # Если после замены местами типы совпадают, решаем коллизию.
-                if cls._check_types(resolve_types, object_types_tmp):
-                    return resolve(obj_2, obj_1)
-            else:
-                # Если типы совпали сразу.
-                return resolve(obj_1, obj_2)
+            object_types_tmp = object_types[1], object_types[0]
+            if cls._check_types(resolve_types, object_types_tmp):
+                return resolve.resolve, True
+
+        return None, False
 
     @staticmethod
     def _check_types(resolve_types: tuple, object_types: tuple) -> bool:
@@ -20,14 +20,19 @@ class CollideResolver:
         """
         Метод разрешения коллизий двух объектов.
 
-        Нужное решение генерируется в фабрике на основе
+        Нужное решение выбирается в фабрике на основе
         классов объектов.
 
         :param obj_1: Объект 1.
         :param obj_2: Объект 2.
         """
 
-        # Создаем нужное решение для двух объектов.
-        current_resolve = self.__collide_resolve_factory.create_resolve(obj_1, obj_2)
-        if current_resolve:
-            current_resolve.resolve()
+        # Получаем нужное решение для двух объектов. Решение - это функция,
+        # поэтому на каждую пару объектов ничего не создается.
+        resolve, swapped = self.__collide_resolve_factory.get_resolve(obj_1, obj_2)
+        if resolve is None:
+            return
+        if swapped:
+            resolve(obj_2, obj_1)
+        else:
+            resolve(obj_1, obj_2)
@@ -1,5 +1,6 @@
 """Модуль интерфейса сталкивающихся объектов"""
 
+import pygame
 from abc import ABC
 
 
@@ -10,4 +11,14 @@ class Collideable(ABC):
     Этим классом можно помечать объекты, которые могут сталкиваться.
     """
 
-    pass
+    def get_bounding_rect(self) -> pygame.Rect:
+        """
+        Геттер прямоугольника, по которому объект ищется в широкой фазе.
+
+        По умолчанию это прямоугольник спрайта. Быстрые объекты могут
+        расширять его на весь путь за последний шаг.
+
+        :return: Объект прямоугольника.
+        """
+
+        return self.rect
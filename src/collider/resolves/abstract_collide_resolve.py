@@ -6,13 +6,19 @@ from abc import (
 
 
 class AbstractCollideResolve(ABC):
-    """Абстрактный класс разрешения коллизии"""
+    """
+    Абстрактный класс разрешения коллизии.
+
+    Решения не хранят состояния и не создают объектов: фабрика отдает
+    функцию resolve, которая вызывается напрямую для пары объектов.
+    """
 
     @staticmethod
     @abstractmethod
     def get_object_types() -> Tuple[object, object]:
         pass
 
+    @staticmethod
     @abstractmethod
-    def resolve(self) -> None:
+    def resolve(obj_1: object, obj_2: object) -> None:
         pass
@@ -1,29 +1,18 @@
 import pygame
-import random
 from typing import Tuple
 
-import settings
+from assets import Assets
 from bullets.bullet import Bullet
 from animations.explosion import Explosion
 from global_game_objects import GlobalGameObjects
 from asteroids.asteroid import Asteroid
+from utils.geometry import segment_circle_intersect
 from .abstract_collide_resolve import AbstractCollideResolve
 
 
 class AsteroidBulletCollideResolve(AbstractCollideResolve):
     """Класс для разрешения коллизий игрока с астероидом"""
 
-    def __init__(self, asteroid: Asteroid, bullet: Bullet) -> None:
-        """
-        Инициализатор класса.
-
-        :param asteroid: Объект астероида.
-        :param bullet: Снаряд игрока.
-        """
-
-        self.__asteroid = asteroid
-        self.__bullet = bullet
-
     @staticmethod
     def get_object_types() -> Tuple[object, object]:
         """
@@ -35,39 +24,67 @@ class AsteroidBulletCollideResolve(AbstractCollideResolve):
 
         return Asteroid, Bullet
 
-    def resolve(self) -> None:
-        """Обработка столкновения двух объектов"""
-
-        if pygame.sprite.collide_mask(self.__bullet, self.__asteroid):
-            game_objects = GlobalGameObjects()
-
-            self.__bullet.kill()
-            game_objects.quadtree.remove(self.__bullet)
+    @staticmethod
+    def resolve(obj_1: Asteroid, obj_2: Bullet) -> None:
+        """
+        Обработка столкновения двух объектов.
 
-            self.__asteroid.health -= self.__bullet.get_damage()
+        :param obj_1: Объект астероида.
+        :param obj_2: Снаряд игрока.
+        """
 
-            # Анимация взрыва при попадании в астероид.
-            random.choice(settings.expl_sounds).play()
-            exp = Explosion(self.__bullet.rect.center, self.__bullet.get_height())
+        asteroid, bullet = obj_1, obj_2
+
+        # Сначала отбрасываем заведомо далекие объекты дешевой проверкой
+        # прямоугольников. Прямоугольник снаряда покрывает весь его путь за
+        # последний шаг.
+        if not bullet.get_bounding_rect().colliderect(asteroid.rect):
+            return
+        # Проверяем путь снаряда за шаг против круга астероида. Так быстрый
+        # снаряд не пролетит маленький астероид насквозь между кадрами.
+        start, end = bullet.get_swept_segment()
+        if not segment_circle_intersect(
+                start, end, asteroid.rect.center,
+                asteroid.radius + bullet.get_width() / 2,
+        ):
+            return
+        # Если снаряд сейчас перекрывает астероид, уточняем попадание по
+        # маскам. Иначе снаряд пролетел астероид за шаг, это попадание.
+        if bullet.rect.colliderect(asteroid.rect) \
+                and not pygame.sprite.collide_mask(bullet, asteroid):
+            return
+
+        game_objects = GlobalGameObjects()
+
+        bullet.kill()
+        game_objects.broadphase.remove(bullet)
+
+        asteroid.health -= bullet.get_damage()
+
+        # Анимация взрыва при попадании в астероид.
+        game_objects.random.get('effects') \
+            .choice(Assets().expl_sounds).play()
+        exp = Explosion.acquire(bullet.rect.center, bullet.get_height())
+        game_objects.explosions_group.add(exp)
+
+        if asteroid.health <= 0:
+            asteroid.kill()
+            game_objects.broadphase.remove(asteroid)
+
+            # Начисляем игроку очки.
+            if len(game_objects.players_group.sprites()) > 0:
+                game_objects.players_group.sprites()[0].score \
+                    += asteroid.get_reward()
+
+            # Разбиваем астероид на два меньших.
+            if asteroid.radius >= asteroid.get_min_size():
+                new_asteroids = asteroid.split_asteroid()
+                for new_asteroid in new_asteroids:
+                    game_objects.asteroids_group.add(new_asteroid)
+
+            # Создаем анимацию взрыва на месте астероида.
+            game_objects.random.get('effects') \
+                .choice(Assets().expl_sounds).play()
+            exp = Explosion.acquire(asteroid.rect.center,
+                                    asteroid.radius * 2.2)
             game_objects.explosions_group.add(exp)
-
-            if self.__asteroid.health <= 0:
-                self.__asteroid.kill()
-                game_objects.quadtree.remove(self.__asteroid)
-
-                # Начисляем игроку очки.
-                if len(game_objects.players_group.sprites()) > 0:
-                    game_objects.players_group.sprites()[0].score \
-                        += self.__asteroid.get_reward()
-
-                # Разбиваем астероид на два меньших.
-                if self.__asteroid.radius >= self.__asteroid.get_min_size():
-                    new_asteroids = self.__asteroid.split_asteroid()
-                    for asteroid in new_asteroids:
-                        game_objects.asteroids_group.add(asteroid)
-
-                # Создаем анимацию взрыва на месте астероида.
-                random.choice(settings.expl_sounds).play()
-                exp = Explosion(self.__asteroid.rect.center,
-                                self.__asteroid.radius * 2.2)
-                game_objects.explosions_group.add(exp)
@@ -1,6 +1,7 @@
 import math
 from typing import Tuple
 
+import settings
 from asteroids.asteroid import Asteroid
 from .abstract_collide_resolve import AbstractCollideResolve
 
@@ -8,17 +9,6 @@ from .abstract_collide_resolve import AbstractCollideResolve
 class AsteroidCollideResolve(AbstractCollideResolve):
     """Класс для разрешения столкновений астероидов"""
 
-    def __init__(self, asteroid_1: Asteroid, asteroid_2: Asteroid) -> None:
-        """
-        Инициализатор класса.
-
-        :param asteroid_1: Астероид 1.
-        :param asteroid_2: Астероид 2.
-        """
-
-        self.__asteroid_1 = asteroid_1
-        self.__asteroid_2 = asteroid_2
-
     @staticmethod
     def get_object_types() -> Tuple[object, object]:
         """
@@ -31,64 +21,71 @@ class AsteroidCollideResolve(AbstractCollideResolve):
 
         return Asteroid, Asteroid
 
-    def resolve(self) -> None:
-        """Обработка столкновения объекта с другим объектом"""
+    @staticmethod
+    def resolve(obj_1: Asteroid, obj_2: Asteroid) -> None:
+        """
+        Обработка столкновения объекта с другим объектом.
+
+        :param obj_1: Астероид 1.
+        :param obj_2: Астероид 2.
+        """
+
+        asteroid_1, asteroid_2 = obj_1, obj_2
 
         # Проверять коллизию шара с самим с собой не имеет смысла.
-        if self.__asteroid_1 is not self.__asteroid_2:
-            dx = self.__asteroid_1.pos_x - self.__asteroid_2.pos_x
-            dy = self.__asteroid_1.pos_y - self.__asteroid_2.pos_y
+        if asteroid_1 is not asteroid_2:
+            dx = asteroid_1.pos_x - asteroid_2.pos_x
+            dy = asteroid_1.pos_y - asteroid_2.pos_y
 
             # Дистанция между границами объектов.
             distance = math.hypot(dx, dy)
 
-            # Если шары столкнулись при следующем шаге.
-            new_x_1 = self.__asteroid_1.pos_x + self.__asteroid_1.speed \
-                      * math.sin(self.__asteroid_1.angle)
-            new_y_1 = self.__asteroid_1.pos_y - self.__asteroid_1.speed \
-                      * math.cos(self.__asteroid_1.angle)
-            new_x_2 = self.__asteroid_2.pos_x + self.__asteroid_2.speed \
-                      * math.sin(self.__asteroid_2.angle)
-            new_y_2 = self.__asteroid_2.pos_y - self.__asteroid_2.speed \
-                      * math.cos(self.__asteroid_2.angle)
+            # Если шары столкнулись при следующем шаге. Смещение за шаг
+            # считается так же, как при движении астероидов.
+            step_1 = asteroid_1.speed * settings.SPEED_SCALE
+            step_2 = asteroid_2.speed * settings.SPEED_SCALE
+            new_x_1 = asteroid_1.pos_x + step_1 * math.sin(asteroid_1.angle)
+            new_y_1 = asteroid_1.pos_y - step_1 * math.cos(asteroid_1.angle)
+            new_x_2 = asteroid_2.pos_x + step_2 * math.sin(asteroid_2.angle)
+            new_y_2 = asteroid_2.pos_y - step_2 * math.cos(asteroid_2.angle)
             new_distance = math.sqrt((new_x_1 - new_x_2) ** 2
                                      + (new_y_1 - new_y_2) ** 2)
 
             # Проверка на приближение объектов.
-            if self.__asteroid_1.radius + self.__asteroid_2.radius > new_distance:
+            if asteroid_1.radius + asteroid_2.radius > new_distance:
                 # Угол столкновения объектов.
                 angle = math.atan2(dy, dx) + 0.5 * math.pi
                 # Общая масса двух объектов.
-                total_mass = self.__asteroid_1.get_weight() \
-                             + self.__asteroid_2.get_weight()
+                total_mass = asteroid_1.get_weight() \
+                             + asteroid_2.get_weight()
 
                 # Вычисляем новые скорости с учетом масс объектов.
                 new_speed_1 = \
-                    (self.__asteroid_1.speed *
-                     (self.__asteroid_1.get_weight()
-                      - self.__asteroid_2.get_weight())
-                     + 2 * self.__asteroid_2.get_weight()
-                     * self.__asteroid_2.speed) / total_mass
+                    (asteroid_1.speed *
+                     (asteroid_1.get_weight()
+                      - asteroid_2.get_weight())
+                     + 2 * asteroid_2.get_weight()
+                     * asteroid_2.speed) / total_mass
                 new_speed_2 = \
-                    (self.__asteroid_2.speed *
-                     (self.__asteroid_2.get_weight()
-                      - self.__asteroid_1.get_weight())
-                     + 2 * self.__asteroid_1.get_weight()
-                     * self.__asteroid_1.speed) / total_mass
+                    (asteroid_2.speed *
+                     (asteroid_2.get_weight()
+                      - asteroid_1.get_weight())
+                     + 2 * asteroid_1.get_weight()
+                     * asteroid_1.speed) / total_mass
 
                 # Меняем векторы скорости
-                self.__asteroid_1.speed, self.__asteroid_2.speed = \
+                asteroid_1.speed, asteroid_2.speed = \
                     new_speed_1, new_speed_2
 
                 # Меняем углы движений объектов.
-                self.__asteroid_1.angle += angle
-                self.__asteroid_2.angle += angle + math.pi
+                asteroid_1.angle += angle
+                asteroid_2.angle += angle + math.pi
 
                 # Чтобы объекты не слипались, высчитываем перекрытие их
                 # друг другом и отодвигаем еще на 2px.
-                overlap = 0.5 * (self.__asteroid_1.radius
-                                 + self.__asteroid_2.radius - distance + 2)
-                self.__asteroid_1.pos_x += math.sin(angle) * overlap
-                self.__asteroid_1.pos_y -= math.cos(angle) * overlap
-                self.__asteroid_2.pos_x -= math.sin(angle) * overlap
-                self.__asteroid_2.pos_y += math.cos(angle) * overlap
+                overlap = 0.5 * (asteroid_1.radius
+                                 + asteroid_2.radius - distance + 2)
+                asteroid_1.pos_x += math.sin(angle) * overlap
+                asteroid_1.pos_y -= math.cos(angle) * overlap
+                asteroid_2.pos_x -= math.sin(angle) * overlap
+                asteroid_2.pos_y += math.cos(angle) * overlap
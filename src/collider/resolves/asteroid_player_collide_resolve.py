@@ -1,8 +1,7 @@
 import pygame
-import random
 from typing import Tuple
 
-import settings
+from assets import Assets
 from player import Player
 from animations.explosion import Explosion
 from global_game_objects import GlobalGameObjects
@@ -13,17 +12,6 @@ from .abstract_collide_resolve import AbstractCollideResolve
 class AsteroidPlayerCollideResolve(AbstractCollideResolve):
     """Класс для разрешения коллизий игрока с астероидом"""
 
-    def __init__(self, player: Player, asteroid: Asteroid) -> None:
-        """
-        Инициализатор класса.
-
-        :param player: Объект игрока.
-        :param asteroid: Объект астероида.
-        """
-
-        self.__player = player
-        self.__asteroid = asteroid
-
     @staticmethod
     def get_object_types() -> Tuple[object, object]:
         """
@@ -36,36 +24,45 @@ class AsteroidPlayerCollideResolve(AbstractCollideResolve):
 
         return Player, Asteroid
 
-    def resolve(self) -> None:
-        """Обработка столкновения двух объектов"""
+    @staticmethod
+    def resolve(obj_1: Player, obj_2: Asteroid) -> None:
+        """
+        Обработка столкновения двух объектов.
+
+        :param obj_1: Объект игрока.
+        :param obj_2: Объект астероида.
+        """
+
+        player, asteroid = obj_1, obj_2
 
-        if pygame.sprite.collide_circle(self.__player, self.__asteroid):
+        if pygame.sprite.collide_circle(player, asteroid):
             game_objects = GlobalGameObjects()
 
             # Отнимаем жизни игрока.
-            self.__player.health -= self.__asteroid.radius
-            if self.__player.health <= 0:
-                self.__player.health = 0
-                self.__player.status = Player.Status.DEACTIVATED
-                self.__player.kill()
-                game_objects.quadtree.remove(self.__player)
-                game_objects.active_powerups_manager.unregister_player(self.__player)
+            player.health -= asteroid.radius
+            if player.health <= 0:
+                player.health = 0
+                player.status = Player.Status.DEACTIVATED
+                player.kill()
+                game_objects.broadphase.remove(player)
+                game_objects.active_powerups_manager.unregister_player(player)
 
                 # Создаем анимацию взрыва на месте игрока.
-                settings.chunky_expl.play()
-                exp = Explosion(self.__player.rect.center,
-                                self.__player.radius * 15,
-                                frame_rate=150)
+                Assets().chunky_expl.play()
+                exp = Explosion.acquire(player.rect.center,
+                                        player.radius * 15,
+                                        frame_rate=150)
                 game_objects.explosions_group.add(exp)
 
-            self.__asteroid.kill()
-            game_objects.quadtree.remove(self.__asteroid)
-            if self.__asteroid.radius >= self.__asteroid.get_min_size():
-                new_asteroids = self.__asteroid.split_asteroid()
-                for asteroid in new_asteroids:
-                    game_objects.asteroids_group.add(asteroid)
+            asteroid.kill()
+            game_objects.broadphase.remove(asteroid)
+            if asteroid.radius >= asteroid.get_min_size():
+                new_asteroids = asteroid.split_asteroid()
+                for new_asteroid in new_asteroids:
+                    game_objects.asteroids_group.add(new_asteroid)
 
             # Создаем анимацию взрыва на месте астероида.
-            random.choice(settings.expl_sounds).play()
-            exp = Explosion(self.__asteroid.rect.center, self.__asteroid.radius * 2.2)
+            game_objects.random.get('effects') \
+                .choice(Assets().expl_sounds).play()
+            exp = Explosion.acquire(asteroid.rect.center, asteroid.radius * 2.2)
             game_objects.explosions_group.add(exp)
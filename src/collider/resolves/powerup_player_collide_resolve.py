@@ -10,17 +10,6 @@ from .abstract_collide_resolve import AbstractCollideResolve
 class PowerupPlayerCollideResolve(AbstractCollideResolve):
     """Класс решения столкновения усиления и игрока"""
 
-    def __init__(self, powerup: Powerup, player: Player) -> None:
-        """
-        Инициализатор класса.
-
-        :param powerup: Объект усиления.
-        :param player: Объект игрока.
-        """
-
-        self.__powerup = powerup
-        self.__player = player
-
     @staticmethod
     def get_object_types() -> Tuple[object, object]:
         """
@@ -33,13 +22,25 @@ class PowerupPlayerCollideResolve(AbstractCollideResolve):
 
         return Powerup, Player
 
-    def resolve(self) -> None:
-        """Обработка столкновения объектов"""
+    @staticmethod
+    def resolve(obj_1: Powerup, obj_2: Player) -> None:
+        """
+        Обработка столкновения объектов.
+
+        :param obj_1: Объект усиления.
+        :param obj_2: Объект игрока.
+        """
+
+        powerup, player = obj_1, obj_2
+
+        # Маски сравниваем, только если пересекаются прямоугольники.
+        if not player.rect.colliderect(powerup.rect):
+            return
 
-        if pygame.sprite.collide_mask(self.__player, self.__powerup):
-            self.__powerup.kill()
-            GlobalGameObjects().quadtree.remove(self.__powerup)
+        if pygame.sprite.collide_mask(player, powerup):
+            powerup.kill()
+            GlobalGameObjects().broadphase.remove(powerup)
             GlobalGameObjects().active_powerups_manager.add_powerup(
-                player=self.__player,
-                new_powerup=self.__powerup,
+                player=player,
+                new_powerup=powerup,
             )
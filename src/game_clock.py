@@ -0,0 +1,112 @@
+"""Модуль игровых часов"""
+
+import pygame
+
+import settings
+from utils.singleton import Singleton
+
+
+class GameClock(metaclass=Singleton):
+    """
+    Игровые часы.
+
+    Реализует паттерн Singleton. Отдает время симуляции в мс всем игровым
+    объектам, которым нужно время: генераторам, усилениям, анимациям и
+    игроку. Время обновляется один раз за шаг симуляции методом tick, а в
+    течение шага не меняется.
+
+    Часы работают в одном из режимов:
+        - REAL - время симуляции равно времени pygame;
+        - FIXED - каждый шаг симуляции добавляет ко времени длительность
+          шага, независимо от того, сколько времени он занял на самом деле;
+        - FAST_FORWARD - как FIXED, но игровой цикл выполняет шаги в
+          заданное количество раз чаще реального времени.
+    """
+
+    def __init__(
+            self,
+            mode: settings.ClockMode = settings.CLOCK_MODE,
+            step_time: float = 1000 / settings.SIMULATION_RATE,
+            speed: float = settings.FAST_FORWARD_SPEED,
+    ) -> None:
+        """
+        Инициализатор класса.
+
+        :param mode: Режим часов.
+        :param step_time: Длительность шага симуляции в мс.
+        :param speed:
+            Во сколько раз время симуляции идет быстрее реального в режиме
+            FAST_FORWARD.
+        """
+
+        assert step_time > 0
+        assert speed > 0
+
+        self.__mode = mode
+        self.__step_time = step_time
+        self.__speed = speed if mode == settings.ClockMode.FAST_FORWARD \
+            else 1.0
+        self.__ticks = 0
+        self.__time = self._read_time()
+
+    def tick(self) -> float:
+        """
+        Переход к следующему шагу симуляции.
+
+        :return: Время симуляции нового шага в мс.
+        """
+
+        self.__ticks += 1
+        self.__time = self._read_time()
+
+        return self.__time
+
+    def get_time(self) -> float:
+        """
+        Геттер времени симуляции текущего шага.
+
+        :return: Время в мс.
+        """
+
+        return self.__time
+
+    def get_ticks(self) -> int:
+        """
+        Геттер количества шагов симуляции.
+
+        :return: Целое число, количество шагов.
+        """
+
+        return self.__ticks
+
+    def get_mode(self) -> settings.ClockMode:
+        """
+        Геттер режима часов.
+
+        :return: Режим часов.
+        """
+
+        return self.__mode
+
+    def get_speed(self) -> float:
+        """
+        Геттер скорости хода времени симуляции относительно реального.
+
+        :return: Вещественное число, множитель скорости.
+        """
+
+        return self.__speed
+
+    def _read_time(self) -> float:
+        """
+        Вычисление времени симуляции текущего шага.
+
+        :return: Время в мс.
+        """
+
+        if self.__mode == settings.ClockMode.REAL:
+            return pygame.time.get_ticks()
+
+        # Время считается от количества шагов, а не суммой длительностей,
+        # чтобы ошибки округления не накапливались.
+        return self.__ticks * self.__step_time
@@ -1,7 +1,5 @@
 """Модуль генератора астероидов"""
 
-import pygame
-import random
 from typing import (
     List,
     Optional,
@@ -12,6 +10,8 @@ from asteroids.asteroid import (
     AsteroidType,
 )
 from levels.abstract_managing_levels import ManagingLevels
+from game_clock import GameClock
+from global_game_objects import GlobalGameObjects
 
 
 class AsteroidsGenerator(ManagingLevels):
@@ -42,7 +42,7 @@ class AsteroidsGenerator(ManagingLevels):
 
         assert len(asteroid_types) != 0
 
-        self.__last_asteroid_spawn = pygame.time.get_ticks()
+        self.__last_asteroid_spawn = GameClock().get_time()
         self.__start_frequency = start_frequency
         self.__end_frequency = end_frequency
         self.__current_frequency = start_frequency
@@ -62,12 +62,13 @@ class AsteroidsGenerator(ManagingLevels):
         :return: Объект астероида либо None.
         """
 
-        now = pygame.time.get_ticks()
+        now = GameClock().get_time()
         if now - self.__last_asteroid_spawn >= self.__current_frequency:
             self.__last_asteroid_spawn = now
 
             # Создаем астероид случайного типа.
-            asteroid_type = random.choice(self.__asteroid_types)
+            asteroid_type = GlobalGameObjects().random.get('asteroids') \
+                .choice(self.__asteroid_types)
             new_asteroid = asteroid_type.create_asteroid()
 
             return new_asteroid
@@ -1,7 +1,5 @@
 """Модуль генератора усилений"""
 
-import pygame
-import random
 from typing import Optional
 
 from levels.abstract_managing_levels import ManagingLevels
@@ -11,6 +9,8 @@ from powerups import (
     SpeedPowerup,
     HealthPowerup,
 )
+from game_clock import GameClock
+from global_game_objects import GlobalGameObjects
 
 
 class PowerupsGenerator(ManagingLevels):
@@ -37,7 +37,7 @@ class PowerupsGenerator(ManagingLevels):
         :param max_level: Максимальный уровень генератора.
         """
 
-        self.__last_asteroid_spawn = pygame.time.get_ticks()
+        self.__last_asteroid_spawn = GameClock().get_time()
 
         self.__start_level = 0
         self.__max_level = max_level
@@ -55,10 +55,11 @@ class PowerupsGenerator(ManagingLevels):
         :return: Объект усиления либо None.
         """
 
-        now = pygame.time.get_ticks()
+        now = GameClock().get_time()
         if now - self.__last_asteroid_spawn >= self.__current_frequency:
             self.__last_asteroid_spawn = now
-            random_powerup = random.choice(self.__powerups_classes)()
+            random_powerup = GlobalGameObjects().random.get('powerups') \
+                .choice(self.__powerups_classes)()
 
             return random_powerup
 
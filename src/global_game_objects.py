@@ -4,6 +4,11 @@ import pygame
 
 import settings
 from quadtree import Quadtree
+from spatial_hash import SpatialHash
+from camera import Camera
+from game_clock import GameClock
+from random_streams import RandomStreams
+from abstract_broadphase import AbstractBroadphase
 from utils.singleton import Singleton
 from utils.geometry import (
     Area,
@@ -19,42 +24,93 @@ class GlobalGameObjects(metaclass=Singleton):
     Реализует паттерн Singleton. Предоставляет в проекте глобальную точку
     получения всех необходимых игровых объектов.
 
-    Хранит в себе группы спрайтов, квадродерево и другие игровые объекты,
-    к которым необходим доступ из любой точки программы.
+    Хранит в себе группы спрайтов, широкую фазу столкновений и другие
+    игровые объекты, к которым необходим доступ из любой точки программы.
     """
 
-    def __init__(self) -> None:
-        """Инициализатор класса"""
-
-        # Создаем квадродерево.
-        # Задаем начальный сектор и разброс поиска (в px).
-        # Квадродерево необходимо для обнаружения столкновений объектов.
-        self.__quadtree = Quadtree(
-            area=Area(
-                top_left=Point(0, 0),
-                bottom_right=Point(settings.WIDTH, settings.HEIGHT),
-            ),
-            search_accuracy=50,
-        )
+    def __init__(self, max_object_radius: int = 50) -> None:
+        """
+        Инициализатор класса.
+
+        :param max_object_radius:
+            Радиус самого большого объекта в px. Задает размер ячеек
+            пространственного хеша.
+        """
+
+        # Создаем широкую фазу столкновений в зависимости от настроек.
+        # Она необходима для обнаружения столкновений объектов.
+        if settings.BROADPHASE == settings.Broadphase.SPATIAL_HASH:
+            # Ячейка вмещает самый большой объект целиком, поэтому любой
+            # объект лежит не более чем в 4 ячейках.
+            self.__broadphase: AbstractBroadphase = SpatialHash(
+                cell_size=max_object_radius * 2,
+            )
+        else:
+            # Задаем начальный сектор и разброс поиска (в px).
+            self.__broadphase = Quadtree(
+                area=Area(
+                    top_left=Point(0, 0),
+                    bottom_right=Point(
+                        settings.WORLD_WIDTH,
+                        settings.WORLD_HEIGHT,
+                    ),
+                ),
+                search_accuracy=50,
+            )
 
         # Создаем группы объектов.
         # В них будут помещаться все игровые объекты.
         self.__players_group = pygame.sprite.Group()
         self.__bullets_group = pygame.sprite.Group()
-        self.__asteroids_group = pygame.sprite.Group()
+        if settings.USE_ASTEROID_FIELD:
+            # NumPy нужен только для этого режима, поэтому хранилище
+            # импортируется только при его включении.
+            from asteroids.asteroid_field import (
+                AsteroidField,
+                AsteroidFieldGroup,
+            )
+            self.__asteroids_group = AsteroidFieldGroup(AsteroidField())
+        else:
+            self.__asteroids_group = pygame.sprite.Group()
         self.__explosions_group = pygame.sprite.Group()
         self.__powerups_group = pygame.sprite.Group()
 
+        # Камера, через которую видимая часть мира выводится на экран.
+        self.__camera = Camera(
+            view_width=settings.WIDTH,
+            view_height=settings.HEIGHT,
+            world_width=settings.WORLD_WIDTH,
+            world_height=settings.WORLD_HEIGHT,
+        )
+
         # Менджер активных усилений.
         self.__active_powerups_manager = ActivePowerupsManager()
 
+        # Игровые часы, от которых идут все таймеры игры.
+        self.__clock = GameClock()
+
+        # Именованные потоки случайных чисел игрового мира.
+        self.__random = RandomStreams()
+
     @property
     def active_powerups_manager(self) -> ActivePowerupsManager:
         return self.__active_powerups_manager
 
     @property
-    def quadtree(self) -> Quadtree:
-        return self.__quadtree
+    def clock(self) -> GameClock:
+        return self.__clock
+
+    @property
+    def random(self) -> RandomStreams:
+        return self.__random
+
+    @property
+    def camera(self) -> Camera:
+        return self.__camera
+
+    @property
+    def broadphase(self) -> AbstractBroadphase:
+        return self.__broadphase
 
     @property
     def players_group(self) -> pygame.sprite.Group:
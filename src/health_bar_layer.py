@@ -0,0 +1,141 @@
+"""Модуль пакетной отрисовки полосок здоровья"""
+
+import pygame
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+import settings
+from assets import Assets
+from utils.text_cache import TextCache
+
+
+class HealthBarLayer:
+    """
+    Слой полосок здоровья.
+
+    Рисует полоски здоровья множества объектов за один проход: заливки
+    рисуются заливкой прямоугольников, а рамки и надписи - одним вызовом
+    blits. Рамка полоски рисуется один раз при создании слоя.
+
+    Объекты должны предоставлять свойства pos_x, pos_y, health, атрибут
+    radius и метод get_source_health.
+    """
+
+    def __init__(
+            self,
+            fill_color: settings.Collors,
+            bar_length: int = 45,
+            bar_height: int = 10,
+            skip_full_health: bool = True,
+            text_min_radius: int = 0,
+            text_max_count: Optional[int] = None,
+    ) -> None:
+        """
+        Инициализатор класса.
+
+        :param fill_color: Цвет заливки полоски.
+        :param bar_length: Длина полоски в px.
+        :param bar_height: Высота полоски в px.
+        :param skip_full_health:
+            Не рисовать полоски объектов с полным здоровьем.
+        :param text_min_radius:
+            Минимальный радиус объекта, у которого рисуется здоровье цифрами.
+        :param text_max_count:
+            Максимальное количество полосок, при котором рисуется здоровье
+            цифрами. None - без ограничения.
+        """
+
+        self.__fill_color = fill_color.value
+        self.__bar_length = bar_length
+        self.__bar_height = bar_height
+        self.__skip_full_health = skip_full_health
+        self.__text_min_radius = text_min_radius
+        self.__text_max_count = text_max_count
+
+        # Рамка полоски. Черный цвет внутри рамки прозрачный.
+        self.__frame = pygame.Surface((bar_length, bar_height)).convert()
+        self.__frame.fill(settings.Collors.BLACK.value)
+        pygame.draw.rect(
+            self.__frame,
+            settings.Collors.WHITE.value,
+            self.__frame.get_rect(),
+            2,
+        )
+        self.__frame.set_colorkey(settings.Collors.BLACK.value)
+
+    def draw(
+            self,
+            screen: pygame.Surface,
+            objects: Iterable,
+            offset: Tuple[int, int] = (0, 0),
+            shifts: Optional[Dict[Any, Tuple[int, int]]] = None,
+    ) -> List[pygame.Rect]:
+        """
+        Отрисовка полосок здоровья объектов.
+
+        :param screen: Экран, на который нужно рисовать.
+        :param objects: Объекты, чьи полоски нужно нарисовать.
+        :param offset: Смещение камеры, вычитаемое из координат полосок.
+        :param shifts:
+            Сдвиги, с которыми нужно нарисовать полоски отдельных объектов.
+        :return: Список прямоугольников нарисованных областей.
+        """
+
+        # Отбираем объекты, полоски которых нужно рисовать.
+        bars = []
+        for obj in objects:
+            health = obj.health
+            source_health = obj.get_source_health()
+            if self.__skip_full_health and health >= source_health:
+                continue
+            bars.append((obj, max(health, 0), source_health))
+
+        # При большом количестве полосок здоровье цифрами не рисуется.
+        draw_text = self.__text_max_count is None \
+            or len(bars) <= self.__text_max_count
+
+        bar_length = self.__bar_length
+        bar_height = self.__bar_height
+        text_cache = TextCache()
+        blit_sequence = []
+        drawn_rects = []
+        for obj, health, source_health in bars:
+            left = int(obj.pos_x - offset[0]) - bar_length // 2
+            top = int(obj.pos_y - offset[1] + obj.radius + 5)
+            if shifts:
+                shift_x, shift_y = shifts.get(obj, (0, 0))
+                left += shift_x
+                top += shift_y
+
+            screen.fill(
+                self.__fill_color,
+                (left, top, int(health * bar_length / source_health),
+                 bar_height),
+            )
+            blit_sequence.append((self.__frame, (left, top)))
+            bar_rect = pygame.Rect(left, top, bar_length, bar_height)
+
+            if draw_text and obj.radius >= self.__text_min_radius:
+                health_text = text_cache.render(
+                    Assets().health_font,
+                    f'{health}xp',
+                    True,
+                    settings.Collors.WHITE.value,
+                )
+                text_rect = health_text.get_rect(
+                    topleft=(left + bar_length + 1, top),
+                )
+                blit_sequence.append((health_text, text_rect))
+                bar_rect.union_ip(text_rect)
+
+            drawn_rects.append(bar_rect)
+
+        screen.blits(blit_sequence, doreturn=False)
+
+        return drawn_rects
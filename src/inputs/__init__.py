@@ -0,0 +1,24 @@
+"""Пакет источников ввода игрока"""
+
+from .abstract_input_source import (
+    InputSource,
+    InputState,
+)
+from .pygame_input_source import PygameInputSource
+from .bot_input_source import BotInputSource
+from .input_log import (
+    InputLogReader,
+    InputLogWriter,
+)
+from .replay_input_source import ReplayInputSource
+
+
+__all__ = [
+    InputSource,
+    InputState,
+    PygameInputSource,
+    BotInputSource,
+    InputLogReader,
+    InputLogWriter,
+    ReplayInputSource,
+]
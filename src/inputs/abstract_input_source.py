@@ -0,0 +1,63 @@
+"""Модуль абстрактного класса источника ввода"""
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import Tuple
+
+
+class InputState:
+    """
+    Состояние ввода игрока на одной итерации игрового цикла.
+
+    Хранит все, что игрок опрашивает для управления кораблем: позицию
+    курсора, нажатие кнопки стрельбы и нажатия клавиш движения.
+    """
+
+    def __init__(
+            self,
+            mouse_pos: Tuple[int, int] = (0, 0),
+            shooting: bool = False,
+            left: bool = False,
+            right: bool = False,
+            up: bool = False,
+            down: bool = False,
+    ) -> None:
+        """
+        Инициализатор класса.
+
+        :param mouse_pos: Позиция курсора в координатах экрана.
+        :param shooting: Нажата ли кнопка стрельбы.
+        :param left: Нажата ли клавиша движения влево.
+        :param right: Нажата ли клавиша движения вправо.
+        :param up: Нажата ли клавиша движения вверх.
+        :param down: Нажата ли клавиша движения вниз.
+        """
+
+        self.mouse_pos = mouse_pos
+        self.shooting = shooting
+        self.left = left
+        self.right = right
+        self.up = up
+        self.down = down
+
+
+class InputSource(ABC):
+    """
+    Абстрактный класс (интерфейс) источника ввода игрока.
+
+    Игровой цикл опрашивает источник один раз за итерацию и передает
+    полученное состояние игроку. Источником может быть мышь и клавиатура,
+    бот или записанная игра.
+    """
+
+    @abstractmethod
+    def poll(self) -> InputState:
+        """
+        Опрос источника ввода.
+
+        :return: Состояние ввода на текущей итерации.
+        """
+
+        pass
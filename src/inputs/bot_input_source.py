@@ -0,0 +1,64 @@
+"""Модуль источника ввода бота"""
+
+import random
+from typing import Optional
+
+import settings
+from .abstract_input_source import (
+    InputSource,
+    InputState,
+)
+
+
+class BotInputSource(InputSource):
+    """
+    Источник ввода бота.
+
+    Бот непрерывно стреляет и через заданное количество итераций выбирает
+    новую случайную точку прицеливания на экране и новое направление
+    движения. Нужен для игры без окна: нагрузочных тестов и замеров
+    производительности.
+    """
+
+    def __init__(self, change_interval: int = 30,
+                 seed: Optional[int] = None) -> None:
+        """
+        Инициализатор класса.
+
+        :param change_interval:
+            Количество итераций, через которое бот меняет прицел и
+            направление движения.
+        :param seed: Начальное значение генератора случайных чисел бота.
+        """
+
+        assert change_interval > 0
+
+        self.__change_interval = change_interval
+        self.__random = random.Random(seed)
+        self.__ticks = 0
+        self.__state = InputState(shooting=True)
+
+    def poll(self) -> InputState:
+        """
+        Опрос бота.
+
+        :return: Состояние ввода на текущей итерации.
+        """
+
+        if self.__ticks % self.__change_interval == 0:
+            horizontal = self.__random.choice((-1, 0, 1))
+            vertical = self.__random.choice((-1, 0, 1))
+            self.__state = InputState(
+                mouse_pos=(
+                    self.__random.randrange(settings.WIDTH),
+                    self.__random.randrange(settings.HEIGHT),
+                ),
+                shooting=True,
+                left=horizontal < 0,
+                right=horizontal > 0,
+                up=vertical < 0,
+                down=vertical > 0,
+            )
+        self.__ticks += 1
+
+        return self.__state
@@ -0,0 +1,216 @@
+"""Модуль двоичного журнала ввода игрока"""
+
+import struct
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .abstract_input_source import InputState
+
+
+class InputLogWriter:
+    """
+    Запись журнала ввода игрока.
+
+    Журнал хранит зерно потоков случайных чисел, частоту шагов симуляции и
+    состояние ввода на каждом шаге. Вместе с зерном этого достаточно, чтобы
+    повторить игру целиком. Кроме ввода, на каждом шаге можно записать хеш
+    состояния игрового мира, чтобы при повторе найти шаг, на котором игра
+    пошла иначе.
+
+    Формат файла: сигнатура, заголовок фиксированной длины и записи шагов
+    подряд. Запись шага - позиция курсора и битовая маска нажатых кнопок,
+    а при записи хешей еще и хеш состояния мира.
+    """
+
+    _signature = b'AIL1'
+    # Зерно, частота шагов симуляции и флаг записи хешей.
+    _header_format = '<qHB'
+    _record_format = '<hhB'
+    _hash_format = '<I'
+
+    # Биты маски нажатых кнопок.
+    _SHOOTING = 1
+    _LEFT = 2
+    _RIGHT = 4
+    _UP = 8
+    _DOWN = 16
+
+    def __init__(self, path: Path, seed: int, simulation_rate: int,
+                 record_hashes: bool = True) -> None:
+        """
+        Инициализатор класса.
+
+        :param path:
+            Путь до файла журнала. Существующий файл перезаписывается.
+        :param seed: Зерно потоков случайных чисел игрового мира.
+        :param simulation_rate: Количество шагов симуляции в секунду.
+        :param record_hashes: Записывать хеш состояния мира на каждом шаге.
+        """
+
+        self.__record_hashes = record_hashes
+        self.__file: Optional[BinaryIO] = open(path, 'wb')
+        self.__file.write(self._signature)
+        self.__file.write(struct.pack(
+            self._header_format,
+            seed,
+            simulation_rate,
+            record_hashes,
+        ))
+
+    def write(self, input_state: InputState,
+              state_hash: Optional[int] = None) -> None:
+        """
+        Запись одного шага.
+
+        :param input_state: Состояние ввода игрока на шаге.
+        :param state_hash:
+            Хеш состояния мира после шага. Нужен, только если журнал
+            записывает хеши.
+        """
+
+        record = struct.pack(
+            self._record_format,
+            input_state.mouse_pos[0],
+            input_state.mouse_pos[1],
+            self._pack_buttons(input_state),
+        )
+        if self.__record_hashes:
+            record += struct.pack(self._hash_format, state_hash)
+        self.__file.write(record)
+
+    def close(self) -> None:
+        """Закрытие файла журнала"""
+
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def is_recording_hashes(self) -> bool:
+        """
+        Проверка записи хешей состояния мира.
+
+        :return: True, если журнал записывает хеши, иначе False.
+        """
+
+        return self.__record_hashes
+
+    @classmethod
+    def _pack_buttons(cls, input_state: InputState) -> int:
+        """
+        Упаковка нажатых кнопок в битовую маску.
+
+        :param input_state: Состояние ввода игрока.
+        :return: Целое число, битовая маска.
+        """
+
+        return (
+            (cls._SHOOTING if input_state.shooting else 0)
+            | (cls._LEFT if input_state.left else 0)
+            | (cls._RIGHT if input_state.right else 0)
+            | (cls._UP if input_state.up else 0)
+            | (cls._DOWN if input_state.down else 0)
+        )
+
+
+class InputLogReader:
+    """
+    Чтение журнала ввода игрока.
+
+    Журнал читается в память целиком при открытии.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Инициализатор класса.
+
+        Если файл не является журналом ввода, выбрасывается ValueError.
+
+        :param path: Путь до файла журнала.
+        """
+
+        with open(path, 'rb') as file:
+            data = file.read()
+
+        signature = InputLogWriter._signature
+        if not data.startswith(signature):
+            raise ValueError(f'{path} is not an input log')
+
+        offset = len(signature)
+        self.__seed, self.__simulation_rate, has_hashes = \
+            struct.unpack_from(InputLogWriter._header_format, data, offset)
+        self.__has_hashes = bool(has_hashes)
+        offset += struct.calcsize(InputLogWriter._header_format)
+
+        record_format = InputLogWriter._record_format
+        if self.__has_hashes:
+            record_format += InputLogWriter._hash_format[1:]
+        # Обрезанная последняя запись (например, если игра упала во время
+        # записи) отбрасывается.
+        record_size = struct.calcsize(record_format)
+        end = offset + (len(data) - offset) // record_size * record_size
+
+        self.__steps: List[Tuple[InputState, Optional[int]]] = []
+        for record in struct.iter_unpack(record_format, data[offset:end]):
+            buttons = record[2]
+            self.__steps.append((
+                InputState(
+                    mouse_pos=(record[0], record[1]),
+                    shooting=bool(buttons & InputLogWriter._SHOOTING),
+                    left=bool(buttons & InputLogWriter._LEFT),
+                    right=bool(buttons & InputLogWriter._RIGHT),
+                    up=bool(buttons & InputLogWriter._UP),
+                    down=bool(buttons & InputLogWriter._DOWN),
+                ),
+                record[3] if self.__has_hashes else None,
+            ))
+
+    def __len__(self) -> int:
+        """
+        Дандер-метод для получения количества шагов в журнале.
+
+        :return: Целое число, количество шагов.
+        """
+
+        return len(self.__steps)
+
+    def __iter__(self) -> Iterator[Tuple[InputState, Optional[int]]]:
+        """
+        Дандер-метод для перебора шагов журнала.
+
+        :return: Итератор по состояниям ввода и хешам состояния мира.
+        """
+
+        return iter(self.__steps)
+
+    def get_seed(self) -> int:
+        """
+        Геттер зерна потоков случайных чисел.
+
+        :return: Целое число, зерно.
+        """
+
+        return self.__seed
+
+    def get_simulation_rate(self) -> int:
+        """
+        Геттер частоты шагов симуляции, с которой записан журнал.
+
+        :return: Целое число, количество шагов в секунду.
+        """
+
+        return self.__simulation_rate
+
+    def has_hashes(self) -> bool:
+        """
+        Проверка наличия хешей состояния мира в журнале.
+
+        :return: True, если журнал хранит хеши, иначе False.
+        """
+
+        return self.__has_hashes
@@ -0,0 +1,32 @@
+"""Модуль источника ввода с мыши и клавиатуры"""
+
+import pygame
+
+from .abstract_input_source import (
+    InputSource,
+    InputState,
+)
+
+
+class PygameInputSource(InputSource):
+    """Источник ввода, читающий мышь и клавиатуру через pygame"""
+
+    def poll(self) -> InputState:
+        """
+        Опрос мыши и клавиатуры.
+
+        Стрельба - левая кнопка мыши, движение - клавиши WASD.
+
+        :return: Состояние ввода на текущей итерации.
+        """
+
+        key_state = pygame.key.get_pressed()
+
+        return InputState(
+            mouse_pos=pygame.mouse.get_pos(),
+            shooting=pygame.mouse.get_pressed()[0],
+            left=key_state[pygame.K_a],
+            right=key_state[pygame.K_d],
+            up=key_state[pygame.K_w],
+            down=key_state[pygame.K_s],
+        )
@@ -0,0 +1,98 @@
+"""Модуль источника ввода записанной игры"""
+
+from typing import Optional
+
+from .abstract_input_source import (
+    InputSource,
+    InputState,
+)
+from .input_log import InputLogReader
+
+
+class ReplayInputSource(InputSource):
+    """
+    Источник ввода записанной игры.
+
+    Отдает состояния ввода из журнала по одному за опрос. После конца
+    журнала отдает ввод без нажатых кнопок.
+
+    Если журнал хранит хеши состояния мира, источник сравнивает с ними
+    хеши, полученные при повторе, и запоминает первый шаг, на котором они
+    разошлись.
+    """
+
+    def __init__(self, log: InputLogReader) -> None:
+        """
+        Инициализатор класса.
+
+        :param log: Журнал ввода.
+        """
+
+        self.__steps = list(log)
+        self.__ticks = 0
+        self.__expected_hash: Optional[int] = None
+        self.__divergence_tick: Optional[int] = None
+        # Последнее отданное состояние. После конца журнала курсор
+        # остается на месте.
+        self.__state = InputState()
+
+    def poll(self) -> InputState:
+        """
+        Опрос журнала.
+
+        :return: Состояние ввода на текущем шаге.
+        """
+
+        if self.__ticks < len(self.__steps):
+            self.__state, self.__expected_hash = self.__steps[self.__ticks]
+        else:
+            self.__state = InputState(mouse_pos=self.__state.mouse_pos)
+            self.__expected_hash = None
+        self.__ticks += 1
+
+        return self.__state
+
+    def check(self, state_hash: int) -> bool:
+        """
+        Сравнение хеша состояния мира с записанным в журнале.
+
+        Вызывается после шага симуляции с вводом последнего опроса.
+
+        :param state_hash: Хеш состояния мира после шага.
+        :return: False, если хеши разошлись, иначе True.
+        """
+
+        if self.__expected_hash is None \
+                or self.__expected_hash == state_hash:
+            return True
+
+        if self.__divergence_tick is None:
+            self.__divergence_tick = self.__ticks
+        return False
+
+    def is_finished(self) -> bool:
+        """
+        Проверка окончания журнала.
+
+        :return: True, если все шаги журнала уже отданы, иначе False.
+        """
+
+        return self.__ticks >= len(self.__steps)
+
+    def get_ticks(self) -> int:
+        """
+        Геттер количества отданных шагов.
+
+        :return: Целое число, количество шагов.
+        """
+
+        return self.__ticks
+
+    def get_divergence_tick(self) -> Optional[int]:
+        """
+        Геттер первого шага, на котором игра разошлась с записанной.
+
+        :return: Номер шага, начиная с 1, или None, если расхождений нет.
+        """
+
+        return self.__divergence_tick
@@ -5,226 +5,291 @@
 """
 
 
+import argparse
+import os
+import time
 import pygame
+from pathlib import Path
+from typing import Optional
 
 import settings
-from player import Player
-from global_game_objects import GlobalGameObjects
-from asteroids.asteroid import AsteroidType
-from collider.collide_resolver import CollideResolver
-from collider.collide_resolve_factory import CollideResolveFactory
-from levels.level import Level
-from levels.levels_manager import LevelsManager
-from generators.asteroids_generator import AsteroidsGenerator
-from generators.powerups_generator import PowerupsGenerator
-
-
-def main():
+from assets import Assets
+from simulation import Simulation
+from game_clock import GameClock
+from renderer import Renderer
+from utils.object_pool import ObjectPool
+from inputs import (
+    BotInputSource,
+    InputLogReader,
+    InputLogWriter,
+    PygameInputSource,
+    ReplayInputSource,
+)
+
+
+def init_game(headless: bool = False) -> Optional[pygame.Surface]:
+    """
+    Инициализация pygame, окна игры и фоновой музыки.
+
+    :param headless:
+        Работа без окна и звука. Для pygame выбираются пустые драйверы
+        SDL, окно не создается, музыка не играет.
+    :return: Экран игры или None при работе без окна.
+    """
+
+    if headless:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        pygame.init()
+        pygame.mixer.init()
+        return None
+
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((settings.WIDTH, settings.HEIGHT))
+    pygame.display.set_caption("Asteroids")
+
+    # Игра запускается и без файла фоновой музыки.
+    music_path = settings.audio_dir / 'music/acdc_thunderstruck.mp3'
+    if music_path.is_file():
+        pygame.mixer.music.load(music_path)
+        pygame.mixer.music.set_volume(0.05)
+        pygame.mixer.music.play(-1)
+
+    return screen
+
+
+def main(
+        headless: bool = settings.HEADLESS,
+        max_frames: Optional[int] = settings.MAX_FRAMES,
+        seed: Optional[int] = settings.RANDOM_SEED,
+        record: Optional[Path] = None,
+        replay: Optional[Path] = None,
+        speed: Optional[float] = None,
+) -> None:
     """
     Главная функция программы.
 
     Является точкой входа в программу.
-    """
 
-    # Инициализируем единственный экземпляр класса игровых объектов.
-    # Этот класс служит глобальной точкой получения общих игровых объектов
-    # по типу групп спрайтов, экрана игры и прочего.
-    game_objects = GlobalGameObjects()
+    :param headless:
+        Работа без окна и звука. Игра обновляет и сталкивает объекты с
+        максимальной скоростью, ничего не рисуя, а кораблем управляет бот.
+    :param max_frames:
+        Количество итераций игрового цикла, после которых игра завершается.
+        None - без ограничения.
+    :param seed:
+        Зерно потоков случайных чисел игрового мира. None - выбирается
+        случайно.
+    :param record: Путь до файла, в который записывается ввод игрока.
+    :param replay:
+        Путь до журнала ввода, который нужно повторить. Зерно берется из
+        журнала, а игра завершается в конце журнала.
+    :param speed:
+        Во сколько раз игра в окне идет быстрее реального времени. None -
+        по настройкам часов.
+    """
 
-    # Создаем и настраиваем коллайдер.
-    # Коллайдер использует внутри себя фабрику решений, которая по типам
-    # столкнувшихся объектов выбирает нужное решение.
-    collide_resolver = CollideResolver(
-        collide_resolve_factory=CollideResolveFactory(),
+    replay_log = InputLogReader(replay) if replay is not None else None
+    if replay_log is not None:
+        if replay_log.get_simulation_rate() != settings.SIMULATION_RATE:
+            raise ValueError(
+                f'{replay} was recorded at '
+                f'{replay_log.get_simulation_rate()} steps per second',
+            )
+        seed = replay_log.get_seed()
+
+    # Часы создаются до игрового мира, чтобы задать им режим. Записанная
+    # игра повторяется, только если время симуляции не зависит от
+    # реального.
+    clock_mode = settings.CLOCK_MODE
+    if speed is not None:
+        clock_mode = settings.ClockMode.FAST_FORWARD
+    elif clock_mode == settings.ClockMode.REAL \
+            and (record is not None or replay is not None):
+        clock_mode = settings.ClockMode.FIXED
+    game_clock = GameClock(
+        mode=clock_mode,
+        speed=speed if speed is not None else settings.FAST_FORWARD_SPEED,
     )
 
-    # Создаем список уровней.
-    levels = [Level(score=100 * (i + 1)) for i in range(100)]
-
-    # Создаем менеджер уровней. Менеджер отвечает за контроль уровня игры
-    # и контролирует уровни зарегестрированных в нем игровых объектов по типу
-    # генераторов.
-    levels_manager = LevelsManager(levels=levels)
-
-    # Создаем типы астероидов. На основе этих объектов генератор астероидов
-    # будет генерировать астероиды.
-    asteroid_types = [
-        AsteroidType(
-            min_max_radius=(10, 20),
-            min_max_speed=(380, 480),
-            skins=settings.asteroid_skins['tiny'],
-        ),
-        AsteroidType(
-            min_max_radius=(21, 30),
-            min_max_speed=(340, 430),
-            skins=settings.asteroid_skins['small'],
-        ),
-        AsteroidType(
-            min_max_radius=(31, 40),
-            min_max_speed=(280, 360),
-            skins=settings.asteroid_skins['medium'],
-        ),
-        AsteroidType(
-            min_max_radius=(41, 70),
-            min_max_speed=(250, 310),
-            skins=settings.asteroid_skins['large'],
-        ),
-    ]
-    # Создаем генератор астероидов.
-    asteroid_generator = AsteroidsGenerator(
-        start_frequency=2500,
-        end_frequency=150,
-        asteroid_types=asteroid_types,
-        max_level=len(levels),
-    )
-    # Регистрируем генератор астероидов в менджере уровней.
-    levels_manager.register_object(asteroid_generator)
-
-    # Создаем генератор усилений.
-    powerups_generator = PowerupsGenerator(
-        start_frequency=10000,
-        end_frequency=4000,
-        max_level=len(levels),
-    )
-    levels_manager.register_object(powerups_generator)
-
-    # Создаем игрока.
-    player = Player(
-        skin=settings.player_skin,
-        bullet_skin=settings.bullet_skin,
-        health=200, speed=2.7, damage=22,
-        radius=25, shoot_delay=420, score=0,
-    )
-    game_objects.players_group.add(player)
-    # Регистрируем игрока в менджере активных усилений.
-    game_objects.active_powerups_manager.register_player(player)
+    screen = init_game(headless)
+    clock = pygame.time.Clock()
+    assets = Assets()
+    # Ресурсы загружаются в фоне, пока создаются игровые объекты.
+    if settings.PREFETCH_ASSETS:
+        assets.prefetch()
+
+    # Игровой мир и его обновление.
+    simulation = Simulation(seed)
+
+    # Без окна кораблем управляет бот. Бот получает то же зерно, поэтому
+    # запуски с одним зерном полностью повторяются. При повторе ввод
+    # берется из журнала.
+    replay_source = ReplayInputSource(replay_log) \
+        if replay_log is not None else None
+    if replay_source is not None:
+        input_source = replay_source
+    elif headless:
+        input_source = BotInputSource(seed=simulation.get_seed())
+    else:
+        input_source = PygameInputSource()
+    check_hashes = replay_log is not None and replay_log.has_hashes()
+
+    # Запись ввода игрока вместе с зерном.
+    recorder = InputLogWriter(
+        record,
+        seed=simulation.get_seed(),
+        simulation_rate=settings.SIMULATION_RATE,
+        record_hashes=settings.RECORD_STATE_HASHES,
+    ) if record is not None else None
+
+    # Отрисовка мира. Без окна игра ничего не рисует.
+    renderer = Renderer(screen) if screen is not None else None
+
+    # Длительность шага симуляции в мс.
+    step_time = 1000 / settings.SIMULATION_RATE
+    # Время, накопленное с последнего шага симуляции, в мс.
+    accumulator = 0.0
+
+    # Количество выполненных итераций игрового цикла.
+    frames = 0
+    start_time = time.perf_counter()
+    clock.tick()
 
     # Игровой цикл.
     running = True
     while running:
-        # Держим цикл на правильной скорости.
-        settings.clock.tick(settings.FPS)
-
-        # Получений произошедших событий из списка событий игры.
-        for event in pygame.event.get():
-            # Проверка события закрытия игры.
-            if event.type == pygame.QUIT:
-                running = False
+        if headless:
+            # Без окна цикл работает с максимальной скоростью, и каждая
+            # итерация - ровно один шаг симуляции.
+            clock.tick()
+            accumulator = step_time
+        else:
+            # Держим цикл на правильной скорости и копим прошедшее время.
+            # При ускоренной перемотке время копится быстрее реального.
+            accumulator += clock.tick(settings.FPS) * game_clock.get_speed()
+
+            # Получений произошедших событий из списка событий игры.
+            for event in pygame.event.get():
+                # Проверка события закрытия игры.
+                if event.type == pygame.QUIT:
+                    running = False
 
         # ============================================
         # Обновление.
-        # Проверяем, нужно ли повышать уровень игры.
-        if levels_manager.level_complete(player.score):
-            levels_manager.level_up()
-
-        # Контролируем работу активных усилений на игрока.
-        game_objects.active_powerups_manager.control_powerups()
-
-        # Генерируем новый астероид.
-        new_asteroid = asteroid_generator.generate()
-        if new_asteroid is not None:
-            game_objects.asteroids_group.add(new_asteroid)
-
-        # Генерируем новое усиление.
-        new_powerup = powerups_generator.generate()
-        if new_powerup is not None:
-            game_objects.powerups_group.add(new_powerup)
-
-        # Стрельба игрока.
-        new_player_bullet = player.shoot()
-        if new_player_bullet is not None:
-            pygame.mixer.Channel(0).play(settings.shoot_sound)
-            game_objects.bullets_group.add(new_player_bullet)
-
-        # Добавляем в квадродерево астероиды.
-        # FIXME:
-        #  Сделать удаление объектов из квадродерева вместо полного отчищения.
-        game_objects.quadtree.clear()
-        # Добавляем в квадродерево усиления.
-        for powerup in game_objects.powerups_group:
-            game_objects.quadtree.add(powerup)
-        # Добавляем в квадродерево астероиды.
-        for obj in game_objects.asteroids_group:
-            game_objects.quadtree.add(obj)
-        # Добавляем в квадродерево игрока.
-        if player.health > 0:
-            game_objects.quadtree.add(player)
-        # Добавляем в квадродерево снаряды игрока.
-        for bullet in game_objects.bullets_group:
-            game_objects.quadtree.add(bullet)
-
-        # Решение коллизий.
-        # Выбираем все листы дерева, где больше 1 элемента, и проверяем
-        # на наличие коллизий. Если есть - решаем их.
-        collision_nodes = game_objects.quadtree.get_collision_nodes()
-        for node in collision_nodes:
-            node_objects = node.get_data()
-            for i in range(len(node_objects) - 1):
-                for k in range(i + 1, len(node_objects)):
-                    collide_resolver.resolve(node_objects[i], node_objects[k])
-
-        # Обновляем все спрайты.
-        game_objects.powerups_group.update()
-        game_objects.explosions_group.update()
-        game_objects.asteroids_group.update()
-        player.update()
-        game_objects.bullets_group.update()
-
-        # Обновляем текст со счетом.
-        score_text = settings.main_font.render(
-            f'Score: {int(player.score)}',
-            True,
-            settings.Collors.WHITE.value,
-        )
-        # Обновляем уровень.
-        current_level_text = settings.main_font.render(
-            f'Level: {levels_manager.get_current_level()}',
-            True,
-            settings.Collors.WHITE.value,
-        )
+        # Симуляция идет шагами постоянной длительности. Медленная машина
+        # выполняет за итерацию несколько шагов и пропускает кадры, а
+        # быстрая рисует кадры между шагами. Если отставание больше
+        # MAX_STEPS_PER_FRAME шагов, лишнее время отбрасывается.
+        steps = 0
+        while accumulator >= step_time \
+                and steps < settings.MAX_STEPS_PER_FRAME:
+            steps += 1
+            accumulator -= step_time
+            # Для интерполяции нужно состояние перед последним шагом
+            # итерации.
+            if renderer is not None and (
+                    accumulator < step_time
+                    or steps == settings.MAX_STEPS_PER_FRAME):
+                renderer.save_state()
+
+            # Ввод игрока опрашивается один раз за шаг.
+            input_state = input_source.poll()
+            simulation.step(input_state)
+
+            if recorder is not None:
+                recorder.write(
+                    input_state,
+                    simulation.get_state_hash()
+                    if recorder.is_recording_hashes() else None,
+                )
+            if replay_source is not None:
+                if check_hashes:
+                    replay_source.check(simulation.get_state_hash())
+                # Игра завершается в конце журнала.
+                if replay_source.is_finished():
+                    running = False
+                    break
+        if accumulator >= step_time:
+            accumulator %= step_time
 
         # ============================================
-        # Отрисовка спрайтов.
-        # Отрисовка заднего фона.
-        for y in range(0, settings.HEIGHT, settings.background.get_height()):
-            for x in range(0, settings.WIDTH, settings.background.get_width()):
-                settings.screen.blit(settings.background, (x, y))
-
-        # Отрисовка всех спрайтов и квадродерева.
-        # Отрисовка игрока и его здоровья.
-        game_objects.powerups_group.draw(settings.screen)
-        game_objects.players_group.draw(settings.screen)
-        if player.health > 0:
-            player.draw_health_bar(settings.screen)
-
-        # Отрисовка времени действия усилений.
-        game_objects.active_powerups_manager.draw_time_action_powerups()
-
-        # Отрисовка всех пуль.
-        game_objects.bullets_group.draw(settings.screen)
-
-        # Отрисовка астероидов и их здоровья.
-        game_objects.asteroids_group.draw(settings.screen)
-        for astr in game_objects.asteroids_group:
-            astr.draw_health_bar(settings.screen)
-
-        # Отрисовка всех взрывов.
-        game_objects.explosions_group.draw(settings.screen)
-
-        # Отрисовка квадродерева.
-        game_objects.quadtree.draw_quadtree(settings.screen)
-
-        # Отрисовка счета игрока.
-        settings.screen.blit(score_text, (10, settings.HEIGHT - 50))
-
-        # Отрисовка уровня.
-        settings.screen.blit(current_level_text, (10, settings.HEIGHT - 90))
-
-        # После отрисовки всего, переворачиваем экран.
-        pygame.display.flip()
+        # Отрисовка.
+        # Объекты рисуются между состояниями до и после последнего шага
+        # пропорционально времени, накопленному для следующего шага.
+        if renderer is not None:
+            renderer.draw(
+                simulation.get_player(),
+                simulation.get_level(),
+                alpha=accumulator / step_time,
+            )
+
+        frames += 1
+        if max_frames is not None and frames >= max_frames:
+            running = False
+
+    if recorder is not None:
+        recorder.close()
+    if replay_source is not None:
+        divergence_tick = replay_source.get_divergence_tick()
+        if divergence_tick is not None:
+            print(f'replay diverged at step {divergence_tick}')
+        elif check_hashes:
+            print(f'replay matched {replay_source.get_ticks()} steps')
+
+    if headless:
+        elapsed = time.perf_counter() - start_time
+        print(f'{frames} frames in {elapsed:.2f} s '
+              f'({frames / elapsed:.1f} fps, seed {simulation.get_seed()})')
+        for object_class, pool in ObjectPool.get_pools().items():
+            print(f'{object_class.__name__} pool: '
+                  f'{pool.get_hits()} reused, {pool.get_misses()} created')
 
     pygame.quit()
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Asteroids')
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        default=settings.HEADLESS,
+        help='run without a window and sound as fast as possible',
+    )
+    parser.add_argument(
+        '--frames',
+        type=int,
+        default=settings.MAX_FRAMES,
+        help='stop after this many frames',
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=settings.RANDOM_SEED,
+        help='seed of the game random streams',
+    )
+    parser.add_argument(
+        '--record',
+        type=Path,
+        help='record player input to this file',
+    )
+    parser.add_argument(
+        '--replay',
+        type=Path,
+        help='replay player input from this file',
+    )
+    parser.add_argument(
+        '--speed',
+        type=float,
+        help='game speed relative to real time in a window',
+    )
+    args = parser.parse_args()
+    main(
+        headless=args.headless,
+        max_frames=args.frames,
+        seed=args.seed,
+        record=args.record,
+        replay=args.replay,
+        speed=args.speed,
+    )
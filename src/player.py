@@ -2,15 +2,25 @@
 
 import pygame
 import math
-from typing import Optional
+from typing import (
+    Optional,
+    Tuple,
+)
 from enum import (
     Enum,
     auto,
 )
 
 import settings
+from game_clock import GameClock
+from assets import Assets
 from bullets.bullet import Bullet
 from collider.collideable import Collideable
+from utils.surface_cache import SurfaceCache
+from utils.rotation_cache import RotationCache
+from utils.text_cache import TextCache
+from camera import Camera
+from inputs import InputState
 
 
 class Player(Collideable, pygame.sprite.Sprite):
@@ -32,6 +42,7 @@ class Player(Collideable, pygame.sprite.Sprite):
             radius: float,
             shoot_delay: int,
             score: int,
+            camera: Optional[Camera] = None,
     ) -> None:
         """
         Инициализатор класса.
@@ -44,6 +55,9 @@ class Player(Collideable, pygame.sprite.Sprite):
         :param radius: Радиус спрайта игрока.
         :param shoot_delay: Скорострельность игрока.
         :param score: Счет игрока.
+        :param camera:
+            Камера, через которую мир выводится на экран. Нужна, чтобы
+            перевести позицию курсора в координаты мира.
         """
 
         pygame.sprite.Sprite.__init__(self)
@@ -51,97 +65,122 @@ class Player(Collideable, pygame.sprite.Sprite):
         self.__status = self.Status.ACTIVATED
 
         self.__bullet_skin = bullet_skin
+        self.__camera = camera
 
         self.radius = radius
-        self.image_orig = pygame.transform.scale(
+        self.image_orig = SurfaceCache().get_surface(
             skin,
             (self.radius * 2, self.radius * 2),
         )
-        self.image_orig.set_colorkey(settings.Collors.BLACK.value)
-        self.image = self.image_orig.copy()
+        self.image = self.image_orig
 
-        self.__pos_x = settings.WIDTH // 2
-        self.__pos_y = settings.HEIGHT // 2
+        self.__pos_x = settings.WORLD_WIDTH // 2
+        self.__pos_y = settings.WORLD_HEIGHT // 2
         self.__speed = speed
         self.__health = health
         self.__source_health = health
         self.__score = score
 
         self.__shoot_delay = shoot_delay
-        self.__last_shot = pygame.time.get_ticks()
+        self.__last_shot = GameClock().get_time()
         self.__damage = damage
 
         # Прямоугольник игрового объекта.
         self.rect = self.image.get_rect(center=(self.__pos_x, self.__pos_y))
 
-        # Параметры для вращения.
+        # Параметры для вращения. Изображение поворачивается на ближайший
+        # шаг из кеша поворотов, индекс этого шага хранится отдельно.
         self.rot = 0
+        self.__rot_index: Optional[int] = None
+        if settings.PRERENDER_ROTATIONS:
+            RotationCache().prerender(self.image_orig)
+        self.rotate(self.rot)
+
+    def update(self, input_state: InputState) -> None:
+        """
+        Метод обновления состояния игрока.
 
-    def update(self) -> None:
-        """Метод обновления состояния игрока"""
+        :param input_state: Состояние ввода на текущей итерации.
+        """
 
-        # Считываем координаты курсора.
-        mouse_x, mouse_y = pygame.mouse.get_pos()
+        # Считываем координаты курсора и переводим их в координаты мира.
+        mouse_x, mouse_y = input_state.mouse_pos
+        if self.__camera is not None:
+            mouse_x, mouse_y = self.__camera.to_world((mouse_x, mouse_y))
         rel_x, rel_y = mouse_x - self.__pos_x, mouse_y - self.__pos_y
         # Поворачиваем спрайта игрока в сторону курсора.
         angle = (180 / math.pi) * -math.atan2(rel_y, rel_x) - 90
         self.rotate(angle)
 
         # Обработка нажатых клавиш для управления кораблем.
-        key_state = pygame.key.get_pressed()
-        if key_state[pygame.K_a]:
-            self.__pos_x -= self.__speed
+        step = self.__speed * settings.SPEED_SCALE
+        if input_state.left:
+            self.__pos_x -= step
             self.rect.centerx = self.__pos_x
-        elif key_state[pygame.K_d]:
-            self.__pos_x += self.__speed
+        elif input_state.right:
+            self.__pos_x += step
             self.rect.centerx = self.__pos_x
-        if key_state[pygame.K_w]:
-            self.__pos_y -= self.__speed
+        if input_state.up:
+            self.__pos_y -= step
             self.rect.centery = self.__pos_y
-        elif key_state[pygame.K_s]:
-            self.__pos_y += self.__speed
+        elif input_state.down:
+            self.__pos_y += step
             self.rect.centery = self.__pos_y
 
-    def draw_health_bar(self, screen: pygame.Surface) -> None:
+    def draw_health_bar(
+            self,
+            screen: pygame.Surface,
+            offset: Tuple[int, int] = (0, 0),
+    ) -> pygame.Rect:
         """
         Отрисовка полоски здоровья игрока.
 
         :param screen: Экран, на который нужно рисовать.
+        :param offset: Смещение камеры, вычитаемое из координат полоски.
+        :return: Прямоугольник нарисованной области.
         """
 
         if self.__health < 0:
             self.__health = 0
         BAR_LENGTH = 60
         BAR_HEIGHT = 10
+        # Позиция центра в координатах экрана.
+        pos_x = self.__pos_x - offset[0]
+        pos_y = self.__pos_y - offset[1]
 
         # Получаем оставшееся здоровье игрока в процентах.
         remaining_health_percent = self.__health * 100 / self.__source_health
         fill = remaining_health_percent * BAR_LENGTH / 100
         outline_rect = pygame.Rect(
-            self.__pos_x - BAR_LENGTH // 2,
-            self.__pos_y + self.radius + 5,
+            pos_x - BAR_LENGTH // 2,
+            pos_y + self.radius + 5,
             BAR_LENGTH, BAR_HEIGHT,
         )
         fill_rect = pygame.Rect(
-            self.__pos_x - BAR_LENGTH // 2,
-            self.__pos_y + self.radius + 5,
+            pos_x - BAR_LENGTH // 2,
+            pos_y + self.radius + 5,
             fill, BAR_HEIGHT,
         )
 
         # Отрисовка здоровья игрока цифрами.
-        health_text = settings.health_font.render(
+        health_text = TextCache().render(
+            Assets().health_font,
             f'{self.__health}xp',
             True,
             settings.Collors.WHITE.value,
         )
-        settings.screen.blit(
+        text_rect = screen.blit(
             health_text,
-            (self.__pos_x - BAR_LENGTH // 2 + BAR_LENGTH + 1,
-             self.__pos_y + self.radius),
+            (pos_x - BAR_LENGTH // 2 + BAR_LENGTH + 1,
+             pos_y + self.radius),
         )
 
         pygame.draw.rect(screen, settings.Collors.GREEN.value, fill_rect)
-        pygame.draw.rect(screen, settings.Collors.WHITE.value, outline_rect, 2)
+        bar_rect = pygame.draw.rect(
+            screen, settings.Collors.WHITE.value, outline_rect, 2,
+        )
+
+        return bar_rect.union(text_rect)
 
     def rotate(self, new_rot: float) -> None:
         """
@@ -151,30 +190,36 @@ class Player(Collideable, pygame.sprite.Sprite):
         """
 
         self.rot = new_rot
-        new_image = pygame.transform.rotate(self.image_orig, self.rot)
+        # Если угол не сменил шаг поворота, изображение остается прежним.
+        rot_index = RotationCache().get_step_index(self.rot)
+        if rot_index == self.__rot_index:
+            return
+
+        self.__rot_index = rot_index
         old_center = self.rect.center
-        self.image = new_image
-        self.image.set_colorkey(settings.Collors.BLACK.value)
+        self.image = RotationCache().get_surface(self.image_orig, rot_index)
         self.rect = self.image.get_rect(center=old_center)
 
-    def shoot(self) -> Optional[Bullet]:
+    def shoot(self, input_state: InputState) -> Optional[Bullet]:
         """
         Стрельба игрока.
 
         Вызывается на каждой итерации игрового цикла, проверяет, нажата ли
         клавиша стреьлбы, и если нажата, контролирует скорострельность.
+
+        :param input_state: Состояние ввода на текущей итерации.
+        :return: Новый снаряд или None, если игрок не выстрелил.
         """
 
         # Обработка стрельбы игрока.
-        mouse_state = pygame.mouse.get_pressed()
-        if mouse_state[0] and self.__health > 0:
+        if input_state.shooting and self.__health > 0:
             # Держим правильную скорость стрельбы игрока.
-            now = pygame.time.get_ticks()
+            now = GameClock().get_time()
             if now - self.__last_shot > self.__shoot_delay:
                 self.__last_shot = now
                 x = self.rect.centerx - self.radius * math.sin(math.radians(self.rot))
                 y = self.rect.centery - self.radius * math.cos(math.radians(self.rot))
-                bullet = Bullet(
+                bullet = Bullet.acquire(
                     skin=self.__bullet_skin,
                     pos_x=x,
                     pos_y=y,
@@ -183,6 +228,12 @@ class Player(Collideable, pygame.sprite.Sprite):
                 )
                 return bullet
 
+    @property
+    def mask(self) -> pygame.mask.Mask:
+        # Маска для точной проверки столкновений берется из кеша поворотов
+        # и строится только тогда, когда нужна.
+        return RotationCache().get_mask(self.image_orig, self.__rot_index)
+
     @property
     def status(self) -> Status:
         return self.__status
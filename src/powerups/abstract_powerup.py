@@ -1,7 +1,6 @@
 """Модуль абстрактного класса усилений"""
 
 import pygame
-import random
 from abc import (
     ABC,
     abstractmethod,
@@ -13,6 +12,7 @@ from enum import (
 from typing import Optional
 
 import settings
+from game_clock import GameClock
 from player import Player
 from collider.collideable import Collideable
 
@@ -48,7 +48,7 @@ class Powerup(Collideable, pygame.sprite.Sprite, ABC):
         pygame.sprite.Sprite.__init__(self)
 
         # Начало жизни усиления.
-        self._start_time_live = pygame.time.get_ticks()
+        self._start_time_live = GameClock().get_time()
         # Время активации усиления.
         self._activate_time: Optional[int] = None
         # Статус усиления.
@@ -57,16 +57,21 @@ class Powerup(Collideable, pygame.sprite.Sprite, ABC):
         # Ширина и высота спрайта усиления, объекты спрайтов.
         self._size = 30
 
+        # Модуль глобальных игровых объектов сам импортирует усиления,
+        # поэтому импортируется только при создании усиления.
+        from global_game_objects import GlobalGameObjects
+        rng = GlobalGameObjects().random.get('powerups')
+
         # Позиция центра спрайта по оси Х.
-        self._pos_x = random.randint(
+        self._pos_x = rng.randint(
             self._size // 2,
-            settings.WIDTH - self._size // 2,
+            settings.WORLD_WIDTH - self._size // 2,
         ) if pos_x is None else pos_x
 
         # Позиция центра спрайта по оси Y.
-        self._pos_y = random.randint(
+        self._pos_y = rng.randint(
             self._size // 2,
-            settings.HEIGHT - self._size // 2,
+            settings.WORLD_HEIGHT - self._size // 2,
         ) if pos_y is None else pos_y
 
     @abstractmethod
@@ -84,7 +89,7 @@ class Powerup(Collideable, pygame.sprite.Sprite, ABC):
     def refresh(self) -> None:
         """Обновление времени действия усиления"""
 
-        self._activate_time = pygame.time.get_ticks()
+        self._activate_time = GameClock().get_time()
 
     def get_activate_time(self) -> Optional[int]:
         """
@@ -138,7 +143,7 @@ class Powerup(Collideable, pygame.sprite.Sprite, ABC):
     def update(self) -> None:
         """Метод обновления состояния усиления"""
 
-        now = pygame.time.get_ticks()
+        now = GameClock().get_time()
         if now - self._start_time_live >= self.get_lifetime():
             self.kill()
         else:
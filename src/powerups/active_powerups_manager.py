@@ -1,9 +1,14 @@
 """Модуль менеджера активных усилений"""
 
 import pygame
-from typing import Dict
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
 
 import settings
+from game_clock import GameClock
 from player import Player
 from powerups import Powerup
 
@@ -34,7 +39,7 @@ class ActivePowerupsManager:
         возвращает измененные параметры игроку обратно.
         """
 
-        now = pygame.time.get_ticks()
+        now = GameClock().get_time()
         for player, powerups in self.__managed_powerups.items():
             # Обрабатываем только активных игроков.
             if player.status == Player.Status.ACTIVATED:
@@ -97,12 +102,21 @@ class ActivePowerupsManager:
         else:
             current_powerups[type_powerup].refresh()
 
-    def draw_time_action_powerups(self) -> None:
+    def draw_time_action_powerups(
+            self,
+            screen: pygame.Surface,
+            offset: Tuple[int, int] = (0, 0),
+    ) -> List[pygame.Rect]:
         """
         Отрисовка времени действия всех активных усилений над всеми
         активными игроками.
+
+        :param screen: Экран, на который нужно рисовать.
+        :param offset: Смещение камеры, вычитаемое из координат полосок.
+        :return: Список прямоугольников нарисованных полосок.
         """
 
+        drawn_rects = []
         for player, powerups in self.__managed_powerups.items():
             if player.status == Player.Status.ACTIVATED:
                 for i, powerup in enumerate(powerups.values()):
@@ -114,9 +128,10 @@ class ActivePowerupsManager:
                         # Максимальное время действия.
                         source_time_action = powerup.get_time_action()
                         # Оставшееся время действия.
+                        elapsed_time = GameClock().get_time() \
+                            - powerup.get_activate_time()
                         remaining_time_action = \
-                            source_time_action - (pygame.time.get_ticks()
-                                                  - powerup.get_activate_time())
+                            source_time_action - elapsed_time
 
                         # Оставшееся время действия в процентах.
                         remaining_time_action_percent = \
@@ -126,23 +141,27 @@ class ActivePowerupsManager:
                         # номер усиления, чтобы они рисовались друг под другом.
                         fill = remaining_time_action_percent * BAR_LENGTH / 100
                         outline_rect = pygame.Rect(
-                            player.pos_x - BAR_LENGTH // 2,
-                            player.pos_y + player.radius + 5 + (i + 1) * BAR_HEIGHT,
+                            player.pos_x - offset[0] - BAR_LENGTH // 2,
+                            player.pos_y - offset[1] + player.radius + 5
+                            + (i + 1) * BAR_HEIGHT,
                             BAR_LENGTH, BAR_HEIGHT
                         )
                         fill_rect = pygame.Rect(
-                            player.pos_x - BAR_LENGTH // 2,
-                            player.pos_y + player.radius + 5 + (i + 1) * BAR_HEIGHT,
+                            player.pos_x - offset[0] - BAR_LENGTH // 2,
+                            player.pos_y - offset[1] + player.radius + 5
+                            + (i + 1) * BAR_HEIGHT,
                             fill, BAR_HEIGHT
                         )
 
                         pygame.draw.rect(
-                            settings.screen,
+                            screen,
                             powerup.get_time_action_color().value,
                             fill_rect,
                         )
-                        pygame.draw.rect(
-                            settings.screen,
+                        drawn_rects.append(pygame.draw.rect(
+                            screen,
                             settings.Collors.WHITE.value,
                             outline_rect, 2,
-                        )
+                        ))
+
+        return drawn_rects
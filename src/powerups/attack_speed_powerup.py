@@ -1,10 +1,12 @@
 """Модуль усилений скорости атаки"""
 
-import pygame
 from typing import Optional
 
 import settings
+from game_clock import GameClock
 from player import Player
+from assets import Assets
+from utils.surface_cache import SurfaceCache
 from .abstract_powerup import Powerup
 
 
@@ -15,19 +17,23 @@ class AttackSpeedPowerup(Powerup):
 
     __attack_speed = 100
     __damage = 50
-    __skin = settings.attack_speed_powerup_skin
 
     def __init__(self, *args, **kwargs) -> None:
         """Инициализатор класса"""
 
         super(AttackSpeedPowerup, self).__init__(*args, **kwargs)
 
-        self.image = pygame.transform.scale(
-            self.__skin,
+        skin = Assets().attack_speed_powerup_skin
+        surface_cache = SurfaceCache()
+        self.image = surface_cache.get_surface(
+            skin,
             (self._size, self._size),
         )
-        self.image.set_colorkey(settings.Collors.BLACK.value)
         self.rect = self.image.get_rect(center=(self._pos_x, self._pos_y))
+        self.mask = surface_cache.get_mask(
+            skin,
+            (self._size, self._size),
+        )
 
         self.__prev_attack_speed: Optional[int] = None
         self.__prev_damage: Optional[int] = None
@@ -44,7 +50,7 @@ class AttackSpeedPowerup(Powerup):
         if self._status == self.Status.DEACTIVATED:
             self.__prev_attack_speed = player.shoot_delay
             self.__prev_damage = player.damage
-            self._activate_time = pygame.time.get_ticks()
+            self._activate_time = GameClock().get_time()
             self._status = self.Status.ACTIVATED
             player.shoot_delay = self.__attack_speed
             player.damage = self.__damage
@@ -1,10 +1,12 @@
 """Модуль усилений здоровья игрока"""
 
-import pygame
 from typing import Optional
 
 import settings
+from game_clock import GameClock
 from player import Player
+from assets import Assets
+from utils.surface_cache import SurfaceCache
 from .abstract_powerup import Powerup
 
 
@@ -12,7 +14,6 @@ class HealthPowerup(Powerup):
     """Усиление здоровья игрока"""
 
     __add_health = 50
-    __skin = settings.health_powerup_skin
     _time_action = 0
 
     def __init__(self, *args, **kwargs) -> None:
@@ -20,12 +21,17 @@ class HealthPowerup(Powerup):
 
         super(HealthPowerup, self).__init__(*args, **kwargs)
 
-        self.image = pygame.transform.scale(
-            self.__skin,
+        skin = Assets().health_powerup_skin
+        surface_cache = SurfaceCache()
+        self.image = surface_cache.get_surface(
+            skin,
             (self._size, self._size),
         )
-        self.image.set_colorkey(settings.Collors.BLACK.value)
         self.rect = self.image.get_rect(center=(self._pos_x, self._pos_y))
+        self.mask = surface_cache.get_mask(
+            skin,
+            (self._size, self._size),
+        )
 
         self.__prev_value: Optional[int] = None
 
@@ -36,7 +42,7 @@ class HealthPowerup(Powerup):
         :param player: Объект игрока.
         """
 
-        self._activate_time = pygame.time.get_ticks()
+        self._activate_time = GameClock().get_time()
         lost_health = player.get_source_health() - player.health
         if self.__add_health <= lost_health:
             player.health += self.__add_health
@@ -1,10 +1,12 @@
 """Модуль усиления скорости игрока"""
 
-import pygame
 from typing import Optional
 
 import settings
+from game_clock import GameClock
 from player import Player
+from assets import Assets
+from utils.surface_cache import SurfaceCache
 from .abstract_powerup import Powerup
 
 
@@ -12,19 +14,23 @@ class SpeedPowerup(Powerup):
     """Усиление дополнительной скорости"""
 
     __speed = 7
-    __skin = settings.speed_powerup_skin
 
     def __init__(self, *args, **kwargs) -> None:
         """Инициализатор класса"""
 
         super(SpeedPowerup, self).__init__(*args, **kwargs)
 
-        self.image = pygame.transform.scale(
-            self.__skin,
+        skin = Assets().speed_powerup_skin
+        surface_cache = SurfaceCache()
+        self.image = surface_cache.get_surface(
+            skin,
             (self._size, self._size),
         )
-        self.image.set_colorkey(settings.Collors.BLACK.value)
         self.rect = self.image.get_rect(center=(self._pos_x, self._pos_y))
+        self.mask = surface_cache.get_mask(
+            skin,
+            (self._size, self._size),
+        )
 
         self.__prev_value: Optional[int] = None
 
@@ -39,7 +45,7 @@ class SpeedPowerup(Powerup):
         # меняем статус усиления.
         if self._status == self.Status.DEACTIVATED:
             self.__prev_value = player.speed
-            self._activate_time = pygame.time.get_ticks()
+            self._activate_time = GameClock().get_time()
             self._status = self.Status.ACTIVATED
             player.speed = self.__speed
 
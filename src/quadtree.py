@@ -4,6 +4,8 @@ import pygame
 from typing import (
     Optional,
     List,
+    Dict,
+    Tuple,
 )
 
 import settings
@@ -12,9 +14,10 @@ from utils.geometry import (
     Point,
 )
 from collider.collideable import Collideable
+from abstract_broadphase import AbstractBroadphase
 
 
-class Quadtree:
+class Quadtree(AbstractBroadphase):
     """
     Структура данных квадродерева.
 
@@ -49,6 +52,14 @@ class Quadtree:
             self.__search_accuracy = search_accuracy
             self.__data: List[Collideable] = []
             self.__nodes: List['Quadtree.QuadtreeNode'] = []
+            # Прямоугольник секции создается один раз, т.к. секция узла
+            # не меняется за все время его жизни.
+            self.__rect = pygame.rect.Rect((
+                area.top_left.x,
+                area.top_left.y,
+                area.get_width(),
+                area.get_height(),
+            ))
 
         def get_parent(self) -> Optional['Quadtree.QuadtreeNode']:
             """
@@ -112,67 +123,35 @@ class Quadtree:
             :return: True, если объект входит в текущую секуцию, иначе False.
             """
 
-            section = self.get_section()
+            return checked_object.get_bounding_rect().colliderect(self.__rect)
 
-            return checked_object.rect.colliderect(
-                pygame.rect.Rect((
-                    section.top_left.x,
-                    section.top_left.y,
-                    section.get_width(),
-                    section.get_height(),
-                ))
-            )
+        def intersects(self, rect: pygame.Rect) -> bool:
+            """
+            Пересечение секции с прямоугольником.
 
-        def clear(self):
-            """Очистка узла дерева от даных и подузлов"""
+            :param rect: Проверяемый прямоугольник.
+            :return: True, если прямоугольник пересекает секцию, иначе False.
+            """
 
-            self.__nodes = []
-            self.__data = []
+            return self.__rect.colliderect(rect)
 
-        def add(self, added_object: Collideable) -> None:
+        def contains(self, checked_object: Collideable) -> bool:
             """
-            Добавление объекта в узел.
+            Полное вхождение объекта в секцию.
 
-            :param added_object: Добавляемый объект.
+            :param checked_object: Проверяемый объект.
+            :return:
+                True, если объект целиком лежит внутри текущей секции,
+                иначе False.
             """
 
-            # Итерируемся по каждой подноде в текущей ноде.
-            for node in self.get_nodes():
-                # Если объект входит в секцию ноды.
-                if node.in_section(added_object):
-                    # Если в нод нет других объектов.
-                    if node.is_empty():
-                        # Если в ноде нет ни объектов, ни других нод, просто
-                        # добавляем объект в текущую ноду. Эта нода становится
-                        # листом.
-                        if len(node.get_nodes()) == 0:
-                            node.set_data([added_object])
-                        # Иначе если есть другие подноды, повторяем процедуру
-                        # добавления уже для этой ноды и ее поднод.
-                        else:
-                            node.add(added_object)
-                    # Иначе, если в нод есть другие объекты.
-                    else:
-                        # Если размеры секции в текущей ноде больше
-                        # минимального размера неделимой ноды.
-                        if node.get_section().get_width() > self.get_search_accuracy():
-                            # Тогда сохраняем текущие данные.
-                            saved_objects = node.get_data()
-                            # Разбиваем текущую ноду на 4 подноды.
-                            node.create_nodes()
-                            # Добавляем в подноды текущей ноды старые данные.
-                            for saved_object in saved_objects:
-                                node.add(saved_object)
-                            # Добавляем новый объект.
-                            node.add(added_object)
-                        # Если размер секции в ноде является минимально
-                        # возможным, т.е. нода неделима, тогда просто добавляем
-                        # новый объект в ноду и получаем ноду с возможной
-                        # коллизией. Эту ноду мы заносим в общий список
-                        # нод с возможными коллизиями объектов.
-                        else:
-                            node.get_data().append(added_object)
-                            self.__quadtree.add_collision_node(node)
+            return self.__rect.contains(checked_object.get_bounding_rect())
+
+        def clear(self):
+            """Очистка узла дерева от даных и подузлов"""
+
+            self.__nodes = []
+            self.__data = []
 
         def create_nodes(self) -> None:
             """Создает новые узлы в текущей ноде и удаляет данные"""
@@ -270,17 +249,22 @@ class Quadtree:
             quadtree=self,
             search_accuracy=search_accuracy,
         )
-        self.__collisions: List['Quadtree.QuadtreeNode'] = []
+        # Словарь используется как упорядоченное множество коллизийных нод.
+        self.__collisions: Dict['Quadtree.QuadtreeNode', None] = {}
+        # Ключи словаря - объекты в дереве, значения - список листов дерева,
+        # в которых находится объект. Позволяет перемещать и удалять объекты,
+        # не перестраивая дерево целиком.
+        self.__objects: Dict[Collideable, List['Quadtree.QuadtreeNode']] = {}
 
     def add_collision_node(self, node: QuadtreeNode) -> None:
         """Добавление ноды в список коллизийных нод"""
 
-        self.__collisions.append(node)
+        self.__collisions[node] = None
 
     def remove_collision_node(self, node: QuadtreeNode) -> None:
         """Удаление ноды из списка коллизийных нод"""
 
-        self.__collisions.remove(node)
+        self.__collisions.pop(node, None)
 
     def get_collision_nodes(self) -> List[QuadtreeNode]:
         """
@@ -290,7 +274,7 @@ class Quadtree:
             Список нод квадродерева, в которых объекты, вероятно, столкнуться.
         """
 
-        return self.__collisions
+        return list(self.__collisions)
 
     def get_first_node(self) -> QuadtreeNode:
         """
@@ -310,25 +294,28 @@ class Quadtree:
 
         return self.__search_accuracy
 
+    def get_objects(self) -> List[Collideable]:
+        """
+        Геттер для получения всех объектов в дереве.
+
+        :return: Список объектов.
+        """
+
+        return list(self.__objects)
+
     def clear(self) -> None:
         """
         Отчистка дерева.
 
-        Перезаписывая первую ноду, сборщик мусора Python удалит
-        все объекты, ссылка на которых удалились.
+        Очищаем корневую ноду, сборщик мусора Python удалит
+        все подузлы, ссылка на которых удалились.
 
-        Также очищаем список коллизий.
+        Также очищаем список коллизий и список объектов.
         """
 
-        self.__first_node = Quadtree.QuadtreeNode(
-            area=Area(
-                top_left=self.get_first_node().get_section().top_left,
-                bottom_right=self.get_first_node().get_section().bottom_right
-            ),
-            quadtree=self,
-            search_accuracy=self.get_search_accuracy(),
-        )
-        self.__collisions = []
+        self.__first_node.clear()
+        self.__collisions = {}
+        self.__objects = {}
 
     def add(self, added_object: Collideable) -> None:
         """
@@ -336,94 +323,257 @@ class Quadtree:
 
         Пользуемся свойствами квадродерева и добавляем с высокой скоростью,
         сравнивая координаты добавляемого объекта с площадью областей.
+        Если объект уже есть в дереве, он перемещается.
 
         :param added_object: Добавлемый объект.
         """
 
+        if added_object in self.__objects:
+            self.move(added_object)
+            return
+
+        self.__objects[added_object] = []
         first_node = self.get_first_node()
-        # Проверки для вставки в корневой узел.
-        if len(first_node.get_nodes()) == 0:
-            if first_node.is_empty():
-                first_node.set_data([added_object])
-            else:
-                saved_objects = first_node.get_data()
-                first_node.create_nodes()
-                for saved_object in saved_objects:
-                    first_node.add(saved_object)
-                first_node.add(added_object)
-        else:
-            first_node.add(added_object)
+        if first_node.in_section(added_object):
+            self._insert(first_node, added_object)
+
+    def update(self, updated_object: Collideable) -> None:
+        """
+        Обновление положения объекта в дереве.
+
+        Добавляет объект, если его еще нет в дереве, иначе перемещает.
+
+        :param updated_object: Обновляемый объект.
+        """
+
+        self.add(updated_object)
+
+    def move(self, moved_object: Collideable) -> None:
+        """
+        Перемещение объекта в дереве.
+
+        Объект переносится в другие листы только тогда, когда его
+        прямоугольник пересек границу секций. Иначе дерево не меняется.
+
+        :param moved_object: Перемещаемый объект.
+        """
 
-    def remove(self, removed_object: Collideable,
-               node: Optional[QuadtreeNode] = None) -> None:
+        current_nodes = self.__objects.get(moved_object)
+        if current_nodes is None:
+            self.add(moved_object)
+            return
+
+        # Самый частый случай: объект целиком лежит в своей единственной
+        # секции, тогда в дереве ничего менять не нужно.
+        if len(current_nodes) == 1 and current_nodes[0].contains(moved_object):
+            return
+
+        # Сравниваем текущие листы объекта с листами, в которые он должен
+        # входить на новом месте.
+        new_nodes = self._find_leaves(moved_object)
+        if len(new_nodes) == len(current_nodes) \
+                and all(node in current_nodes for node in new_nodes):
+            return
+
+        self.remove(moved_object)
+        self.__objects[moved_object] = []
+        first_node = self.get_first_node()
+        if first_node.in_section(moved_object):
+            self._insert(first_node, moved_object)
+
+    def remove(self, removed_object: Collideable) -> None:
         """
-        Удаления узла с указанным элементом.
+        Удаление объекта из дерева.
+
+        Объект удаляется из всех листов, где он есть. Опустевшие ветки
+        сливаются обратно в один лист.
 
         :param removed_object: Удаляемый элемент.
-        :param node: Нода, откуда нужно начинать искать.
         """
 
-        # Определяем текущие ноды, в которых находится объект.
-        removed_nodes = self.find_sections(removed_object) \
-            if node is None else [node]
+        removed_nodes = self.__objects.pop(removed_object, None)
+        if removed_nodes is None:
+            return
 
-        # Очищаем все ноды от объекта, где он есть.
+        # Данные в ноде заменяем новым списком, а не изменяем на месте,
+        # чтобы не ломать проходы по спискам, полученным ранее через
+        # get_data().
         for node in removed_nodes:
-            node.clear()
+            node.set_data([
+                current_object for current_object in node.get_data()
+                if current_object is not removed_object
+            ])
+            self._refresh_collision_node(node)
 
-        # Если у родителя, содержащего текущую ноду, нет больше данных,
-        # удаляем и этого родителя.
         for node in removed_nodes:
-            parent = node.get_parent()
-            empty_node = True
-            for child_node in parent.get_nodes():
-                if not child_node.is_empty() \
-                        or len(child_node.get_nodes()) != 0:
-                    empty_node = False
-                    break
-            if empty_node:
-                parent.clear()
-                self.remove(removed_object, parent)
-
-    def find_sections(self, found_object: Collideable,
-                      start_node: Optional[QuadtreeNode] = None) \
-            -> List[QuadtreeNode]:
+            self._merge(node.get_parent())
+
+    def find_sections(self, found_object: Collideable) -> List[QuadtreeNode]:
         """
         Поиск всех секций, где есть указанный объект.
 
         :param found_object: Объект, по которому ищем секции.
-        :param start_node: Стартовый узел, с которого начинается поиск.
-        :return: Список секций, где был обнаружен объект, или None.
+        :return: Список секций, где был обнаружен объект.
         """
 
-        # Проверяем текущую секцию.
-        if start_node:
-            for current_object in start_node.get_data():
-                if found_object is current_object:
-                    return [start_node]
+        return list(self.__objects.get(found_object, []))
+
+    def query(self, rect: pygame.Rect) -> List[Collideable]:
+        """
+        Поиск объектов, которые лежат в секциях, пересекающих прямоугольник.
+
+        Объекты отбираются по секциям, поэтому в результат могут попасть
+        объекты рядом с прямоугольником.
+
+        :param rect: Прямоугольник области поиска.
+        :return: Список объектов без повторов.
+        """
 
-        # Если указана стартовая нода, начинаем искать с нее.
-        # Иначе ищем с самого начала.
-        nodes = start_node.get_nodes() if start_node \
-            else self.get_first_node().get_nodes()
-        if not nodes:
+        found_objects: Dict[Collideable, None] = {}
+        nodes = [self.get_first_node()]
+        while nodes:
+            node = nodes.pop()
+            if not node.intersects(rect):
+                continue
+            child_nodes = node.get_nodes()
+            if child_nodes:
+                nodes.extend(child_nodes)
+            else:
+                found_objects.update(dict.fromkeys(node.get_data()))
+
+        return list(found_objects)
+
+    def _insert(self, start_node: QuadtreeNode,
+                added_object: Collideable) -> None:
+        """
+        Вставка объекта в листы, начиная с указанной ноды.
+
+        :param start_node: Нода, с которой начинается вставка.
+        :param added_object: Добавляемый объект.
+        """
+
+        nodes = [start_node]
+        while nodes:
+            node = nodes.pop()
+
+            # Если у ноды есть подноды, спускаемся в те, куда входит объект.
+            child_nodes = node.get_nodes()
+            if child_nodes:
+                for child_node in child_nodes:
+                    if child_node.in_section(added_object):
+                        nodes.append(child_node)
+                continue
+
+            # Если в листе уже есть объекты и размеры секции больше
+            # минимального размера неделимой ноды, разбиваем лист на 4
+            # подноды и переносим в них старые данные.
+            saved_objects = node.get_data()
+            if saved_objects \
+                    and node.get_section().get_width() > self.get_search_accuracy():
+                node.create_nodes()
+                for saved_object in saved_objects:
+                    self.__objects[saved_object].remove(node)
+                    self._insert(node, saved_object)
+                nodes.append(node)
+                continue
+
+            # Иначе добавляем объект в лист. Если нода неделима и в ней
+            # больше одного объекта, она становится коллизийной.
+            node.set_data(saved_objects + [added_object])
+            self.__objects[added_object].append(node)
+            self._refresh_collision_node(node)
+
+    def _find_leaves(self, found_object: Collideable) -> List[QuadtreeNode]:
+        """
+        Поиск листов дерева, в которые входит объект.
+
+        В отличие от find_sections, ищет по геометрии, а не по данным в нодах.
+
+        :param found_object: Объект, по которому ищем листы.
+        :return: Список листов.
+        """
+
+        first_node = self.get_first_node()
+        if not first_node.in_section(found_object):
             return []
 
-        # Собираем список нод, в которые входит текущий объект.
-        founded_nodes = []
-        for node in nodes:
-            if node.in_section(found_object):
-                founded_nodes.extend(self.find_sections(found_object, node))
+        leaves = []
+        nodes = [first_node]
+        while nodes:
+            node = nodes.pop()
+            child_nodes = node.get_nodes()
+            if not child_nodes:
+                leaves.append(node)
+                continue
+            for child_node in child_nodes:
+                if child_node.in_section(found_object):
+                    nodes.append(child_node)
+
+        return leaves
+
+    def _merge(self, node: Optional[QuadtreeNode]) -> None:
+        """
+        Слияние подузлов ноды в один лист.
+
+        Подноды сливаются, если все они являются листами и в сумме содержат
+        не больше одного объекта. Слияние продолжается вверх по дереву.
+
+        :param node: Нода, подузлы которой нужно слить.
+        """
+
+        while node is not None:
+            child_nodes = node.get_nodes()
+            # Нода уже была слита ранее, проверяем родителя.
+            if not child_nodes:
+                node = node.get_parent()
+                continue
+            if any(child_node.get_nodes() for child_node in child_nodes):
+                return
+
+            # Объект на границе секций лежит в нескольких листах сразу,
+            # поэтому считаем только уникальные объекты.
+            merged_objects = list(dict.fromkeys(
+                current_object
+                for child_node in child_nodes
+                for current_object in child_node.get_data()
+            ))
+            if len(merged_objects) > 1:
+                return
+
+            for child_node in child_nodes:
+                for current_object in child_node.get_data():
+                    self.__objects[current_object].remove(child_node)
+                self.remove_collision_node(child_node)
+            node.clear()
+            node.set_data(merged_objects)
+            for current_object in merged_objects:
+                self.__objects[current_object].append(node)
 
-        return founded_nodes
+            node = node.get_parent()
 
-    def draw_quadtree(self, screen: pygame.display) -> None:
+    def _refresh_collision_node(self, node: QuadtreeNode) -> None:
+        """
+        Обновление статуса коллизийной ноды.
+
+        :param node: Лист дерева, чьи данные изменились.
+        """
+
+        if len(node.get_data()) > 1:
+            self.add_collision_node(node)
+        else:
+            self.remove_collision_node(node)
+
+    def draw(self, screen: pygame.Surface,
+             offset: Tuple[int, int] = (0, 0)) -> None:
         """
         Отрисовка квадродерева на экран.
 
         :param screen: Объект экрана, куда нужно отрисовывать квадродерево.
+        :param offset: Смещение камеры, вычитаемое из координат секций.
         """
 
+        offset_x, offset_y = offset
+
         def draw_node(node: Quadtree.QuadtreeNode) -> None:
             """
             Функция отрисовки секции в ноде.
@@ -432,16 +582,16 @@ class Quadtree:
             """
 
             section = node.get_section()
+            left = section.top_left.x - offset_x
+            top = section.top_left.y - offset_y
+            right = section.bottom_right.x - offset_x
+            bottom = section.bottom_right.y - offset_y
 
             # Через секцию в ноде получаем координаты ребер этой секции.
-            top_line = (section.top_left.x, section.top_left.y), \
-                       (section.bottom_right.x, section.top_left.y)
-            left_line = (section.bottom_right.x - 1, section.top_left.y), \
-                        (section.bottom_right.x - 1, section.bottom_right.y)
-            bottom_line = (section.top_left.x, section.bottom_right.y - 1), \
-                          (section.bottom_right.x, section.bottom_right.y - 1)
-            right_line = (section.top_left.x, section.top_left.y), \
-                         (section.top_left.x, section.bottom_right.y)
+            top_line = (left, top), (right, top)
+            left_line = (right - 1, top), (right - 1, bottom)
+            bottom_line = (left, bottom - 1), (right, bottom - 1)
+            right_line = (left, top), (left, bottom)
 
             # Отрисовка линий секции по найденным координатам.
             pygame.draw.line(screen, settings.Collors.YELLOW.value,
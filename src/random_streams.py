@@ -0,0 +1,92 @@
+"""Модуль именованных потоков случайных чисел"""
+
+import random
+from typing import (
+    Dict,
+    Optional,
+)
+
+import settings
+from utils.singleton import Singleton
+
+
+class RandomStreams(metaclass=Singleton):
+    """
+    Потоки случайных чисел игрового мира.
+
+    Реализует паттерн Singleton. Вместо общего модуля random каждая
+    подсистема игры берет свой именованный поток по имени, например
+    'asteroids', 'powerups' или 'effects'. Все потоки выводятся из одного
+    зерна, поэтому одно зерно и одинаковый ввод игрока воспроизводят игру
+    целиком.
+
+    Потоки независимы: случайные числа, взятые одной подсистемой, не
+    сдвигают последовательности других подсистем.
+    """
+
+    def __init__(self, seed: Optional[int] = settings.RANDOM_SEED) -> None:
+        """
+        Инициализатор класса.
+
+        :param seed: Зерно всех потоков. None - выбирается случайно.
+        """
+
+        self.__seed = 0
+        # Ключи словаря - имена потоков, значения - сами потоки.
+        self.__streams: Dict[str, random.Random] = {}
+        self.seed(seed)
+
+    def seed(self, seed: Optional[int] = None) -> None:
+        """
+        Задание зерна всех потоков.
+
+        Уже выданные потоки начинают свои последовательности заново.
+
+        :param seed: Зерно всех потоков. None - выбирается случайно.
+        """
+
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+
+        self.__seed = seed
+        for name, stream in self.__streams.items():
+            stream.seed(self._stream_seed(seed, name))
+
+    def get(self, name: str) -> random.Random:
+        """
+        Получение потока по имени.
+
+        :param name: Имя потока.
+        :return: Генератор случайных чисел потока.
+        """
+
+        stream = self.__streams.get(name)
+        if stream is None:
+            stream = random.Random(self._stream_seed(self.__seed, name))
+            self.__streams[name] = stream
+
+        return stream
+
+    def get_seed(self) -> int:
+        """
+        Геттер зерна потоков.
+
+        :return: Целое число, зерно.
+        """
+
+        return self.__seed
+
+    @staticmethod
+    def _stream_seed(seed: int, name: str) -> str:
+        """
+        Получение зерна отдельного потока.
+
+        Строки хешируются модулем random одинаково при любом запуске, в
+        отличие от встроенной функции hash.
+
+        :param seed: Зерно всех потоков.
+        :param name: Имя потока.
+        :return: Зерно потока.
+        """
+
+        return f'{seed}:{name}'
@@ -0,0 +1,303 @@
+"""Модуль отрисовки игрового мира"""
+
+import pygame
+from typing import (
+    Dict,
+    Optional,
+    Tuple,
+)
+
+import settings
+from assets import Assets
+from player import Player
+from global_game_objects import GlobalGameObjects
+from health_bar_layer import HealthBarLayer
+from utils.dirty_rects import DirtyRects
+from utils.object_pool import Poolable
+from utils.text_cache import TextCache
+
+
+class Renderer:
+    """
+    Класс отрисовки игрового мира.
+
+    Рисует видимую через камеру часть мира и счет игрока. Игровые объекты
+    не изменяет, поэтому без него игра работает так же, только ничего не
+    выводит на экран.
+
+    Может рисовать объекты между их положениями до и после последнего шага
+    симуляции. Для этого перед шагом нужно запомнить положения методом
+    save_state.
+    """
+
+    def __init__(self, screen: pygame.Surface) -> None:
+        """
+        Инициализатор класса.
+
+        :param screen: Экран, на который нужно рисовать.
+        """
+
+        self.__screen = screen
+        self.__game_objects = GlobalGameObjects()
+
+        # Кеш надписей. Неизменившиеся счет и уровень не отрисовываются
+        # шрифтом заново.
+        self.__text_cache = TextCache()
+
+        # Слой полосок здоровья астероидов. Рисует все полоски за один
+        # проход.
+        self.__asteroids_health_bars = HealthBarLayer(
+            fill_color=settings.Collors.RED,
+            skip_full_health=settings.HEALTH_BAR_SKIP_FULL_HEALTH,
+            text_min_radius=settings.HEALTH_BAR_TEXT_MIN_RADIUS,
+            text_max_count=settings.HEALTH_BAR_TEXT_MAX_COUNT,
+        )
+
+        # Смещение камеры на прошлой итерации.
+        self.__last_camera_offset = None
+
+        # Смещение камеры и центры спрайтов перед последним шагом
+        # симуляции. Нужны для интерполяции. Вместе с центром спрайта
+        # хранится его поколение в пуле: спрайт, который за шаг вернулся в
+        # пул и был взят снова, - это новый объект, и от старого центра
+        # его рисовать нельзя.
+        self.__interpolate = settings.INTERPOLATE_RENDERING
+        self.__previous_offset: Optional[Tuple[int, int]] = None
+        self.__previous_centers: Dict[pygame.sprite.Sprite,
+                                      Tuple[Tuple[int, int], int]] = {}
+
+        # Фон собирается из плиток один раз. Он больше экрана на одну
+        # плитку, чтобы при движении камеры из него можно было вырезать
+        # видимую часть.
+        tile = Assets().background
+        self.__tile_width = tile.get_width()
+        self.__tile_height = tile.get_height()
+        self.__background = pygame.Surface((
+            settings.WIDTH + self.__tile_width,
+            settings.HEIGHT + self.__tile_height,
+        )).convert()
+        width, height = self.__background.get_size()
+        for y in range(0, height, self.__tile_height):
+            for x in range(0, width, self.__tile_width):
+                self.__background.blit(tile, (x, y))
+
+        # При отрисовке измененных областей фон рисуется на экран целиком
+        # только при движении камеры, а иначе стираются только области, где
+        # что-то было нарисовано на прошлой итерации.
+        self.__dirty_rects = DirtyRects() \
+            if settings.DIRTY_RENDERING else None
+
+        # Группы спрайтов, которые лежат в широкой фазе, в порядке
+        # отрисовки.
+        self.__culled_groups = (
+            self.__game_objects.powerups_group,
+            self.__game_objects.players_group,
+            self.__game_objects.bullets_group,
+            self.__game_objects.asteroids_group,
+        )
+
+    def save_state(self) -> None:
+        """
+        Запоминание положений камеры и спрайтов перед шагом симуляции.
+        """
+
+        if not self.__interpolate:
+            return
+
+        self.__previous_offset = self.__game_objects.camera.get_offset()
+        self.__previous_centers = {
+            sprite: (sprite.rect.center, self._get_generation(sprite))
+            for group in self.__culled_groups
+            for sprite in group
+        }
+
+    def draw(self, player: Player, level: int, alpha: float = 1.0) -> None:
+        """
+        Отрисовка кадра и вывод его на экран.
+
+        :param player: Игрок, чьи здоровье и счет нужно нарисовать.
+        :param level: Текущий уровень игры.
+        :param alpha:
+            Доля пути от положений перед последним шагом симуляции до
+            текущих, на которой рисуются объекты. 1 - текущие положения.
+        """
+
+        screen = self.__screen
+        game_objects = self.__game_objects
+        camera = game_objects.camera
+        camera_offset = camera.get_offset()
+        dirty_rects = self.__dirty_rects
+
+        interpolate = self.__interpolate and alpha < 1 \
+            and self.__previous_offset is not None
+        if interpolate:
+            camera_offset = (
+                round(self.__previous_offset[0]
+                      + (camera_offset[0] - self.__previous_offset[0])
+                      * alpha),
+                round(self.__previous_offset[1]
+                      + (camera_offset[1] - self.__previous_offset[1])
+                      * alpha),
+            )
+
+        # Отрисовка заднего фона. Из фона вырезается часть, которая видна
+        # с текущим смещением камеры.
+        background_view = self.__background.subsurface((
+            camera_offset[0] % self.__tile_width,
+            camera_offset[1] % self.__tile_height,
+            settings.WIDTH,
+            settings.HEIGHT,
+        ))
+        if dirty_rects is None \
+                or camera_offset != self.__last_camera_offset:
+            screen.blit(background_view, (0, 0))
+            if dirty_rects is not None:
+                dirty_rects.invalidate()
+        else:
+            dirty_rects.clear(screen, background_view)
+        self.__last_camera_offset = camera_offset
+
+        # Отбираем видимые спрайты запросом к широкой фазе и раскладываем
+        # их по группам, чтобы сохранить порядок отрисовки групп.
+        # Спрайты за пределами экрана не рисуются вовсе.
+        visible_sprites = {group: [] for group in self.__culled_groups}
+        for obj in game_objects.broadphase.query(camera.get_rect()):
+            if obj.alive() and camera.is_visible(obj.rect):
+                for group in obj.groups():
+                    if group in visible_sprites:
+                        visible_sprites[group].append(obj)
+        # Взрывов в широкой фазе нет, их немного, поэтому проверяем их
+        # видимость по одному.
+        visible_explosions = [
+            explosion for explosion in game_objects.explosions_group
+            if camera.is_visible(explosion.rect)
+        ]
+
+        # Сдвиги спрайтов от текущих положений к интерполированным.
+        shifts = {}
+        if interpolate:
+            for sprites in visible_sprites.values():
+                for sprite in sprites:
+                    previous_state = self.__previous_centers.get(sprite)
+                    if previous_state is None:
+                        continue
+                    previous, generation = previous_state
+                    if previous == sprite.rect.center \
+                            or generation != self._get_generation(sprite):
+                        continue
+                    shifts[sprite] = (
+                        round((previous[0] - sprite.rect.centerx)
+                              * (1 - alpha)),
+                        round((previous[1] - sprite.rect.centery)
+                              * (1 - alpha)),
+                    )
+        # Полоски игрока рисуются со сдвигом его спрайта.
+        player_shift = shifts.get(player, (0, 0))
+        player_offset = (
+            camera_offset[0] - player_shift[0],
+            camera_offset[1] - player_shift[1],
+        )
+
+        # Нарисованные области экрана.
+        drawn_rects = []
+
+        # Отрисовка всех спрайтов и широкой фазы.
+        # Отрисовка игрока и его здоровья.
+        drawn_rects += camera.draw(
+            screen,
+            visible_sprites[game_objects.powerups_group],
+            camera_offset,
+            shifts,
+        )
+        drawn_rects += camera.draw(
+            screen,
+            visible_sprites[game_objects.players_group],
+            camera_offset,
+            shifts,
+        )
+        if player.health > 0:
+            drawn_rects.append(
+                player.draw_health_bar(screen, player_offset),
+            )
+
+        # Отрисовка времени действия усилений.
+        drawn_rects += game_objects.active_powerups_manager \
+            .draw_time_action_powerups(screen, player_offset)
+
+        # Отрисовка всех пуль.
+        drawn_rects += camera.draw(
+            screen,
+            visible_sprites[game_objects.bullets_group],
+            camera_offset,
+            shifts,
+        )
+
+        # Отрисовка астероидов и их здоровья.
+        visible_asteroids = visible_sprites[game_objects.asteroids_group]
+        drawn_rects += camera.draw(
+            screen,
+            visible_asteroids,
+            camera_offset,
+            shifts,
+        )
+        drawn_rects += self.__asteroids_health_bars.draw(
+            screen,
+            visible_asteroids,
+            camera_offset,
+            shifts,
+        )
+
+        # Отрисовка всех взрывов.
+        drawn_rects += camera.draw(screen, visible_explosions, camera_offset)
+
+        # Отрисовка секций широкой фазы. Секции могут лежать где угодно,
+        # поэтому при отрисовке измененных областей меняется весь экран.
+        if settings.DRAW_BROADPHASE:
+            game_objects.broadphase.draw(screen, camera_offset)
+            drawn_rects.append(screen.get_rect())
+
+        # Отрисовка счета игрока.
+        score_text = self.__text_cache.render(
+            Assets().main_font,
+            f'Score: {int(player.score)}',
+            True,
+            settings.Collors.WHITE.value,
+        )
+        drawn_rects.append(
+            screen.blit(score_text, (10, settings.HEIGHT - 50)),
+        )
+
+        # Отрисовка уровня.
+        current_level_text = self.__text_cache.render(
+            Assets().main_font,
+            f'Level: {level}',
+            True,
+            settings.Collors.WHITE.value,
+        )
+        drawn_rects.append(
+            screen.blit(
+                current_level_text,
+                (10, settings.HEIGHT - 90),
+            ),
+        )
+
+        # После отрисовки всего выводим на экран либо только измененные
+        # области, либо весь экран целиком.
+        if dirty_rects is not None:
+            dirty_rects.extend(drawn_rects)
+            dirty_rects.present()
+        else:
+            pygame.display.flip()
+
+    @staticmethod
+    def _get_generation(sprite: pygame.sprite.Sprite) -> int:
+        """
+        Получение поколения спрайта в пуле.
+
+        :param sprite: Спрайт.
+        :return: Поколение спрайта или 0, если спрайт не из пула.
+        """
+
+        if isinstance(sprite, Poolable):
+            return sprite.get_generation()
+        return 0
@@ -1,13 +1,14 @@
 """
 Модуль настроек проекта.
 
-Содержит всю необходимую настроечную информацию для проекта.
+Содержит всю необходимую настроечную информацию для проекта. Модуль
+содержит только константы: окно, звук и ресурсы создаются и загружаются
+при запуске игры (см. main.py и assets.py).
 """
 
 import sys
-import pygame
 from enum import Enum
-from typing import List
+from typing import Optional
 from pathlib import Path
 
 
@@ -16,6 +17,58 @@ WIDTH = 1100
 HEIGHT = 900
 FPS = 60
 
+# Частота шагов симуляции в секунду. Симуляция не зависит от частоты
+# кадров: на медленной машине кадры пропускаются, а на быстрой рисуются
+# между шагами. Скорости объектов подобраны под 60 шагов в секунду и
+# пересчитываются под заданную частоту.
+SIMULATION_RATE = 60
+SPEED_SCALE = 60 / SIMULATION_RATE
+
+# Максимальное количество шагов симуляции за кадр. Если машина отстает
+# сильнее, игра замедляется.
+MAX_STEPS_PER_FRAME = 5
+# Рисовать объекты между их положениями до и после последнего шага
+# симуляции, чтобы движение было плавным при любой частоте кадров.
+INTERPOLATE_RENDERING = True
+
+
+class ClockMode(Enum):
+    """Режимы игровых часов"""
+
+    REAL = 'real'
+    FIXED = 'fixed'
+    FAST_FORWARD = 'fast_forward'
+
+
+# Режим игровых часов, от которых идут все таймеры игры: появление
+# астероидов и усилений, время действия усилений, анимации и стрельба.
+# REAL - реальное время, FIXED - каждый шаг симуляции длится ровно
+# 1000 / SIMULATION_RATE мс, FAST_FORWARD - как FIXED, но шаги выполняются
+# в FAST_FORWARD_SPEED раз чаще (но не больше MAX_STEPS_PER_FRAME шагов
+# за кадр).
+CLOCK_MODE = ClockMode.FIXED
+FAST_FORWARD_SPEED = 4.0
+
+# Работа без окна и звука: игра обновляет и сталкивает объекты с максимальной
+# скоростью, ничего не рисуя, а кораблем управляет бот. Нужна для
+# нагрузочных тестов и замеров производительности.
+HEADLESS = False
+# Количество итераций игрового цикла, после которых игра завершается.
+# None - без ограничения.
+MAX_FRAMES: Optional[int] = None
+# Зерно потоков случайных чисел игрового мира. Одно зерно и одинаковый ввод
+# игрока воспроизводят игру целиком. None - зерно выбирается случайно.
+RANDOM_SEED: Optional[int] = None
+# Записывать в журнал ввода хеш состояния игрового мира на каждом шаге. По
+# хешам при повторе записанной игры находится шаг, на котором она пошла
+# иначе. Хеширование мира замедляет игру во время записи и повтора.
+RECORD_STATE_HASHES = True
+
+# Размеры игрового мира. Мир может быть больше окна, тогда камера следует
+# за игроком и на экран выводится только видимая часть мира.
+WORLD_WIDTH = WIDTH
+WORLD_HEIGHT = HEIGHT
+
 
 class Collors(Enum):
     """Цвета для игры"""
@@ -28,6 +81,99 @@ class Collors(Enum):
     YELLOW = (235, 235, 0)
 
 
+class Broadphase(Enum):
+    """Реализации широкой фазы обнаружения столкновений"""
+
+    QUADTREE = 'quadtree'
+    SPATIAL_HASH = 'spatial_hash'
+
+
+# Реализация широкой фазы столкновений. Квадродерево подходит для объектов
+# сильно разных размеров, пространственный хеш - для объектов близких
+# размеров на ограниченном поле.
+BROADPHASE = Broadphase.QUADTREE
+
+# Хранить кинематику астероидов в массивах NumPy и обновлять все астероиды
+# одним векторным шагом. Нужен установленный NumPy.
+USE_ASTEROID_FIELD = False
+
+# Максимальное количество свободных объектов в пулах. Уничтоженные снаряды,
+# взрывы и астероиды возвращаются в пулы и переиспользуются.
+BULLETS_POOL_SIZE = 64
+EXPLOSIONS_POOL_SIZE = 64
+ASTEROIDS_POOL_SIZE = 128
+
+# Максимальное количество масштабированных изображений в общем кеше.
+SURFACE_CACHE_SIZE = 1024
+# Максимальное количество отрисованных надписей в общем кеше.
+TEXT_CACHE_SIZE = 512
+# Максимальное количество размеров анимаций взрыва в кеше кадров. Кадры
+# одного размера можно собирать в одну ленту.
+ANIMATION_CACHE_SIZE = 64
+ANIMATION_CACHE_STRIP = True
+
+# Загрузка скинов из общего текстурного атласа вместо отдельных файлов.
+USE_TEXTURE_ATLAS = True
+# Загрузка всех ресурсов в фоновом потоке сразу после создания окна.
+PREFETCH_ASSETS = False
+# Загрузка изображений из кеша уже декодированных пикселей, если кеш собран
+# (python assets.py) и исходные файлы с тех пор не менялись.
+USE_PIXEL_CACHE = True
+# Размеры, до которых скины заранее масштабируются при сборке кеша пикселей.
+# Ключи словаря - пути до скинов относительно папки спрайтов, значения -
+# ширины и высоты. Размеры совпадают с размерами игрока, снаряда, усилений
+# и астероидов каждого типа.
+PIXEL_CACHE_VARIANTS = {
+    'PNG/playerShip1_orange.png': [(50, 50)],
+    'PNG/Lasers/laserBlue01.png': [(15, 70)],
+    'PNG/Power-ups/things_gold.png': [(30, 30)],
+    'PNG/Power-ups/powerupBlue_bolt.png': [(30, 30)],
+    'PNG/Power-ups/pill_green.png': [(30, 30)],
+    **{
+        f'PNG/Meteors/meteorBrown_{name}.png': [
+            (radius * 2, radius * 2)
+            for radius in range(min_radius, max_radius + 1)
+        ]
+        for name, min_radius, max_radius in (
+            ('tiny1', 10, 20),
+            ('tiny2', 10, 20),
+            ('small1', 21, 30),
+            ('small2', 21, 30),
+            ('med1', 31, 40),
+            ('med2', 31, 40),
+            ('big1', 41, 70),
+            ('big2', 41, 70),
+            ('big3', 41, 70),
+            ('big4', 41, 70),
+        )
+    },
+}
+
+# Количество шагов поворота спрайтов игрока и снарядов на полный оборот.
+# Повернутые изображения строятся один раз на каждый шаг.
+ROTATION_STEPS = 360
+# Строить все повороты спрайта игрока при создании, а не при первом
+# обращении.
+PRERENDER_ROTATIONS = False
+
+# Отрисовка только измененных областей экрана вместо полной перерисовки.
+# В этом режиме стираются и выводятся на экран только области, нарисованные
+# на прошлой и текущей итерациях.
+DIRTY_RENDERING = False
+# Отрисовка секций широкой фазы для отладки. Секции покрывают весь экран,
+# поэтому с ними при отрисовке измененных областей перерисовывается весь
+# экран.
+DRAW_BROADPHASE = False
+
+# Полоски здоровья астероидов. Полоски астероидов с полным здоровьем можно
+# не рисовать. Здоровье цифрами рисуется только у астероидов не меньше
+# заданного радиуса и только пока полосок на экране не больше заданного
+# количества (None - без ограничения).
+HEALTH_BAR_SKIP_FULL_HEALTH = True
+HEALTH_BAR_TEXT_MIN_RADIUS = 0
+HEALTH_BAR_TEXT_MAX_COUNT: Optional[int] = 100
+
+
 # Пути папок до медиа файлов.
 # Проверка необходима, если программа запускается из скомпилированного
 # .exe-файла.
@@ -37,69 +183,4 @@ else:
     base_dir = Path(__file__).parent
 sprites_dir = base_dir / 'media/sprites'
 audio_dir = base_dir / 'media/audio'
-
-
-# Создаем игру, окно, в которое будут отрисовываться все спрайты,
-# инициализируем микшер для звуков, создаем таймер и шрифты.
-pygame.init()
-pygame.mixer.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Asteroids")
-clock = pygame.time.Clock()
-pygame.font.init()
-main_font = pygame.font.SysFont('Comic Sans MS', 30)
-health_font = pygame.font.SysFont('Comic Sans MS', 12)
-
-
-# Загружаем спрайты.
-background = pygame.image.load(sprites_dir / 'Backgrounds/black.png').convert()
-asteroid_skins = {
-    'tiny': [
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_tiny1.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_tiny2.png').convert(),
-    ],
-    'small': [
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_small1.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_small2.png').convert(),
-    ],
-    'medium': [
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_med1.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_med2.png').convert(),
-    ],
-    'large': [
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_big1.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_big2.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_big3.png').convert(),
-        pygame.image.load(sprites_dir / 'PNG/Meteors/meteorBrown_big4.png').convert(),
-    ],
-}
-player_skin = pygame.image.load(sprites_dir / 'PNG/playerShip1_orange.png')
-bullet_skin = pygame.image.load(sprites_dir / 'PNG/Lasers/laserBlue01.png')
-attack_speed_powerup_skin = pygame.image.load(sprites_dir / 'PNG/Power-ups/things_gold.png')
-speed_powerup_skin = pygame.image.load(sprites_dir / 'PNG/Power-ups/powerupBlue_bolt.png')
-health_powerup_skin = pygame.image.load(sprites_dir / 'PNG/Power-ups/pill_green.png')
-
-# Загружаем спрайты для анимации взрыва.
-explosion_anim: List[pygame.Surface] = []
-for i in range(9):
-    filename = f'Explosions_kenney/regularExplosion0{i}.png'
-    img = pygame.image.load(sprites_dir / filename).convert()
-    img.set_colorkey(Collors.BLACK.value)
-    explosion_anim.append(img)
-
-
-# Загрузка звуков.
-shoot_sound = pygame.mixer.Sound(audio_dir / 'sfx_laser1.ogg')
-shoot_sound.set_volume(0.2)
-expl_sounds = []
-for i in range(2, 4):
-    sound = pygame.mixer.Sound(audio_dir / f'expls/type2/explosion{i + 1}.ogg')
-    sound.set_volume(0.1)
-    expl_sounds.append(sound)
-chunky_expl = pygame.mixer.Sound(audio_dir / f'expls/chunky_expl.mp3')
-chunky_expl.set_volume(0.5)
-
-# Загрузка музыки.
-pygame.mixer.music.load(audio_dir / 'music/acdc_thunderstruck.mp3')
-pygame.mixer.music.set_volume(0.05)
-pygame.mixer.music.play(-1)
+pixel_cache_path = base_dir / 'media/pixel_cache.bin'
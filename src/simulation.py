@@ -0,0 +1,320 @@
+"""Модуль игрового мира и его пошагового обновления"""
+
+import struct
+import zlib
+import pygame
+from typing import Optional
+
+import settings
+from assets import Assets
+from player import Player
+from global_game_objects import GlobalGameObjects
+from asteroids.asteroid import (
+    Asteroid,
+    AsteroidType,
+)
+from inputs import InputState
+from utils.object_pool import ObjectPool
+from collider.collide_resolver import CollideResolver
+from collider.collide_resolve_factory import CollideResolveFactory
+from levels.level import Level
+from levels.levels_manager import LevelsManager
+from generators.asteroids_generator import AsteroidsGenerator
+from generators.powerups_generator import PowerupsGenerator
+
+
+class Simulation:
+    """
+    Игровой мир.
+
+    Создает игровые объекты и обновляет их по шагам: генерирует астероиды
+    и усиления, решает столкновения и двигает объекты. Ничего не рисует,
+    поэтому одинаково работает и с окном, и без него.
+    """
+
+    def __init__(self, seed: Optional[int] = settings.RANDOM_SEED) -> None:
+        """
+        Инициализатор класса.
+
+        :param seed:
+            Зерно потоков случайных чисел игрового мира. None - выбирается
+            случайно.
+        """
+
+        assets = Assets()
+
+        # Создаем типы астероидов. На основе этих объектов генератор
+        # астероидов будет генерировать астероиды.
+        asteroid_types = [
+            AsteroidType(
+                min_max_radius=(10, 20),
+                min_max_speed=(380, 480),
+                skins=assets.asteroid_skins['tiny'],
+            ),
+            AsteroidType(
+                min_max_radius=(21, 30),
+                min_max_speed=(340, 430),
+                skins=assets.asteroid_skins['small'],
+            ),
+            AsteroidType(
+                min_max_radius=(31, 40),
+                min_max_speed=(280, 360),
+                skins=assets.asteroid_skins['medium'],
+            ),
+            AsteroidType(
+                min_max_radius=(41, 70),
+                min_max_speed=(250, 310),
+                skins=assets.asteroid_skins['large'],
+            ),
+        ]
+
+        # Инициализируем единственный экземпляр класса игровых объектов.
+        # Этот класс служит глобальной точкой получения общих игровых
+        # объектов по типу групп спрайтов, экрана игры и прочего. Размер
+        # ячеек широкой фазы столкновений зависит от самого большого
+        # астероида.
+        game_objects = GlobalGameObjects(
+            max_object_radius=max(
+                asteroid_type.get_max_radius()
+                for asteroid_type in asteroid_types
+            ),
+        )
+        # Все случайные числа игры берутся из потоков с этим зерном.
+        game_objects.random.seed(seed)
+
+        # Хранилище кинематики астероидов, если оно включено в настройках.
+        asteroid_field = game_objects.asteroids_group.get_field() \
+            if settings.USE_ASTEROID_FIELD else None
+
+        # Создаем и настраиваем коллайдер.
+        # Коллайдер использует внутри себя фабрику решений, которая по
+        # типам столкнувшихся объектов выбирает нужное решение.
+        collide_resolver = CollideResolver(
+            collide_resolve_factory=CollideResolveFactory(),
+        )
+
+        # Создаем список уровней.
+        levels = [Level(score=100 * (i + 1)) for i in range(100)]
+
+        # Создаем менеджер уровней. Менеджер отвечает за контроль уровня
+        # игры и контролирует уровни зарегестрированных в нем игровых
+        # объектов по типу генераторов.
+        levels_manager = LevelsManager(levels=levels)
+
+        # Создаем генератор астероидов.
+        asteroid_generator = AsteroidsGenerator(
+            start_frequency=2500,
+            end_frequency=150,
+            asteroid_types=asteroid_types,
+            max_level=len(levels),
+        )
+        # Регистрируем генератор астероидов в менджере уровней.
+        levels_manager.register_object(asteroid_generator)
+
+        # Создаем генератор усилений.
+        powerups_generator = PowerupsGenerator(
+            start_frequency=10000,
+            end_frequency=4000,
+            max_level=len(levels),
+        )
+        levels_manager.register_object(powerups_generator)
+
+        # Создаем игрока.
+        player = Player(
+            skin=assets.player_skin,
+            bullet_skin=assets.bullet_skin,
+            health=200, speed=2.7, damage=22,
+            radius=25, shoot_delay=420, score=0,
+            camera=game_objects.camera,
+        )
+        game_objects.players_group.add(player)
+        # Регистрируем игрока в менджере активных усилений.
+        game_objects.active_powerups_manager.register_player(player)
+
+        self.__game_objects = game_objects
+        self.__asteroid_field = asteroid_field
+        self.__collide_resolver = collide_resolver
+        self.__levels_manager = levels_manager
+        self.__asteroid_generator = asteroid_generator
+        self.__powerups_generator = powerups_generator
+        self.__player = player
+
+    def step(self, input_state: InputState) -> None:
+        """
+        Один шаг обновления игрового мира.
+
+        :param input_state: Состояние ввода игрока на этом шаге.
+        """
+
+        game_objects = self.__game_objects
+        asteroid_field = self.__asteroid_field
+        collide_resolver = self.__collide_resolver
+        levels_manager = self.__levels_manager
+        asteroid_generator = self.__asteroid_generator
+        powerups_generator = self.__powerups_generator
+        player = self.__player
+
+        # Время симуляции обновляется один раз за шаг.
+        game_objects.clock.tick()
+
+        # Проверяем, нужно ли повышать уровень игры.
+        if levels_manager.level_complete(player.score):
+            levels_manager.level_up()
+
+        # Контролируем работу активных усилений на игрока.
+        game_objects.active_powerups_manager.control_powerups()
+
+        # Генерируем новый астероид.
+        new_asteroid = asteroid_generator.generate()
+        if new_asteroid is not None:
+            game_objects.asteroids_group.add(new_asteroid)
+            game_objects.broadphase.update(new_asteroid)
+
+        # Генерируем новое усиление.
+        new_powerup = powerups_generator.generate()
+        if new_powerup is not None:
+            game_objects.powerups_group.add(new_powerup)
+            game_objects.broadphase.update(new_powerup)
+
+        # Стрельба игрока.
+        new_player_bullet = player.shoot(input_state)
+        if new_player_bullet is not None:
+            pygame.mixer.Channel(0).play(Assets().shoot_sound)
+            game_objects.bullets_group.add(new_player_bullet)
+            game_objects.broadphase.update(new_player_bullet)
+
+        # Удаляем из широкой фазы объекты, уничтоженные с конца прошлого
+        # шага (например, истекшие усиления).
+        for obj in game_objects.broadphase.get_objects():
+            if not obj.alive():
+                game_objects.broadphase.remove(obj)
+
+        # Решение коллизий.
+        # Перебираем пары объектов из секций, где больше 1 элемента, и
+        # проверяем на наличие коллизий. Если есть - решаем их. Каждая пара
+        # проверяется только один раз, даже если объекты вместе лежат в
+        # нескольких секциях.
+        # Если кинематика астероидов хранится в массивах, столкновения
+        # астероидов друг с другом собираются и решаются одним пакетом.
+        # Пакет решается перед любой другой парой, которая задевает его
+        # астероиды, поэтому каждый астероид проходит свои пары в том же
+        # порядке, что и без пакета.
+        asteroid_pairs = []
+        batched_asteroids = set()
+        for obj_1, obj_2 in game_objects.broadphase.iter_candidate_pairs():
+            if asteroid_field is not None \
+                    and type(obj_1) is Asteroid and type(obj_2) is Asteroid \
+                    and obj_1.get_field_index() >= 0 \
+                    and obj_2.get_field_index() >= 0:
+                asteroid_pairs.append((obj_1, obj_2))
+                batched_asteroids.add(obj_1)
+                batched_asteroids.add(obj_2)
+                continue
+
+            if obj_1 in batched_asteroids or obj_2 in batched_asteroids:
+                asteroid_field.resolve_collisions(asteroid_pairs)
+                asteroid_pairs = []
+                batched_asteroids.clear()
+            collide_resolver.resolve(obj_1, obj_2)
+        if asteroid_pairs:
+            asteroid_field.resolve_collisions(asteroid_pairs)
+
+        # Обновляем все спрайты.
+        game_objects.powerups_group.update()
+        game_objects.explosions_group.update()
+        game_objects.asteroids_group.update()
+        player.update(input_state)
+        game_objects.bullets_group.update()
+
+        # Синхронизируем широкую фазу с новыми положениями объектов. Она
+        # нужна и для поиска столкновений на следующем шаге, и для
+        # поиска видимых объектов при отрисовке.
+        # Удаляем из широкой фазы уничтоженные объекты (например,
+        # вылетевшие за границы мира).
+        for obj in game_objects.broadphase.get_objects():
+            if not obj.alive():
+                game_objects.broadphase.remove(obj)
+        # Обновляем в широкой фазе усиления. Новые объекты добавляются,
+        # а уже существующие переносятся в другие секции только тогда,
+        # когда пересекли их границы.
+        for powerup in game_objects.powerups_group:
+            game_objects.broadphase.update(powerup)
+        # Обновляем в широкой фазе астероиды.
+        for obj in game_objects.asteroids_group:
+            game_objects.broadphase.update(obj)
+        # Обновляем в широкой фазе игрока.
+        if player.health > 0:
+            game_objects.broadphase.update(player)
+        # Обновляем в широкой фазе снаряды игрока.
+        for bullet in game_objects.bullets_group:
+            game_objects.broadphase.update(bullet)
+
+        # Камера следует за игроком.
+        if player.health > 0:
+            game_objects.camera.follow(player.rect.center)
+
+        # Уничтоженные за шаг снаряды, взрывы и астероиды становятся
+        # доступны для повторного использования только после его
+        # завершения.
+        ObjectPool.recycle_all()
+
+    def get_player(self) -> Player:
+        """
+        Геттер игрока.
+
+        :return: Объект игрока.
+        """
+
+        return self.__player
+
+    def get_state_hash(self) -> int:
+        """
+        Хеширование состояния игрового мира.
+
+        В хеш входят время симуляции, уровень, состояние игрока и положения
+        всех объектов. Одинаковые миры дают одинаковые хеши, поэтому по
+        хешам можно найти шаг, на котором повтор игры разошелся с записью.
+
+        :return: Целое число, хеш состояния.
+        """
+
+        game_objects = self.__game_objects
+        player = self.__player
+
+        values = [
+            game_objects.clock.get_ticks(),
+            self.get_level(),
+            player.pos_x,
+            player.pos_y,
+            player.health,
+            player.score,
+        ]
+        for asteroid in game_objects.asteroids_group:
+            values += (asteroid.pos_x, asteroid.pos_y, asteroid.health)
+        for group in (
+                game_objects.bullets_group,
+                game_objects.powerups_group,
+                game_objects.explosions_group,
+        ):
+            for sprite in group:
+                values += sprite.rect.center
+
+        return zlib.crc32(struct.pack(f'<{len(values)}d', *values))
+
+    def get_seed(self) -> int:
+        """
+        Геттер зерна потоков случайных чисел.
+
+        :return: Целое число, зерно.
+        """
+
+        return self.__game_objects.random.get_seed()
+
+    def get_level(self) -> int:
+        """
+        Геттер текущего уровня игры.
+
+        :return: Целое число, номер уровня.
+        """
+
+        return self.__levels_manager.get_current_level()
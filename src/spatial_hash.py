@@ -0,0 +1,295 @@
+"""Модуль для работы с пространственным хешем"""
+
+import pygame
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+import settings
+from utils.geometry import (
+    Area,
+    Point,
+)
+from collider.collideable import Collideable
+from abstract_broadphase import AbstractBroadphase
+
+
+class SpatialHash(AbstractBroadphase):
+    """
+    Структура данных пространственного хеша.
+
+    Делит пространство на равномерную сетку квадратных ячеек. Подходит,
+    когда объекты примерно одного размера: каждый объект попадает в
+    несколько соседних ячеек, а поиск ячеек - это пара целочисленных делений.
+    """
+
+    class Cell:
+        """Ячейка пространственного хеша"""
+
+        def __init__(self, area: Area) -> None:
+            """
+            Инициализатор класса.
+
+            :param area: Секция ячейки.
+            """
+
+            self.__area = area
+            self.__data: List[Collideable] = []
+
+        def get_section(self) -> Area:
+            """
+            Геттер для получения объекта секции.
+
+            :return: Объект секции ячейки.
+            """
+
+            return self.__area
+
+        def get_data(self) -> List[Collideable]:
+            """
+            Геттер для получения данных об объектах в ячейке.
+
+            :return: Список объектов.
+            """
+
+            return self.__data
+
+        def set_data(self, new_data: List[Collideable]) -> None:
+            """
+            Сеттер для установки данных в ячейку.
+
+            :param new_data: Новые данные.
+            """
+
+            self.__data = new_data
+
+    def __init__(self, cell_size: int) -> None:
+        """
+        Инициализатор класса.
+
+        :param cell_size: Размер стороны ячейки в px.
+        """
+
+        assert cell_size > 0
+
+        self.__cell_size = cell_size
+        # Ключи словаря - координаты ячейки в сетке, значения - ячейки.
+        # Ячейки создаются при первом попадании в них объекта.
+        self.__cells: Dict[Tuple[int, int], 'SpatialHash.Cell'] = {}
+        # Словарь используется как упорядоченное множество коллизийных ячеек.
+        self.__collisions: Dict['SpatialHash.Cell', None] = {}
+        # Ключи словаря - объекты, значения - диапазон ячеек, в которых лежит
+        # объект, в виде (левая, верхняя, правая, нижняя).
+        self.__objects: Dict[Collideable, Tuple[int, int, int, int]] = {}
+
+    def get_cell_size(self) -> int:
+        """
+        Геттер размера ячейки.
+
+        :return: Размер стороны ячейки в px.
+        """
+
+        return self.__cell_size
+
+    def get_objects(self) -> List[Collideable]:
+        """
+        Геттер для получения всех объектов в хеше.
+
+        :return: Список объектов.
+        """
+
+        return list(self.__objects)
+
+    def get_collision_nodes(self) -> List[Cell]:
+        """
+        Получение списка ячеек с возможными коллизиями объектов.
+
+        :return:
+            Список ячеек, в которых объекты, вероятно, столкнуться.
+        """
+
+        return list(self.__collisions)
+
+    def clear(self) -> None:
+        """Отчистка хеша от всех объектов"""
+
+        self.__cells = {}
+        self.__collisions = {}
+        self.__objects = {}
+
+    def add(self, added_object: Collideable) -> None:
+        """
+        Добавление нового объекта в хеш.
+
+        Если объект уже есть в хеше, он перемещается.
+
+        :param added_object: Добавляемый объект.
+        """
+
+        if added_object in self.__objects:
+            self.update(added_object)
+            return
+
+        cells_range = self._get_cells_range(added_object)
+        self.__objects[added_object] = cells_range
+        for key in self._iter_keys(cells_range):
+            self._insert(key, added_object)
+
+    def update(self, updated_object: Collideable) -> None:
+        """
+        Обновление положения объекта в хеше.
+
+        Объект переносится только в те ячейки, в которые он вошел, и
+        удаляется только из тех, из которых вышел.
+
+        :param updated_object: Обновляемый объект.
+        """
+
+        old_range = self.__objects.get(updated_object)
+        if old_range is None:
+            self.add(updated_object)
+            return
+
+        new_range = self._get_cells_range(updated_object)
+        if new_range == old_range:
+            return
+
+        old_keys = set(self._iter_keys(old_range))
+        new_keys = set(self._iter_keys(new_range))
+        for key in old_keys - new_keys:
+            self._discard(key, updated_object)
+        for key in new_keys - old_keys:
+            self._insert(key, updated_object)
+        self.__objects[updated_object] = new_range
+
+    def remove(self, removed_object: Collideable) -> None:
+        """
+        Удаление объекта из хеша.
+
+        :param removed_object: Удаляемый объект.
+        """
+
+        cells_range = self.__objects.pop(removed_object, None)
+        if cells_range is None:
+            return
+
+        for key in self._iter_keys(cells_range):
+            self._discard(key, removed_object)
+
+    def query(self, rect: pygame.Rect) -> List[Collideable]:
+        """
+        Поиск объектов, которые лежат в ячейках, пересекающих прямоугольник.
+
+        Объекты отбираются по ячейкам, поэтому в результат могут попасть
+        объекты рядом с прямоугольником.
+
+        :param rect: Прямоугольник области поиска.
+        :return: Список объектов без повторов.
+        """
+
+        size = self.__cell_size
+        cells_range = rect.left // size, rect.top // size, \
+            (rect.right - 1) // size, (rect.bottom - 1) // size
+
+        found_objects: Dict[Collideable, None] = {}
+        for key in self._iter_keys(cells_range):
+            cell = self.__cells.get(key)
+            if cell is not None:
+                found_objects.update(dict.fromkeys(cell.get_data()))
+
+        return list(found_objects)
+
+    def draw(self, screen: pygame.Surface,
+             offset: Tuple[int, int] = (0, 0)) -> None:
+        """
+        Отрисовка занятых ячеек хеша на экран.
+
+        :param screen: Объект экрана, куда нужно отрисовывать ячейки.
+        :param offset: Смещение камеры, вычитаемое из координат ячеек.
+        """
+
+        for cell in self.__cells.values():
+            if cell.get_data():
+                section = cell.get_section()
+                pygame.draw.rect(
+                    screen,
+                    settings.Collors.YELLOW.value,
+                    (section.top_left.x - offset[0],
+                     section.top_left.y - offset[1],
+                     section.get_width(), section.get_height()),
+                    1,
+                )
+
+    def _get_cells_range(self, checked_object: Collideable) \
+            -> Tuple[int, int, int, int]:
+        """
+        Вычисление диапазона ячеек, которые покрывает объект.
+
+        :param checked_object: Проверяемый объект.
+        :return: Кортеж (левая, верхняя, правая, нижняя) координат ячеек.
+        """
+
+        rect = checked_object.get_bounding_rect()
+        size = self.__cell_size
+
+        return rect.left // size, rect.top // size, \
+            (rect.right - 1) // size, (rect.bottom - 1) // size
+
+    @staticmethod
+    def _iter_keys(cells_range: Tuple[int, int, int, int]):
+        """
+        Перебор координат ячеек в диапазоне.
+
+        :param cells_range: Кортеж (левая, верхняя, правая, нижняя).
+        :return: Генератор координат ячеек.
+        """
+
+        left, top, right, bottom = cells_range
+        for y in range(top, bottom + 1):
+            for x in range(left, right + 1):
+                yield x, y
+
+    def _insert(self, key: Tuple[int, int], added_object: Collideable) -> None:
+        """
+        Добавление объекта в ячейку.
+
+        :param key: Координаты ячейки.
+        :param added_object: Добавляемый объект.
+        """
+
+        cell = self.__cells.get(key)
+        if cell is None:
+            size = self.__cell_size
+            cell = SpatialHash.Cell(
+                area=Area(
+                    top_left=Point(key[0] * size, key[1] * size),
+                    bottom_right=Point((key[0] + 1) * size, (key[1] + 1) * size),
+                ),
+            )
+            self.__cells[key] = cell
+
+        cell.set_data(cell.get_data() + [added_object])
+        if len(cell.get_data()) > 1:
+            self.__collisions[cell] = None
+
+    def _discard(self, key: Tuple[int, int],
+                 removed_object: Collideable) -> None:
+        """
+        Удаление объекта из ячейки.
+
+        Данные заменяются новым списком, чтобы не ломать проходы по спискам,
+        полученным ранее через get_data().
+
+        :param key: Координаты ячейки.
+        :param removed_object: Удаляемый объект.
+        """
+
+        cell = self.__cells[key]
+        cell.set_data([
+            current_object for current_object in cell.get_data()
+            if current_object is not removed_object
+        ])
+        if len(cell.get_data()) < 2:
+            self.__collisions.pop(cell, None)
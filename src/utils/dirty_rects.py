@@ -0,0 +1,82 @@
+"""Модуль учета измененных областей экрана"""
+
+import pygame
+from typing import (
+    Iterable,
+    List,
+    Optional,
+)
+
+
+class DirtyRects:
+    """
+    Учет измененных областей экрана для отрисовки без полной перерисовки.
+
+    Запоминает все области, нарисованные поверх фона: спрайты, текст,
+    полоски здоровья и прочее. Области, нарисованные на прошлой итерации,
+    стираются фоном на текущей, а на экран выводятся и стертые, и
+    нарисованные области.
+    """
+
+    def __init__(self) -> None:
+        """Инициализатор класса"""
+
+        # Области, нарисованные на прошлой итерации и на текущей.
+        self.__previous: List[pygame.Rect] = []
+        self.__current: List[pygame.Rect] = []
+        # Флаг вывода на экран всего экрана целиком.
+        self.__invalidated = True
+
+    def add(self, rect: Optional[pygame.Rect]) -> None:
+        """
+        Добавление нарисованной области.
+
+        :param rect: Прямоугольник области. Пустые области пропускаются.
+        """
+
+        if rect:
+            self.__current.append(rect)
+
+    def extend(self, rects: Iterable[Optional[pygame.Rect]]) -> None:
+        """
+        Добавление нескольких нарисованных областей.
+
+        :param rects: Прямоугольники областей.
+        """
+
+        for rect in rects:
+            self.add(rect)
+
+    def invalidate(self) -> None:
+        """
+        Вывод на экран всего экрана на текущей итерации.
+
+        Нужен, когда фон перерисован целиком, например, при движении камеры.
+        """
+
+        self.__invalidated = True
+
+    def clear(self, screen: pygame.Surface,
+              background: pygame.Surface) -> None:
+        """
+        Стирание фоном областей, нарисованных на прошлой итерации.
+
+        :param screen: Экран, на котором нужно стереть области.
+        :param background: Фон размером с экран.
+        """
+
+        for rect in self.__previous:
+            screen.blit(background, rect, rect)
+
+    def present(self) -> None:
+        """
+        Вывод измененных областей на экран и переход к следующей итерации.
+        """
+
+        if self.__invalidated:
+            pygame.display.flip()
+            self.__invalidated = False
+        else:
+            pygame.display.update(self.__previous + self.__current)
+        self.__previous = self.__current
+        self.__current = []
@@ -1,6 +1,7 @@
 """Модуль классов для работы с геометрией"""
 
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass
@@ -65,3 +66,40 @@ class Area:
                and point.y >= self.top_left.y \
                and point.x <= self.bottom_right.x \
                and point.y <= self.bottom_right.y
+
+
+def segment_circle_intersect(
+        start: Tuple[float, float],
+        end: Tuple[float, float],
+        center: Tuple[float, float],
+        radius: float,
+) -> bool:
+    """
+    Проверка пересечения отрезка с кругом.
+
+    Ищем ближайшую к центру круга точку отрезка и сравниваем расстояние
+    до нее с радиусом.
+
+    :param start: Начало отрезка.
+    :param end: Конец отрезка.
+    :param center: Центр круга.
+    :param radius: Радиус круга.
+    :return: True, если отрезок пересекает круг, иначе False.
+    """
+
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    length_sq = dx * dx + dy * dy
+
+    # Проекция центра круга на отрезок, ограниченная его концами.
+    if length_sq == 0:
+        t = 0
+    else:
+        t = ((center[0] - start[0]) * dx + (center[1] - start[1]) * dy) \
+            / length_sq
+        t = max(0, min(1, t))
+
+    nearest_x = start[0] + t * dx - center[0]
+    nearest_y = start[1] + t * dy - center[1]
+
+    return nearest_x * nearest_x + nearest_y * nearest_y <= radius * radius
@@ -0,0 +1,227 @@
+"""Модуль пула объектов для повторного использования спрайтов"""
+
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+
+
+class ObjectPool:
+    """
+    Пул объектов.
+
+    Хранит уничтоженные объекты и отдает их повторно вместо создания новых.
+    Объекты, возвращенные в пул, становятся доступны не сразу, а только после
+    вызова recycle. Так объект, уничтоженный в середине итерации игрового
+    цикла, не будет переиспользован, пока на него еще ссылается код этой же
+    итерации.
+    """
+
+    # Ключи словаря - классы объектов, значения - их пулы.
+    __pools: Dict[type, 'ObjectPool'] = {}
+
+    def __init__(self, object_class: type, max_size: int) -> None:
+        """
+        Инициализатор класса.
+
+        :param object_class:
+            Класс объектов пула. Класс должен реализовывать метод reset с
+            теми же параметрами, что и у инициализатора.
+        :param max_size: Максимальное количество свободных объектов в пуле.
+        """
+
+        self.__object_class = object_class
+        self.__max_size = max_size
+        self.__free: List[Any] = []
+        self.__released: List[Any] = []
+        self.__hits = 0
+        self.__misses = 0
+
+    @classmethod
+    def get_pool(cls, object_class: type, max_size: int) -> 'ObjectPool':
+        """
+        Получение пула для класса объектов.
+
+        Пул создается при первом обращении.
+
+        :param object_class: Класс объектов пула.
+        :param max_size: Максимальное количество свободных объектов в пуле.
+        :return: Объект пула.
+        """
+
+        pool = cls.__pools.get(object_class)
+        if pool is None:
+            pool = cls(object_class=object_class, max_size=max_size)
+            cls.__pools[object_class] = pool
+
+        return pool
+
+    @classmethod
+    def get_pools(cls) -> Dict[type, 'ObjectPool']:
+        """
+        Геттер для получения всех созданных пулов.
+
+        :return: Словарь, ключи которого - классы объектов, значения - пулы.
+        """
+
+        return dict(cls.__pools)
+
+    @classmethod
+    def recycle_all(cls) -> None:
+        """Перенос возвращенных объектов в свободные во всех пулах"""
+
+        for pool in cls.__pools.values():
+            pool.recycle()
+
+    def acquire(self, *args, **kwargs) -> Any:
+        """
+        Получение объекта из пула.
+
+        Если в пуле есть свободный объект, он сбрасывается методом reset,
+        иначе создается новый объект.
+
+        :return: Объект класса пула.
+        """
+
+        if self.__free:
+            self.__hits += 1
+            obj = self.__free.pop()
+            obj.reset(*args, **kwargs)
+            return obj
+
+        self.__misses += 1
+        return self.__object_class(*args, **kwargs)
+
+    def release(self, obj: Any) -> None:
+        """
+        Возврат объекта в пул.
+
+        :param obj: Возвращаемый объект.
+        """
+
+        self.__released.append(obj)
+
+    def recycle(self) -> None:
+        """
+        Перенос возвращенных объектов в свободные.
+
+        Вызывается в конце итерации игрового цикла. Объекты сверх
+        максимального размера пула отдаются сборщику мусора.
+        """
+
+        free_places = self.__max_size - len(self.__free)
+        if free_places > 0:
+            self.__free.extend(self.__released[:free_places])
+        self.__released = []
+
+    def get_hits(self) -> int:
+        """
+        Геттер количества объектов, отданных из пула повторно.
+
+        :return: Целое число, количество попаданий.
+        """
+
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Геттер количества объектов, созданных из-за пустого пула.
+
+        :return: Целое число, количество промахов.
+        """
+
+        return self.__misses
+
+    def get_free_count(self) -> int:
+        """
+        Геттер количества свободных объектов в пуле.
+
+        :return: Целое число, количество свободных объектов.
+        """
+
+        return len(self.__free)
+
+    def get_max_size(self) -> int:
+        """
+        Геттер максимального количества свободных объектов.
+
+        :return: Целое число, размер пула.
+        """
+
+        return self.__max_size
+
+
+class Poolable(ABC):
+    """
+    Абстрактный класс-примесь для спрайтов, которые переиспользуются через пул.
+
+    Должен стоять в списке базовых классов перед pygame.sprite.Sprite.
+    Уничтоженный через kill спрайт возвращается в пул своего класса.
+    Новые объекты нужно получать через acquire, а не через инициализатор.
+    """
+
+    # Максимальное количество свободных объектов в пуле класса.
+    _pool_size = 0
+    # Количество возвратов объекта в пул.
+    __generation = 0
+
+    @classmethod
+    def get_pool(cls) -> ObjectPool:
+        """
+        Геттер пула объектов класса.
+
+        :return: Объект пула.
+        """
+
+        return ObjectPool.get_pool(cls, cls._pool_size)
+
+    @classmethod
+    def acquire(cls, *args, **kwargs) -> Any:
+        """
+        Получение объекта класса из пула.
+
+        Параметры совпадают с параметрами инициализатора класса.
+
+        :return: Новый или переиспользованный объект.
+        """
+
+        return cls.get_pool().acquire(*args, **kwargs)
+
+    @abstractmethod
+    def reset(self, *args, **kwargs) -> None:
+        """
+        Сброс состояния объекта при повторном использовании.
+
+        Вызывается пулом вместо инициализатора. Параметры совпадают с
+        параметрами инициализатора класса, поэтому у наследников сигнатура
+        метода отличается от этой.
+        """
+
+        pass
+
+    def kill(self) -> None:
+        """Уничтожение спрайта с возвратом его в пул"""
+
+        # Повторный kill уже уничтоженного спрайта не должен вернуть его
+        # в пул второй раз.
+        if self.alive():
+            super(Poolable, self).kill()
+            self.__generation += 1
+            self.get_pool().release(self)
+
+    def get_generation(self) -> int:
+        """
+        Геттер поколения объекта.
+
+        Поколение увеличивается при каждом возврате объекта в пул, поэтому
+        по нему можно отличить переиспользованный объект от прежнего.
+
+        :return: Целое число, количество возвратов в пул.
+        """
+
+        return self.__generation
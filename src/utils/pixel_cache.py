@@ -0,0 +1,238 @@
+"""Модуль кеша декодированных изображений"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import pygame
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+
+class PixelCache:
+    """
+    Кеш пикселей изображений.
+
+    Файл кеша хранит пиксели изображений в несжатом виде, поэтому при
+    загрузке изображения не нужно декодировать PNG. Файл отображается в
+    память, и изображения строятся прямо поверх его байтов. Кроме исходных
+    изображений, в кеше могут лежать их масштабированные варианты.
+
+    Файл кеша хранит хеши исходных файлов. Если хоть один исходный файл
+    изменился или пропал, кеш считается устаревшим и не открывается.
+
+    Формат файла: сигнатура, длина заголовка, заголовок в JSON и пиксели
+    всех изображений подряд.
+    """
+
+    __signature = b'PXC1'
+    __length_format = '<I'
+
+    def __init__(self, buffer: mmap.mmap, header: Dict,
+                 data_offset: int) -> None:
+        """
+        Инициализатор класса.
+
+        Кеш открывается методом open.
+
+        :param buffer: Отображенный в память файл кеша.
+        :param header: Заголовок файла кеша.
+        :param data_offset: Смещение пикселей изображений в файле.
+        """
+
+        self.__buffer = buffer
+        self.__data_offset = data_offset
+        # Ключи словарей - имена изображений, значения - записи заголовка
+        # исходного изображения и его масштабированных вариантов.
+        self.__images: Dict[str, Dict] = {}
+        self.__variants: Dict[str, List[Dict]] = {}
+        for entry in header['entries']:
+            if entry['variant']:
+                self.__variants.setdefault(entry['name'], []).append(entry)
+            else:
+                self.__images[entry['name']] = entry
+
+    @classmethod
+    def open(cls, path: Path, base_dir: Path,
+             config: str) -> Optional['PixelCache']:
+        """
+        Открытие файла кеша.
+
+        :param path: Путь до файла кеша.
+        :param base_dir: Папка, относительно которой записаны исходные файлы.
+        :param config:
+            Строка настроек, с которыми собирался кеш. Кеш, собранный с
+            другими настройками, не открывается.
+        :return: Объект кеша или None, если файла нет или кеш устарел.
+        """
+
+        if not path.is_file():
+            return None
+
+        with open(path, 'rb') as file:
+            signature = file.read(len(cls.__signature))
+            if signature != cls.__signature:
+                return None
+            header_length, = struct.unpack(
+                cls.__length_format,
+                file.read(struct.calcsize(cls.__length_format)),
+            )
+            header = json.loads(file.read(header_length).decode('utf-8'))
+            data_offset = file.tell()
+
+            if header['config'] != config:
+                return None
+            for source, digest in header['sources'].items():
+                source_path = base_dir / source
+                if not source_path.is_file() \
+                        or cls._hash_file(source_path) != digest:
+                    return None
+
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(buffer, header, data_offset)
+
+    @classmethod
+    def build(
+            cls,
+            path: Path,
+            base_dir: Path,
+            config: str,
+            sources: Iterable[Path],
+            images: Iterable[Tuple[str, Optional[Tuple[int, int]],
+                                   pygame.Surface]],
+    ) -> None:
+        """
+        Сборка файла кеша.
+
+        :param path: Путь до файла кеша.
+        :param base_dir:
+            Папка, относительно которой записываются исходные файлы.
+        :param config: Строка настроек, с которыми собирается кеш.
+        :param sources: Исходные файлы, из которых загружены изображения.
+        :param images:
+            Имена изображений, размеры масштабированных вариантов (None -
+            исходное изображение) и сами изображения.
+        """
+
+        entries = []
+        chunks = []
+        offset = 0
+        for name, variant, surface in images:
+            pixel_format = 'RGBA' \
+                if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+            colorkey = surface.get_colorkey()
+            if colorkey is not None:
+                # При выгрузке пикселей прозрачный цвет портит альфа-канал,
+                # поэтому пиксели берутся у копии без прозрачного цвета.
+                surface = surface.copy()
+                surface.set_colorkey(None)
+            pixels = pygame.image.tobytes(surface, pixel_format)
+            entries.append({
+                'name': name,
+                'variant': list(variant) if variant is not None else None,
+                'size': list(surface.get_size()),
+                'format': pixel_format,
+                'colorkey': list(colorkey[:3])
+                if colorkey is not None else None,
+                'offset': offset,
+                'length': len(pixels),
+            })
+            chunks.append(pixels)
+            offset += len(pixels)
+
+        header = {
+            'config': config,
+            'sources': {
+                source.relative_to(base_dir).as_posix():
+                    cls._hash_file(source)
+                for source in sorted(set(sources))
+            },
+            'entries': entries,
+        }
+        header_bytes = json.dumps(header).encode('utf-8')
+
+        # Кеш сначала пишется во временный файл и только потом заменяет
+        # старый, поэтому уже открытый старый кеш остается целым.
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as file:
+            file.write(cls.__signature)
+            file.write(struct.pack(cls.__length_format, len(header_bytes)))
+            file.write(header_bytes)
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temp_path, path)
+
+    def get(self, name: str) -> Optional[pygame.Surface]:
+        """
+        Получение исходного изображения.
+
+        :param name: Имя изображения.
+        :return: Изображение или None, если его нет в кеше.
+        """
+
+        entry = self.__images.get(name)
+        if entry is None:
+            return None
+
+        return self._make_surface(entry)
+
+    def get_variants(self, name: str) \
+            -> List[Tuple[Tuple[int, int], pygame.Surface]]:
+        """
+        Получение масштабированных вариантов изображения.
+
+        :param name: Имя исходного изображения.
+        :return: Список размеров вариантов и самих вариантов.
+        """
+
+        return [
+            (tuple(entry['variant']), self._make_surface(entry))
+            for entry in self.__variants.get(name, [])
+        ]
+
+    def _make_surface(self, entry: Dict) -> pygame.Surface:
+        """
+        Создание изображения поверх байтов файла кеша.
+
+        Если окно уже создано, изображение переводится в формат экрана, и
+        пиксели копируются из файла.
+
+        :param entry: Запись заголовка изображения.
+        :return: Изображение.
+        """
+
+        start = self.__data_offset + entry['offset']
+        surface = pygame.image.frombuffer(
+            memoryview(self.__buffer)[start:start + entry['length']],
+            tuple(entry['size']),
+            entry['format'],
+        )
+        if pygame.display.get_surface() is not None:
+            if entry['format'] == 'RGBA':
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        if entry['colorkey'] is not None:
+            surface.set_colorkey(tuple(entry['colorkey']))
+
+        return surface
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """
+        Хеширование содержимого файла.
+
+        :param path: Путь до файла.
+        :return: Хеш файла в шестнадцатеричном виде.
+        """
+
+        with open(path, 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
@@ -0,0 +1,143 @@
+"""Модуль кеша повернутых изображений"""
+
+import pygame
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+import settings
+from utils.singleton import Singleton
+
+
+class RotationCache(metaclass=Singleton):
+    """
+    Кеш повернутых изображений.
+
+    Угол поворота квантуется на заданное количество шагов, и для каждого
+    изображения хранится лист из повернутых на эти шаги изображений и их
+    масок. Поворот спрайта становится поиском по индексу в листе.
+
+    Изображения из кеша общие для всех спрайтов, поэтому изменять их нельзя.
+    """
+
+    class Sheet:
+        """Лист повернутых изображений одного исходного изображения"""
+
+        def __init__(self, skin: pygame.Surface, steps: int) -> None:
+            """
+            Инициализатор класса.
+
+            :param skin: Исходное изображение.
+            :param steps: Количество шагов поворота.
+            """
+
+            # Ссылка на исходное изображение не дает освободить его и тем
+            # самым переиспользовать его id в ключе кеша.
+            self.skin = skin
+            self.surfaces: List[Optional[pygame.Surface]] = [None] * steps
+            self.masks: List[Optional[pygame.mask.Mask]] = [None] * steps
+
+    def __init__(self, steps: int = settings.ROTATION_STEPS) -> None:
+        """
+        Инициализатор класса.
+
+        :param steps: Количество шагов поворота на полный оборот.
+        """
+
+        assert steps > 0
+
+        self.__steps = steps
+        self.__step_angle = 360 / steps
+        # Ключи словаря - id исходных изображений, значения - их листы.
+        self.__sheets: Dict[int, 'RotationCache.Sheet'] = {}
+
+    def get_steps(self) -> int:
+        """
+        Геттер количества шагов поворота.
+
+        :return: Целое число, количество шагов на полный оборот.
+        """
+
+        return self.__steps
+
+    def get_step_index(self, angle: float) -> int:
+        """
+        Получение индекса шага поворота, ближайшего к углу.
+
+        :param angle: Угол поворота в градусах.
+        :return: Индекс шага поворота.
+        """
+
+        return round(angle / self.__step_angle) % self.__steps
+
+    def get_surface(self, skin: pygame.Surface,
+                    step_index: int) -> pygame.Surface:
+        """
+        Получение повернутого изображения.
+
+        Изображение поворачивается при первом обращении.
+
+        :param skin: Исходное изображение.
+        :param step_index: Индекс шага поворота.
+        :return: Повернутое изображение.
+        """
+
+        sheet = self._get_sheet(skin)
+        surface = sheet.surfaces[step_index]
+        if surface is None:
+            surface = pygame.transform.rotate(
+                skin,
+                step_index * self.__step_angle,
+            )
+            # Игнорируем черный цвет и не отрисовываем его.
+            surface.set_colorkey(settings.Collors.BLACK.value)
+            sheet.surfaces[step_index] = surface
+
+        return surface
+
+    def get_mask(self, skin: pygame.Surface,
+                 step_index: int) -> pygame.mask.Mask:
+        """
+        Получение маски повернутого изображения.
+
+        :param skin: Исходное изображение.
+        :param step_index: Индекс шага поворота.
+        :return: Маска повернутого изображения.
+        """
+
+        sheet = self._get_sheet(skin)
+        mask = sheet.masks[step_index]
+        if mask is None:
+            mask = pygame.mask.from_surface(
+                self.get_surface(skin, step_index),
+            )
+            sheet.masks[step_index] = mask
+
+        return mask
+
+    def prerender(self, skin: pygame.Surface) -> None:
+        """
+        Поворот изображения на все шаги заранее.
+
+        :param skin: Исходное изображение.
+        """
+
+        for step_index in range(self.__steps):
+            self.get_mask(skin, step_index)
+
+    def _get_sheet(self, skin: pygame.Surface) -> 'RotationCache.Sheet':
+        """
+        Получение листа изображения, с созданием при его отсутствии.
+
+        :param skin: Исходное изображение.
+        :return: Лист повернутых изображений.
+        """
+
+        sheet = self.__sheets.get(id(skin))
+        if sheet is None:
+            sheet = RotationCache.Sheet(skin=skin, steps=self.__steps)
+            self.__sheets[id(skin)] = sheet
+
+        return sheet
@@ -0,0 +1,185 @@
+"""Модуль кеша масштабированных изображений"""
+
+import pygame
+from collections import OrderedDict
+from typing import (
+    Optional,
+    Tuple,
+)
+
+import settings
+from utils.singleton import Singleton
+
+
+class SurfaceCache(metaclass=Singleton):
+    """
+    Кеш масштабированных изображений.
+
+    Хранит изображения, масштабированные до нужного размера, и их маски.
+    Ключ кеша - исходное изображение и размер. Когда кеш заполнен, из него
+    удаляется изображение, которое дольше всех не запрашивалось.
+
+    Изображения из кеша общие для всех спрайтов, поэтому изменять их нельзя.
+    """
+
+    class Entry:
+        """Запись кеша"""
+
+        def __init__(self, skin: pygame.Surface,
+                     surface: pygame.Surface) -> None:
+            """
+            Инициализатор класса.
+
+            :param skin: Исходное изображение.
+            :param surface: Масштабированное изображение.
+            """
+
+            # Ссылка на исходное изображение не дает освободить его, пока
+            # запись есть в кеше, и тем самым переиспользовать его id в ключе.
+            self.skin = skin
+            self.surface = surface
+            self.mask: Optional[pygame.mask.Mask] = None
+
+    def __init__(self, max_size: int = settings.SURFACE_CACHE_SIZE) -> None:
+        """
+        Инициализатор класса.
+
+        :param max_size: Максимальное количество изображений в кеше.
+        """
+
+        assert max_size > 0
+
+        self.__max_size = max_size
+        self.__entries: 'OrderedDict[Tuple[int, int, int], SurfaceCache.Entry]' \
+            = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def get_surface(self, skin: pygame.Surface,
+                    size: Tuple[float, float]) -> pygame.Surface:
+        """
+        Получение масштабированного изображения.
+
+        Черный цвет изображения становится прозрачным.
+
+        :param skin: Исходное изображение.
+        :param size: Ширина и высота изображения в px.
+        :return: Масштабированное изображение.
+        """
+
+        return self._get_entry(skin, size).surface
+
+    def get_mask(self, skin: pygame.Surface,
+                 size: Tuple[float, float]) -> pygame.mask.Mask:
+        """
+        Получение маски масштабированного изображения.
+
+        Маска создается при первом обращении.
+
+        :param skin: Исходное изображение.
+        :param size: Ширина и высота изображения в px.
+        :return: Маска изображения.
+        """
+
+        entry = self._get_entry(skin, size)
+        if entry.mask is None:
+            entry.mask = pygame.mask.from_surface(entry.surface)
+
+        return entry.mask
+
+    def put(self, skin: pygame.Surface, size: Tuple[float, float],
+            surface: pygame.Surface) -> None:
+        """
+        Добавление заранее масштабированного изображения.
+
+        :param skin: Исходное изображение.
+        :param size: Ширина и высота изображения в px.
+        :param surface: Изображение, масштабированное методом scale.
+        """
+
+        key = (id(skin), int(size[0]), int(size[1]))
+        self.__entries[key] = SurfaceCache.Entry(skin=skin, surface=surface)
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Отчистка кеша"""
+
+        self.__entries.clear()
+
+    def get_hits(self) -> int:
+        """
+        Геттер количества запросов, найденных в кеше.
+
+        :return: Целое число, количество попаданий.
+        """
+
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Геттер количества запросов, для которых изображение масштабировалось.
+
+        :return: Целое число, количество промахов.
+        """
+
+        return self.__misses
+
+    def get_size(self) -> int:
+        """
+        Геттер количества изображений в кеше.
+
+        :return: Целое число, количество изображений.
+        """
+
+        return len(self.__entries)
+
+    def _get_entry(self, skin: pygame.Surface,
+                   size: Tuple[float, float]) -> 'SurfaceCache.Entry':
+        """
+        Получение записи кеша, с созданием при ее отсутствии.
+
+        :param skin: Исходное изображение.
+        :param size: Ширина и высота изображения в px.
+        :return: Запись кеша.
+        """
+
+        width, height = int(size[0]), int(size[1])
+        key = (id(skin), width, height)
+
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return entry
+
+        self.__misses += 1
+        entry = SurfaceCache.Entry(
+            skin=skin,
+            surface=self.scale(skin, (width, height)),
+        )
+        self.__entries[key] = entry
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+        return entry
+
+    @staticmethod
+    def scale(skin: pygame.Surface,
+              size: Tuple[int, int]) -> pygame.Surface:
+        """
+        Масштабирование изображения.
+
+        Черный цвет изображения становится прозрачным.
+
+        :param skin: Исходное изображение.
+        :param size: Ширина и высота изображения в px.
+        :return: Масштабированное изображение.
+        """
+
+        surface = pygame.transform.scale(skin, size)
+        # Игнорируем черный цвет и не отрисовываем его.
+        surface.set_colorkey(settings.Collors.BLACK.value)
+
+        return surface
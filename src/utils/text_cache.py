@@ -0,0 +1,107 @@
+"""Модуль кеша отрисованного текста"""
+
+import pygame
+from collections import OrderedDict
+from typing import (
+    Tuple,
+)
+
+import settings
+from utils.singleton import Singleton
+
+
+class TextCache(metaclass=Singleton):
+    """
+    Кеш отрисованного текста.
+
+    Хранит изображения строк, отрисованных шрифтом. Ключ кеша - шрифт,
+    текст и цвет. Неизменившиеся надписи (счет, уровень, здоровье) берутся
+    из кеша без повторной отрисовки шрифтом. Когда кеш заполнен, из него
+    удаляется надпись, которая дольше всех не запрашивалась.
+
+    Изображения из кеша общие, поэтому изменять их нельзя.
+    """
+
+    def __init__(self, max_size: int = settings.TEXT_CACHE_SIZE) -> None:
+        """
+        Инициализатор класса.
+
+        :param max_size: Максимальное количество надписей в кеше.
+        """
+
+        assert max_size > 0
+
+        self.__max_size = max_size
+        # Значения - шрифт и изображение надписи. Ссылка на шрифт не дает
+        # освободить его и тем самым переиспользовать его id в ключе.
+        self.__entries: 'OrderedDict[Tuple, Tuple[pygame.font.Font, ' \
+                        'pygame.Surface]]' = OrderedDict()
+        self.__hits = 0
+        self.__misses = 0
+
+    def render(
+            self,
+            font: pygame.font.Font,
+            text: str,
+            antialias: bool,
+            color: Tuple[int, int, int],
+    ) -> pygame.Surface:
+        """
+        Получение изображения надписи.
+
+        Параметры, кроме шрифта, совпадают с параметрами
+        pygame.font.Font.render.
+
+        :param font: Шрифт надписи.
+        :param text: Текст надписи.
+        :param antialias: Сглаживание текста.
+        :param color: Цвет текста.
+        :return: Изображение надписи.
+        """
+
+        key = (id(font), text, antialias, color)
+        entry = self.__entries.get(key)
+        if entry is not None:
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return entry[1]
+
+        self.__misses += 1
+        surface = font.render(text, antialias, color)
+        self.__entries[key] = (font, surface)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
+
+        return surface
+
+    def clear(self) -> None:
+        """Отчистка кеша"""
+
+        self.__entries.clear()
+
+    def get_hits(self) -> int:
+        """
+        Геттер количества надписей, найденных в кеше.
+
+        :return: Целое число, количество попаданий.
+        """
+
+        return self.__hits
+
+    def get_misses(self) -> int:
+        """
+        Геттер количества надписей, отрисованных шрифтом.
+
+        :return: Целое число, количество промахов.
+        """
+
+        return self.__misses
+
+    def get_size(self) -> int:
+        """
+        Геттер количества надписей в кеше.
+
+        :return: Целое число, количество надписей.
+        """
+
+        return len(self.__entries)
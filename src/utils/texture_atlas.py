@@ -0,0 +1,111 @@
+"""Модуль загрузки изображений из текстурного атласа"""
+
+import pygame
+import xml.etree.ElementTree as ElementTree
+from pathlib import Path
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
+
+
+class TextureAtlas:
+    """
+    Текстурный атлас.
+
+    Атлас - это одно изображение со всеми спрайтами и файл с координатами
+    каждого спрайта в нем. Атлас читается один раз, а спрайты отдаются как
+    подповерхности общего изображения, поэтому пиксели всех спрайтов лежат
+    в одной поверхности.
+
+    Если атласа нет или в нем нет нужного спрайта, спрайт загружается из
+    отдельного файла.
+    """
+
+    def __init__(self, xml_path: Optional[Path]) -> None:
+        """
+        Инициализатор класса.
+
+        :param xml_path:
+            Путь до файла с координатами спрайтов. Путь до изображения атласа
+            берется из этого файла. None - все спрайты загружаются из
+            отдельных файлов.
+        """
+
+        self.__sheet: Optional[pygame.Surface] = None
+        # Файлы, из которых прочитан атлас.
+        self.__sources: List[Path] = []
+        # Ключи словаря - имена спрайтов, значения - их области в атласе.
+        self.__regions: Dict[str, pygame.Rect] = {}
+
+        if xml_path is None or not xml_path.is_file():
+            return
+
+        root = ElementTree.parse(xml_path).getroot()
+        image_path = xml_path.parent / root.get('imagePath')
+        if not image_path.is_file():
+            return
+
+        for sub_texture in root.iter('SubTexture'):
+            self.__regions[sub_texture.get('name')] = pygame.Rect(
+                int(sub_texture.get('x')),
+                int(sub_texture.get('y')),
+                int(sub_texture.get('width')),
+                int(sub_texture.get('height')),
+            )
+        self.__sheet = self._convert(pygame.image.load(image_path))
+        self.__sources = [xml_path, image_path]
+
+    def has(self, name: str) -> bool:
+        """
+        Проверка наличия спрайта в атласе.
+
+        :param name: Имя файла спрайта, например 'laserBlue01.png'.
+        :return: True, если спрайт есть в атласе, иначе False.
+        """
+
+        return self.__sheet is not None and name in self.__regions
+
+    def load(self, fallback_path: Path) -> pygame.Surface:
+        """
+        Загрузка спрайта.
+
+        Спрайт ищется в атласе по имени файла. Если его там нет, он
+        загружается из файла.
+
+        :param fallback_path: Путь до отдельного файла спрайта.
+        :return: Изображение спрайта.
+        """
+
+        name = fallback_path.name
+        if self.has(name):
+            return self.__sheet.subsurface(self.__regions[name])
+
+        return self._convert(pygame.image.load(fallback_path))
+
+    def get_sources(self, fallback_path: Path) -> List[Path]:
+        """
+        Получение файлов, из которых загружается спрайт.
+
+        :param fallback_path: Путь до отдельного файла спрайта.
+        :return: Список путей до файлов атласа или до файла спрайта.
+        """
+
+        if self.has(fallback_path.name):
+            return list(self.__sources)
+
+        return [fallback_path]
+
+    @staticmethod
+    def _convert(surface: pygame.Surface) -> pygame.Surface:
+        """
+        Перевод изображения в формат экрана, если окно уже создано.
+
+        :param surface: Изображение.
+        :return: Изображение в формате экрана или исходное изображение.
+        """
+
+        if pygame.display.get_surface() is None:
+            return surface
+        return surface.convert_alpha()
@@ -0,0 +1,23 @@
+"""Общие настройки тестов"""
+
+import os
+import sys
+from pathlib import Path
+
+import pygame
+import pytest
+
+# Модули игры импортируются из папки src так же, как при запуске
+# main.py, а pygame работает без окна и звука.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+
+@pytest.fixture(scope='session', autouse=True)
+def pygame_init():
+    """Инициализация pygame на время всех тестов"""
+
+    pygame.init()
+    yield
+    pygame.quit()
@@ -0,0 +1,122 @@
+"""Тесты пакетного решения столкновений астероидов"""
+
+import math
+import random
+
+import pygame
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from asteroids.asteroid import Asteroid
+from asteroids.asteroid_field import (
+    AsteroidField,
+    AsteroidFieldGroup,
+)
+from collider.resolves.asteroid_collide_resolve import AsteroidCollideResolve
+
+
+def make_asteroids(seed: int, count: int = 60):
+    """
+    Создание плотного облака астероидов.
+
+    :param seed: Зерно генератора случайных чисел.
+    :param count: Количество астероидов.
+    :return: Список астероидов.
+    """
+
+    rng = random.Random(seed)
+    skin = pygame.Surface((8, 8))
+    return [
+        Asteroid(
+            skin=skin,
+            size=rng.randint(10, 40),
+            speed=rng.uniform(2, 5),
+            pos_x=rng.uniform(300, 700),
+            pos_y=rng.uniform(300, 700),
+            angle=rng.uniform(-math.pi, math.pi),
+        )
+        for _ in range(count)
+    ]
+
+
+def candidate_pairs(asteroids, seed: int):
+    """
+    Пары пересекающихся астероидов в случайном порядке.
+
+    :param asteroids: Список астероидов.
+    :param seed: Зерно порядка пар.
+    :return: Список пар номеров астероидов.
+    """
+
+    pairs = [
+        (i, j)
+        for i in range(len(asteroids))
+        for j in range(i + 1, len(asteroids))
+        if math.hypot(asteroids[i].pos_x - asteroids[j].pos_x,
+                      asteroids[i].pos_y - asteroids[j].pos_y)
+        < asteroids[i].radius + asteroids[j].radius
+    ]
+    random.Random(seed).shuffle(pairs)
+    return pairs
+
+
+def kinematics(asteroids):
+    """
+    Кинематика астероидов для сравнения.
+
+    :param asteroids: Список астероидов.
+    :return: Массив положений, скоростей и направлений астероидов.
+    """
+
+    return np.array([
+        (asteroid.pos_x, asteroid.pos_y, asteroid.speed,
+         math.sin(asteroid.angle), math.cos(asteroid.angle))
+        for asteroid in asteroids
+    ])
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_batch_matches_scalar_resolve(seed):
+    scalar = make_asteroids(seed)
+    batched = make_asteroids(seed)
+    scalar_group = pygame.sprite.Group(*scalar)
+    group = AsteroidFieldGroup(AsteroidField(capacity=8), *batched)
+    field = group.get_field()
+
+    for step in range(20):
+        pairs = candidate_pairs(scalar, seed * 100 + step)
+        assert pairs == candidate_pairs(batched, seed * 100 + step)
+
+        for i, j in pairs:
+            AsteroidCollideResolve.resolve(scalar[i], scalar[j])
+        field.resolve_collisions(
+            [(batched[i], batched[j]) for i, j in pairs],
+        )
+
+        # Углы сравниваются через синус и косинус, т.к. пакет и
+        # поочередное решение могут разойтись на полный оборот.
+        np.testing.assert_allclose(
+            kinematics(batched), kinematics(scalar), rtol=1e-9, atol=1e-6,
+        )
+
+        # Шаг движения. Астероиды, вылетевшие за мир, удаляются в обоих
+        # вариантах одинаково.
+        scalar_group.update()
+        group.update()
+        scalar = [asteroid for asteroid in scalar if asteroid.alive()]
+        batched = [asteroid for asteroid in batched if asteroid.alive()]
+        assert len(scalar) == len(batched)
+
+
+def test_pairs_with_removed_asteroid_are_skipped():
+    asteroids = make_asteroids(0, count=2)
+    asteroids[1].pos_x = asteroids[0].pos_x
+    asteroids[1].pos_y = asteroids[0].pos_y
+    group = AsteroidFieldGroup(AsteroidField(), *asteroids)
+    speed = asteroids[0].speed
+
+    asteroids[1].kill()
+    group.get_field().resolve_collisions([(asteroids[0], asteroids[1])])
+
+    assert asteroids[0].speed == speed
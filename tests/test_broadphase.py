@@ -0,0 +1,158 @@
+"""Тесты широкой фазы столкновений"""
+
+import itertools
+import random
+
+import pygame
+import pytest
+
+from collider.collideable import Collideable
+from quadtree import Quadtree
+from spatial_hash import SpatialHash
+from utils.geometry import (
+    Area,
+    Point,
+)
+
+WORLD_WIDTH = 1000
+WORLD_HEIGHT = 800
+
+
+class Box(Collideable):
+    """Сталкивающийся объект для тестов"""
+
+    def __init__(self, rect: pygame.Rect) -> None:
+        self.rect = rect
+
+
+def make_quadtree():
+    return Quadtree(
+        area=Area(
+            top_left=Point(0, 0),
+            bottom_right=Point(WORLD_WIDTH, WORLD_HEIGHT),
+        ),
+        search_accuracy=50,
+    )
+
+
+def make_spatial_hash():
+    return SpatialHash(cell_size=100)
+
+
+BROADPHASES = [make_quadtree, make_spatial_hash]
+
+
+def random_rect(rng: random.Random) -> pygame.Rect:
+    """
+    Случайный прямоугольник внутри мира.
+
+    :param rng: Генератор случайных чисел.
+    :return: Прямоугольник.
+    """
+
+    size = rng.randint(5, 80)
+    return pygame.Rect(
+        rng.randint(0, WORLD_WIDTH - size),
+        rng.randint(0, WORLD_HEIGHT - size),
+        size,
+        size,
+    )
+
+
+def node_pairs(broadphase):
+    """
+    Пары объектов из коллизийных секций.
+
+    :param broadphase: Широкая фаза.
+    :return: Множество неупорядоченных пар объектов.
+    """
+
+    return {
+        frozenset(pair)
+        for node in broadphase.get_collision_nodes()
+        for pair in itertools.combinations(node.get_data(), 2)
+    }
+
+
+def overlapping_pairs(objects):
+    """
+    Пары пересекающихся объектов, найденные перебором.
+
+    :param objects: Объекты.
+    :return: Множество неупорядоченных пар объектов.
+    """
+
+    return {
+        frozenset((obj_1, obj_2))
+        for obj_1, obj_2 in itertools.combinations(objects, 2)
+        if obj_1.rect.colliderect(obj_2.rect)
+    }
+
+
+def run_random_steps(broadphase, seed: int, steps: int = 30):
+    """
+    Случайное движение, добавление и удаление объектов.
+
+    После каждого шага проверяется, что широкая фаза хранит ровно живые
+    объекты и не теряет ни одной пары пересекающихся объектов.
+
+    :param broadphase: Широкая фаза.
+    :param seed: Зерно генератора случайных чисел.
+    :param steps: Количество шагов.
+    :return: Живые объекты после последнего шага.
+    """
+
+    rng = random.Random(seed)
+    objects = [Box(random_rect(rng)) for _ in range(80)]
+    for obj in objects:
+        broadphase.add(obj)
+
+    for _ in range(steps):
+        for obj in objects:
+            obj.rect.move_ip(rng.randint(-30, 30), rng.randint(-30, 30))
+            obj.rect.clamp_ip(pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT))
+            broadphase.update(obj)
+
+        for obj in rng.sample(objects, 5):
+            broadphase.remove(obj)
+            objects.remove(obj)
+        for _ in range(5):
+            obj = Box(random_rect(rng))
+            broadphase.add(obj)
+            objects.append(obj)
+
+        assert set(broadphase.get_objects()) == set(objects)
+        pairs = node_pairs(broadphase)
+        assert overlapping_pairs(objects) <= pairs
+        assert all(pair <= set(objects) for pair in pairs)
+
+    return objects
+
+
+@pytest.mark.parametrize('make_broadphase', BROADPHASES)
+@pytest.mark.parametrize('seed', range(3))
+def test_pairs_match_brute_force(make_broadphase, seed):
+    run_random_steps(make_broadphase(), seed)
+
+
+@pytest.mark.parametrize('make_broadphase', BROADPHASES)
+def test_removing_all_objects_empties_broadphase(make_broadphase):
+    broadphase = make_broadphase()
+    objects = run_random_steps(broadphase, seed=10, steps=5)
+
+    for obj in objects:
+        broadphase.remove(obj)
+
+    assert broadphase.get_objects() == []
+    assert node_pairs(broadphase) == set()
+
+
+@pytest.mark.parametrize('make_broadphase', BROADPHASES)
+def test_candidate_pairs_are_unique(make_broadphase):
+    broadphase = make_broadphase()
+    run_random_steps(broadphase, seed=20, steps=5)
+
+    pairs = [frozenset(pair) for pair in broadphase.iter_candidate_pairs()]
+
+    assert len(pairs) == len(set(pairs))
+    assert set(pairs) == node_pairs(broadphase)
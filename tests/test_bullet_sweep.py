@@ -0,0 +1,57 @@
+"""Тесты проверки пути снаряда против астероидов"""
+
+import pygame
+
+from bullets.bullet import Bullet
+from utils.geometry import segment_circle_intersect
+
+
+def test_segment_crossing_small_circle_hits():
+    # Оба конца отрезка далеко от круга, но отрезок проходит через него.
+    assert segment_circle_intersect((0, 0), (0, 100), (0, 50), 3)
+
+
+def test_segment_passing_by_circle_misses():
+    assert not segment_circle_intersect((0, 0), (0, 100), (10, 50), 3)
+
+
+def test_segment_stopping_short_of_circle_misses():
+    assert not segment_circle_intersect((0, 0), (0, 40), (0, 50), 3)
+
+
+def make_bullet() -> Bullet:
+    # Снаряд летит вверх из точки (500, 500).
+    return Bullet(
+        skin=pygame.Surface((15, 70)),
+        pos_x=500,
+        pos_y=500,
+        angle=0,
+        damage=1,
+    )
+
+
+def test_bullet_hits_asteroid_it_flew_over():
+    bullet = make_bullet()
+    tail_before = bullet.rect.bottom
+    bullet.update()
+
+    # Маленький астероид там, где снаряд был в начале шага, но где его
+    # уже нет в конце шага.
+    center = (500, (tail_before + bullet.rect.bottom) / 2)
+    radius = 2
+    asteroid_rect = pygame.Rect(0, 0, radius * 2, radius * 2)
+    asteroid_rect.center = center
+
+    assert not bullet.rect.colliderect(asteroid_rect)
+    assert segment_circle_intersect(*bullet.get_swept_segment(),
+                                    center, radius)
+
+
+def test_bullet_misses_asteroid_beside_its_path():
+    bullet = make_bullet()
+    bullet.update()
+
+    center = (500 + bullet.rect.width, bullet.rect.centery)
+
+    assert not segment_circle_intersect(*bullet.get_swept_segment(),
+                                        center, 2)
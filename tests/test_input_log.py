@@ -0,0 +1,89 @@
+"""Тесты двоичного журнала ввода игрока"""
+
+import pytest
+
+from inputs import (
+    InputLogReader,
+    InputLogWriter,
+    InputState,
+    ReplayInputSource,
+)
+
+STATES = [
+    InputState(mouse_pos=(0, 0)),
+    InputState(mouse_pos=(1279, 719), shooting=True),
+    InputState(mouse_pos=(-5, 30), left=True, up=True),
+    InputState(mouse_pos=(640, 360), shooting=True, right=True, down=True),
+]
+HASHES = [0, 1, 2 ** 32 - 1, 123456789]
+
+
+def write_log(path, record_hashes: bool) -> None:
+    """
+    Запись журнала с тестовыми шагами.
+
+    :param path: Путь до файла журнала.
+    :param record_hashes: Записывать хеши состояния мира.
+    """
+
+    writer = InputLogWriter(path, seed=-42, simulation_rate=60,
+                            record_hashes=record_hashes)
+    for state, state_hash in zip(STATES, HASHES):
+        writer.write(state, state_hash)
+    writer.close()
+
+
+def as_tuple(state: InputState):
+    return (state.mouse_pos, state.shooting, state.left, state.right,
+            state.up, state.down)
+
+
+@pytest.mark.parametrize('record_hashes', [True, False])
+def test_round_trip(tmp_path, record_hashes):
+    path = tmp_path / 'game.ail'
+    write_log(path, record_hashes)
+
+    log = InputLogReader(path)
+
+    assert log.get_seed() == -42
+    assert log.get_simulation_rate() == 60
+    assert log.has_hashes() == record_hashes
+    assert len(log) == len(STATES)
+    steps = list(log)
+    assert [as_tuple(state) for state, _ in steps] \
+        == [as_tuple(state) for state in STATES]
+    assert [state_hash for _, state_hash in steps] \
+        == (HASHES if record_hashes else [None] * len(STATES))
+
+
+def test_truncated_last_record_is_dropped(tmp_path):
+    path = tmp_path / 'game.ail'
+    write_log(path, record_hashes=True)
+    path.write_bytes(path.read_bytes()[:-3])
+
+    log = InputLogReader(path)
+
+    assert len(log) == len(STATES) - 1
+
+
+def test_bad_signature_raises(tmp_path):
+    path = tmp_path / 'game.ail'
+    path.write_bytes(b'NOPE' + bytes(32))
+
+    with pytest.raises(ValueError):
+        InputLogReader(path)
+
+
+def test_replay_reports_first_divergent_step(tmp_path):
+    path = tmp_path / 'game.ail'
+    write_log(path, record_hashes=True)
+    replay = ReplayInputSource(InputLogReader(path))
+
+    results = []
+    for state_hash in [0, 1, 999, 999]:
+        replay.poll()
+        results.append(replay.check(state_hash))
+
+    assert results == [True, True, False, False]
+    assert replay.get_divergence_tick() == 3
+    assert replay.is_finished()
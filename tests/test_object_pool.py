@@ -0,0 +1,64 @@
+"""Тесты пула объектов"""
+
+import pygame
+import pytest
+
+from utils.object_pool import (
+    ObjectPool,
+    Poolable,
+)
+
+
+class PooledSprite(Poolable, pygame.sprite.Sprite):
+    """Спрайт из пула для тестов"""
+
+    _pool_size = 4
+
+    def __init__(self, value: int) -> None:
+        pygame.sprite.Sprite.__init__(self)
+        self.reset(value)
+
+    def reset(self, value: int) -> None:
+        self.value = value
+
+
+def test_released_sprite_is_reused_after_recycle():
+    group = pygame.sprite.Group()
+    sprite = PooledSprite.acquire(1)
+    group.add(sprite)
+    generation = sprite.get_generation()
+
+    sprite.kill()
+    # До recycle объект не отдается повторно.
+    assert PooledSprite.acquire(2) is not sprite
+
+    ObjectPool.recycle_all()
+    reused = PooledSprite.acquire(3)
+
+    assert reused is sprite
+    assert reused.value == 3
+    assert reused.get_generation() == generation + 1
+
+
+def test_double_kill_releases_once():
+    group = pygame.sprite.Group()
+    sprite = PooledSprite.acquire(1)
+    group.add(sprite)
+    pool = PooledSprite.get_pool()
+    free_count = pool.get_free_count()
+    generation = sprite.get_generation()
+
+    sprite.kill()
+    sprite.kill()
+    assert sprite.get_generation() == generation + 1
+
+    ObjectPool.recycle_all()
+    assert pool.get_free_count() == free_count + 1
+
+
+def test_reset_is_required():
+    class NoReset(Poolable):
+        pass
+
+    with pytest.raises(TypeError):
+        NoReset()